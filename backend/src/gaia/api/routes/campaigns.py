@@ -1,6 +1,7 @@
 """Campaign management service for Gaia API."""
 
 import asyncio
+import dataclasses
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, ValidationError
 from fastapi import HTTPException
@@ -387,7 +388,8 @@ class CampaignService:
         if structured_dir.exists():
             counts["structured_entries"] = len(list(structured_dir.glob("*.json")))
         if turns_dir.exists():
-            counts["turn_files"] = len(list(turns_dir.glob("*.json")))
+            # Skip the _current.json pointer kept alongside the turns
+            counts["turn_files"] = sum(1 for p in turns_dir.glob("*.json") if not p.name.startswith("_"))
         if counts:
             file_info["file_counts"] = counts
 
@@ -674,7 +676,7 @@ class CampaignService:
                         )
                         .order_by(RoomSeat.slot_index)
                     )
-                    player_seats = list(db_session.execute(stmt).scalars().all())
+                    player_seats = db_session.execute(stmt).scalars().all()
 
                     # Map each created character to its corresponding seat by slot_index
                     for idx, (char_info, slot_id) in enumerate(created_characters):
@@ -855,7 +857,7 @@ class CampaignService:
                     'scene_type': arena_scene.scene_type,
                     'pcs_present': arena_scene.pcs_present,
                     'npcs_present': arena_scene.npcs_present,
-                    'participants': [p.model_dump() if hasattr(p, 'model_dump') else vars(p) for p in arena_scene.participants],
+                    'participants': [p.model_dump() if hasattr(p, 'model_dump') else dataclasses.asdict(p) for p in arena_scene.participants],
                 }
                 self.orchestrator.campaign_runner.scene_integration.current_scenes[campaign_id] = scene_summary
                 logger.info(f"Created arena scene: {arena_scene.scene_id} with {len(arena_scene.participants)} participants")
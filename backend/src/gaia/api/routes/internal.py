@@ -656,7 +656,7 @@ async def analyze_current_scene(
         campaign_manager = orchestrator.campaign_manager
         
         # Load campaign history to find last user input
-        history = campaign_manager.load_campaign_history(campaign_id)
+        history = campaign_manager.load_campaign_history(campaign_id, mutable=False)
         if not history:
             return {
                 "success": False,
@@ -737,7 +737,7 @@ async def get_current_campaign_status(
         campaign_manager = orchestrator.campaign_manager
         
         # Load campaign history
-        history = campaign_manager.load_campaign_history(campaign_id)
+        history = campaign_manager.load_campaign_history(campaign_id, mutable=False)
         if not history:
             return {
                 "success": False,
@@ -854,7 +854,7 @@ async def generate_complete_summary(
                 "summary": summary,
                 "model_used": model,
                 "saved_to": str(latest_file) if latest_file else None,
-                "total_messages": len(campaign_manager.load_campaign_history(campaign_id)),
+                "total_messages": len(campaign_manager.load_campaign_history(campaign_id, mutable=False)),
                 "characters_found": len(summary.get("characters", [])),
                 "locations_found": len(summary.get("locales", [])),
                 "events_found": len(summary.get("events", [])),
@@ -876,7 +876,7 @@ async def generate_complete_summary(
                 "summary": summary,
                 "model_used": model,
                 "saved_to": None,
-                "total_messages": len(campaign_manager.load_campaign_history(campaign_id)),
+                "total_messages": len(campaign_manager.load_campaign_history(campaign_id, mutable=False)),
                 "characters_found": len(summary.get("characters", [])),
                 "locations_found": len(summary.get("locales", [])),
                 "events_found": len(summary.get("events", [])),
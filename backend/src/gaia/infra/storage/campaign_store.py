@@ -37,6 +37,10 @@ class CampaignStore:
     def write_json(self, payload: Any, *relative_parts: str) -> bool:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def mirror_json(self, payload: Any, *relative_parts: str) -> bool:  # pragma: no cover - interface
+        """Write only to the remote mirror, for callers that already wrote locally."""
+        raise NotImplementedError
+
     def list_json_prefix(self, *relative_parts: str) -> list[str]:  # pragma: no cover - interface
         raise NotImplementedError
 
@@ -53,6 +57,11 @@ class CampaignStore:
     def enabled(self) -> bool:  # pragma: no cover - interface
         raise NotImplementedError
 
+    @property
+    def mirror_enabled(self) -> bool:  # pragma: no cover - interface
+        """Whether mirror_json writes anywhere (a remote mirror is configured)."""
+        raise NotImplementedError
+
 
 @dataclass
 class LocalCampaignStore(CampaignStore):
@@ -64,6 +73,10 @@ class LocalCampaignStore(CampaignStore):
     def enabled(self) -> bool:
         return True
 
+    @property
+    def mirror_enabled(self) -> bool:
+        return False
+
     # ---------------- internal helpers ---------------- #
     def _resolve(self, *parts: str, for_write: bool = False) -> Optional[Path]:
         if not parts:
@@ -111,11 +124,18 @@ class LocalCampaignStore(CampaignStore):
             logger.warning("LocalCampaignStore write_json failed for %s: %s", path, exc)
             return False
 
+    def mirror_json(self, payload: Any, *relative_parts: str) -> bool:
+        # Nothing to mirror to
+        return False
+
     def list_json_prefix(self, *relative_parts: str) -> list[str]:
         if relative_parts and relative_parts[0] == "metadata":
             names: list[str] = []
             try:
-                for session_id, _, _ in self.storage.iter_session_dirs():
+                for session_id, session_dir, _ in self.storage.iter_session_dirs():
+                    # Hidden directories are not sessions (e.g. campaigns pending deletion)
+                    if session_dir.name.startswith("."):
+                        continue
                     meta_path = self.storage.metadata_path(session_id)
                     if meta_path and meta_path.exists():
                         names.append(f"{session_id}.json")
@@ -181,6 +201,10 @@ class GCSCampaignStore(CampaignStore):
     def enabled(self) -> bool:
         return bool(getattr(self._obj, "enabled", False))
 
+    @property
+    def mirror_enabled(self) -> bool:
+        return self.enabled
+
     def read_json(self, *relative_parts: str) -> Optional[Any]:
         if not self.enabled:
             return None
@@ -191,6 +215,9 @@ class GCSCampaignStore(CampaignStore):
             return False
         return self._obj.write_json(payload, *relative_parts)
 
+    def mirror_json(self, payload: Any, *relative_parts: str) -> bool:
+        return self.write_json(payload, *relative_parts)
+
     def list_json_prefix(self, *relative_parts: str) -> list[str]:
         if not self.enabled:
             return []
@@ -228,6 +255,10 @@ class HybridCampaignStore(CampaignStore):
         # Always enabled (at least local)
         return True
 
+    @property
+    def mirror_enabled(self) -> bool:
+        return self._gcs.enabled
+
     def read_json(self, *relative_parts: str) -> Optional[Any]:
         payload = self._local.read_json(*relative_parts)
         if payload is not None:
@@ -246,6 +277,11 @@ class HybridCampaignStore(CampaignStore):
                 logger.warning("HybridCampaignStore: GCS mirror write failed for %s: %s", "/".join(relative_parts), exc)
         return ok
 
+    def mirror_json(self, payload: Any, *relative_parts: str) -> bool:
+        if not self._gcs.enabled:
+            return False
+        return self._gcs.write_json(payload, *relative_parts)
+
     def list_json_prefix(self, *relative_parts: str) -> list[str]:
         names: set[str] = set(self._local.list_json_prefix(*relative_parts))
         if self._gcs.enabled:
@@ -1,39 +1,258 @@
 """Enhanced scene manager for storing and retrieving SceneInfo objects.
 
-Supports dual storage backends:
+Supports three storage backends:
 - filesystem: Legacy JSON file storage (for backwards compatibility)
+- filesystem_log: Append-only scene log with an offset index (SceneLogStore)
 - database: PostgreSQL via SceneRepository (preferred for new campaigns)
 
 Storage mode is determined by campaign's scene_storage_mode setting.
 """
 
-import json
+import functools
+import heapq
+import itertools
+import mmap
 import os
+import time
 import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 import logging
 
+import orjson
+
 from gaia.models.scene_info import SceneInfo
 from gaia.mechanics.campaign.simple_campaign_manager import SimpleCampaignManager
+from gaia.infra.storage.scene_log_store import SceneLogStore
 from gaia.infra.storage.scene_repository import SceneRepository
 
 logger = logging.getLogger(__name__)
 
+# fsync scene files before the atomic rename (durability over throughput)
+_SCENE_FSYNC = os.getenv('SCENE_FSYNC', 'false').lower() == 'true'
+
+# Scene files are compact JSON; GAIA_PRETTY_JSON=1 indents them for manual inspection
+_SCENE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+if os.getenv('GAIA_PRETTY_JSON', 'false').lower() in ('1', 'true'):
+    _SCENE_JSON_OPTIONS |= orjson.OPT_INDENT_2
+
+# Scene cache bounds: max entries (LRU eviction) and optional TTL in seconds (0 disables)
+_SCENE_CACHE_MAX = int(os.getenv('SCENE_CACHE_MAX', '256'))
+_SCENE_CACHE_TTL = float(os.getenv('SCENE_CACHE_TTL', '0'))
+
+# Recent scenes loaded into the cache when a database-backed manager starts
+_SCENE_PREWARM_LIMIT = 16
+
+# Newest scene IDs remembered per manager to answer get_recent_scenes without a query.
+# Filesystem modes revalidate against the scenes directory / log; the database has no
+# cheap validator, so there the ring is trusted for SCENE_RECENT_TTL seconds.
+_RECENT_RING_SIZE = 16
+_RECENT_RING_DB_TTL = float(os.getenv('SCENE_RECENT_TTL', '5'))
+
+# Scene files at least this large are parsed straight from a memory map
+_SCENE_MMAP_THRESHOLD = 1024 * 1024
+
+# Character ID prefixes stripped when deriving a friendly NPC name
+_CHARACTER_ID_PREFIXES = ("npc:", "npc_profile:", "pc:")
+
+# Filesystem mtimes are coarse-grained; allow this much skew when comparing to scene timestamps
+_MTIME_SLACK_SECONDS = 2.0
+
+# Shared worker threads that overlap scene file reads; small batches are loaded inline
+_LOADER_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('SCENE_LOADER_THREADS', '4')),
+    thread_name_prefix="scene-loader",
+)
+_LOADER_INLINE_MAX = 2
+
+
+def _file_signature(stat_result: os.stat_result) -> Tuple[int, int]:
+    """Return the (mtime_ns, size) pair used to validate cached scene files."""
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _write_scene_file(
+    filepath: str,
+    scene_data: Dict[str, Any],
+    exclusive: bool = False,
+) -> Tuple[int, int]:
+    """Atomically write a scene file.
+
+    The payload is written to a sibling ``.tmp`` file and moved into place
+    with ``os.replace`` so readers never observe a partially written scene.
+    Exclusive writes publish the file with ``os.link`` instead, which fails
+    atomically if the scene file already exists. On filesystems without hard
+    links they fall back to creating the file with ``O_EXCL`` and writing it
+    in place.
+
+    Args:
+        filepath: Final path of the scene file
+        scene_data: Serializable scene dictionary
+        exclusive: Refuse to overwrite an existing scene file
+
+    Returns:
+        File signature of the written scene file
+
+    Raises:
+        FileExistsError: If exclusive is set and the scene file exists
+    """
+    payload = orjson.dumps(scene_data, option=_SCENE_JSON_OPTIONS)
+    tmp_path = f"{filepath}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            if _SCENE_FSYNC:
+                os.fsync(f.fileno())
+            signature = _file_signature(os.fstat(f.fileno()))
+        if exclusive:
+            try:
+                os.link(tmp_path, filepath)
+            except FileExistsError:
+                raise
+            except OSError:
+                # No hard links here (e.g. FUSE object-store or SMB mounts)
+                signature = _create_scene_file_exclusive(filepath, payload)
+            os.unlink(tmp_path)
+        else:
+            os.replace(tmp_path, filepath)
+        return signature
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _create_scene_file_exclusive(filepath: str, payload: bytes) -> Tuple[int, int]:
+    """Create a scene file with O_EXCL and write it in place.
+
+    Returns:
+        File signature of the written scene file
+
+    Raises:
+        FileExistsError: If the scene file exists
+    """
+    fd = os.open(filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            if _SCENE_FSYNC:
+                os.fsync(f.fileno())
+            return _file_signature(os.fstat(f.fileno()))
+    except BaseException:
+        # Do not leave a partial scene behind under the final name
+        try:
+            os.unlink(filepath)
+        except OSError:
+            pass
+        raise
+
+
+def _load_scene_file(filepath: str) -> Tuple[SceneInfo, Tuple[int, int]]:
+    """Load a scene file written by _write_scene_file.
+
+    Args:
+        filepath: Path of the scene file
+
+    Returns:
+        SceneInfo parsed from the file (storage metadata removed) and the
+        file signature it was read at
+    """
+    with open(filepath, 'rb') as f:
+        signature = _file_signature(os.fstat(f.fileno()))
+        if signature[1] >= _SCENE_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    scene_data = orjson.loads(view)
+                finally:
+                    view.release()
+        else:
+            scene_data = orjson.loads(f.read())
+
+    return _scene_from_record(scene_data), signature
+
+
+def _scene_from_record(scene_data: Dict[str, Any]) -> SceneInfo:
+    """Build a SceneInfo from a stored scene dictionary, dropping storage metadata."""
+    scene_data.pop("_metadata", None)
+    return SceneInfo.from_dict(scene_data)
+
+
+def _try_load_scene_file(filepath: str) -> Optional[SceneInfo]:
+    """Load a scene file, logging and returning None if it cannot be read."""
+    try:
+        scene_info, _ = _load_scene_file(filepath)
+        return scene_info
+    except Exception as e:
+        logger.warning("Error loading scene from %s: %s", filepath, e)
+        return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _friendly_npc_name(identifier: str) -> str:
+    """Derive a readable name from a character identifier (e.g. "npc:old_tom" -> "Old Tom")."""
+    if not identifier:
+        return "Unknown NPC"
+    value = identifier
+    if value.lower().startswith(_CHARACTER_ID_PREFIXES):
+        value = value.split(":", 1)[1]
+    cleaned = value.replace("_", " ").strip()
+    return cleaned.title() if cleaned else "Unknown NPC"
+
+
+def _scene_context_lines(index: int, scene: SceneInfo) -> Iterator[str]:
+    """Yield the agent context lines for one scene, skipping empty fields.
+
+    Args:
+        index: 1-based position of the scene in the context
+        scene: Scene to describe
+
+    Yields:
+        Formatted context lines
+    """
+    yield f"\n--- Scene {index} ({scene.scene_type}) ---"
+    yield f"Title: {scene.title}"
+
+    location_text = None
+    if getattr(scene, "metadata", None):
+        loc_meta = scene.metadata.get("location")
+        if isinstance(loc_meta, dict):
+            location_text = loc_meta.get("description") or loc_meta.get("id")
+        elif isinstance(loc_meta, str):
+            location_text = loc_meta
+    if location_text:
+        yield f"Location: {location_text}"
+    if scene.description:
+        yield f"Description: {scene.description}"
+    if scene.objectives:
+        yield f"Objectives: {', '.join(scene.objectives)}"
+    if scene.npcs_involved:
+        yield f"NPCs: {', '.join(scene.npcs_involved)}"
+    if scene.outcomes:
+        yield f"Outcomes: {', '.join(scene.outcomes)}"
 
 class EnhancedSceneManager:
     """Manager for storing and retrieving SceneInfo objects with proper persistence.
 
-    Supports dual storage backends controlled by campaign's scene_storage_mode:
+    Supports storage backends controlled by campaign's scene_storage_mode:
     - "filesystem": Legacy JSON file storage (default for existing campaigns)
+    - "filesystem_log": Single append-only scenes.ndjson log in the scenes directory
     - "database": PostgreSQL via SceneRepository (default for new campaigns)
     """
 
-    def __init__(self, campaign_id: str = "default"):
+    def __init__(self, campaign_id: str = "default", prewarm: bool = True):
         """Initialize the enhanced scene manager.
 
         Args:
             campaign_id: Campaign identifier
+            prewarm: Load the most recent scenes into the cache (database storage only;
+                also disabled by SCENE_CACHE_PREWARM=0)
         """
         self.campaign_id = campaign_id
         self.environment_name = os.getenv('ENVIRONMENT_NAME', 'default')
@@ -52,7 +271,7 @@ class EnhancedSceneManager:
                 if campaign_uuid_str:
                     self._campaign_uuid = uuid.UUID(campaign_uuid_str)
         except Exception as e:
-            logger.debug(f"Could not load campaign data: {e}")
+            logger.debug("Could not load campaign data: %s", e)
 
         # Determine storage mode
         if self._campaign_data:
@@ -65,7 +284,7 @@ class EnhancedSceneManager:
         self._repository: Optional[SceneRepository] = None
         if self._storage_mode == "database":
             self._repository = SceneRepository()
-            logger.info(f"🎭 Using database storage for campaign: {campaign_id}")
+            logger.info("🎭 Using database storage for campaign: %s", campaign_id)
 
         # Always set up filesystem path for fallback and legacy support
         data_path = self._campaign_manager.get_campaign_data_path(campaign_id)
@@ -90,10 +309,49 @@ class EnhancedSceneManager:
         if self._storage_mode == "filesystem":
             os.makedirs(self.scenes_dir, exist_ok=True)
 
-        # Cache for recently accessed scenes
-        self._scene_cache: Dict[str, SceneInfo] = {}
+        # Log-structured storage replaces the per-scene files for the filesystem paths
+        self._log_store: Optional[SceneLogStore] = None
+        if self._storage_mode == "filesystem_log":
+            self._log_store = SceneLogStore(self.scenes_dir, fsync=_SCENE_FSYNC)
+
+        # Number of stored scenes, used to number generated scene IDs
+        self._scene_count = self._count_scene_files()
+
+        # LRU cache for recently accessed scenes: scene_id -> (cached_at, file signature, SceneInfo).
+        # Scenes read from or written to disk carry the file signature they match.
+        self._scene_cache: "OrderedDict[str, Tuple[float, Optional[Tuple[int, int]], SceneInfo]]" = OrderedDict()
 
-        logger.info(f"🎭 Enhanced Scene Manager initialized for campaign: {campaign_id} (storage: {self._storage_mode})")
+        # Summaries of cached scenes: scene_id -> (scene, last_updated, summary)
+        self._summary_cache: Dict[str, Tuple[SceneInfo, Optional[datetime], Dict[str, Any]]] = {}
+
+        # Newest-first (epoch seconds, scene_id) pairs; the first _recent_ring_depth entries
+        # are known to be the campaign's newest scenes as of _recent_ring_stamp. Epoch seconds
+        # let naive (local) and timezone-aware scene timestamps be ordered against each other.
+        self._recent_ring: Deque[Tuple[float, str]] = deque(maxlen=_RECENT_RING_SIZE)
+        self._recent_ring_depth = 0
+        self._recent_ring_stamp: Any = None
+
+        if prewarm and os.getenv('SCENE_CACHE_PREWARM', '1') != '0':
+            self._prewarm_cache()
+
+        logger.info("🎭 Enhanced Scene Manager initialized for campaign: %s (storage: %s)", campaign_id, self._storage_mode)
+
+    def _prewarm_cache(self) -> None:
+        """Load the campaign's most recent scenes into the cache with one query."""
+        if not (self._storage_mode == "database" and self._repository and self._campaign_uuid):
+            return
+
+        try:
+            scenes = self._repository.get_recent_scenes_sync(self._campaign_uuid, _SCENE_PREWARM_LIMIT)
+        except Exception as e:
+            logger.debug("Could not prewarm scene cache: %s", e)
+            return
+
+        # Insert oldest first so the newest scenes are the most recently used
+        for scene_info in reversed(scenes):
+            self._cache_put(scene_info.scene_id, scene_info)
+        if scenes:
+            self._seed_recent_ring(scenes, _SCENE_PREWARM_LIMIT, time.monotonic())
 
     def create_scene(self, scene_info: SceneInfo) -> str:
         """Create and store a new scene. This should only be used for new scenes.
@@ -107,7 +365,7 @@ class EnhancedSceneManager:
         Raises:
             ValueError: If scene already exists
         """
-        logger.info(f"📝 create_scene called for {scene_info.scene_id} (storage_mode={self._storage_mode})")
+        logger.info("📝 create_scene called for %s (storage_mode=%s)", scene_info.scene_id, self._storage_mode)
 
         # Ensure scene has an ID
         if not scene_info.scene_id:
@@ -115,11 +373,14 @@ class EnhancedSceneManager:
 
         # Use database storage if configured (using sync methods to avoid event loop issues)
         if self._storage_mode == "database" and self._repository and self._campaign_uuid:
-            logger.info(f"📝 Attempting database create for scene {scene_info.scene_id}, campaign_uuid={self._campaign_uuid}")
+            logger.info("📝 Attempting database create for scene %s, campaign_uuid=%s", scene_info.scene_id, self._campaign_uuid)
             try:
+                ring_valid = self._recent_ring_valid()
                 scene_id = self._repository.create_scene_sync(scene_info, self._campaign_uuid)
-                self._scene_cache[scene_info.scene_id] = scene_info
-                logger.info(f"✅ Created scene {scene_id} in database")
+                self._scene_count += 1
+                self._cache_put(scene_info.scene_id, scene_info)
+                self._note_recent_write(scene_info, ring_valid)
+                logger.info("✅ Created scene %s in database", scene_id)
                 return scene_id
             except ValueError:
                 raise
@@ -127,10 +388,10 @@ class EnhancedSceneManager:
                 logger.error(f"❌ Database create failed, falling back to filesystem: {e}", exc_info=True)
                 # Fall through to filesystem storage
         else:
-            logger.info(f"📝 Skipping database (mode={self._storage_mode}, repo={self._repository is not None}, uuid={self._campaign_uuid})")
+            logger.info("📝 Skipping database (mode=%s, repo=%s, uuid=%s)", self._storage_mode, self._repository is not None, self._campaign_uuid)
 
         # Filesystem storage (legacy or fallback)
-        logger.info(f"📝 Creating scene {scene_info.scene_id} in filesystem")
+        logger.info("📝 Creating scene %s in filesystem", scene_info.scene_id)
         return self._create_scene_filesystem(scene_info)
 
     def _create_scene_filesystem(self, scene_info: SceneInfo) -> str:
@@ -148,28 +409,12 @@ class EnhancedSceneManager:
         # Ensure directory exists
         os.makedirs(self.scenes_dir, exist_ok=True)
 
-        # Check if scene already exists
-        existing_path = os.path.join(self.scenes_dir, f"{scene_info.scene_id}.json")
-        if os.path.exists(existing_path):
+        # Exclusive create: two concurrent creates cannot both succeed
+        try:
+            self._store_scene_internal(scene_info, exclusive=True)
+        except FileExistsError:
             raise ValueError(f"Scene {scene_info.scene_id} already exists. Use update_scene for modifications.")
-
-        # Convert to dict for storage
-        scene_data = scene_info.to_dict()
-
-        # Add metadata
-        scene_data["_metadata"] = {
-            "version": "1.0",
-            "stored_at": datetime.now().isoformat(),
-            "campaign_id": self.campaign_id
-        }
-
-        # Store to file
-        filepath = os.path.join(self.scenes_dir, f"{scene_info.scene_id}.json")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(scene_data, f, indent=2, ensure_ascii=False)
-
-        # Update cache
-        self._scene_cache[scene_info.scene_id] = scene_info
+        self._scene_count += 1
 
         return scene_info.scene_id
 
@@ -210,61 +455,40 @@ class EnhancedSceneManager:
         filtered_updates = {k: v for k, v in updates.items() if k in allowed_fields}
 
         if not filtered_updates:
-            logger.warning(f"No valid update fields provided for scene {scene_id}")
+            logger.warning("No valid update fields provided for scene %s", scene_id)
             return False
 
         # Try database update first if configured (using sync methods to avoid event loop issues)
         if self._storage_mode == "database" and self._repository:
             try:
-                # Handle npcs_added/npcs_present specially - use add_participant instead
+                # Handle npcs_added/npcs_present specially - added NPCs become SceneEntity records
                 db_updates = dict(filtered_updates)
-                npcs_to_add = db_updates.pop('npcs_added', None)
-                npcs_present = db_updates.pop('npcs_present', None)
+                npcs_to_add = db_updates.pop('npcs_added', None) or []
+                db_updates.pop('npcs_present', None)
                 display_names = db_updates.pop('npc_display_names', {}) or {}
                 metadata_updates = db_updates.pop('metadata', {}) or {}
                 scene_metadata = db_updates.pop('scene_metadata', {}) or {}
 
-                if display_names or metadata_updates or scene_metadata:
-                    # merge display names into metadata blob for persistence
-                    merged_metadata = {}
-                    # Try cache for existing metadata to avoid dropping keys
-                    cached_scene = self._scene_cache.get(scene_id)
-                    if not merged_metadata and cached_scene and getattr(cached_scene, "metadata", None):
-                        merged_metadata.update(cached_scene.metadata)
-                    if scene_metadata:
-                        merged_metadata.update(scene_metadata)
-                    if metadata_updates:
-                        merged_metadata.update(metadata_updates)
-                    if display_names:
-                        existing_map = merged_metadata.get('npc_display_names', {}) or {}
-                        existing_map.update(display_names)
-                        merged_metadata['npc_display_names'] = existing_map
-                    if merged_metadata:
-                        db_updates['scene_metadata'] = merged_metadata
-
-                # Add participants via SceneEntity records
-                if npcs_to_add:
-                    for character_id in npcs_to_add:
-                        display_name = display_names.get(character_id, character_id)
-                        self._repository.add_participant_sync(
-                            scene_id=scene_id,
-                            character_id=character_id,
-                            display_name=display_name,
-                            role="dm_controlled_npc",
-                            is_original=False,
-                        )
-                    logger.info(f"Added {len(npcs_to_add)} participants to scene {scene_id} via SceneEntity")
-
-                # If there are remaining updates, apply them
-                if db_updates:
-                    result = self._repository.update_scene_sync(scene_id, db_updates)
-                    if not result:
-                        # Scene not found in DB, try filesystem
-                        return self._update_scene_filesystem(scene_id, filtered_updates)
+                # Column updates, metadata merge and participant upserts go out as one statement;
+                # metadata is merged on the database side so only the delta is sent and no keys are lost
+                participants = [
+                    (character_id, display_names.get(character_id, character_id), "dm_controlled_npc", False)
+                    for character_id in npcs_to_add
+                ]
+                applied = self._repository.apply_scene_update_sync(
+                    scene_id,
+                    db_updates,
+                    participants=participants,
+                    metadata_delta={**scene_metadata, **metadata_updates},
+                    display_names=display_names,
+                )
+                if not applied:
+                    # Scene not found in DB, try filesystem
+                    return self._update_scene_filesystem(scene_id, filtered_updates)
 
                 # Invalidate cache
-                self._scene_cache.pop(scene_id, None)
-                logger.info(f"Updated scene {scene_id} in database")
+                self._cache_pop(scene_id)
+                logger.info("Updated scene %s in database", scene_id)
                 return True
             except ValueError:
                 raise
@@ -287,7 +511,7 @@ class EnhancedSceneManager:
         # Get existing scene
         scene = self.get_scene(scene_id)
         if not scene:
-            logger.warning(f"Cannot update - scene not found: {scene_id}")
+            logger.warning("Cannot update - scene not found: %s", scene_id)
             return False
 
         # Apply updates
@@ -331,29 +555,35 @@ class EnhancedSceneManager:
 
         return True
 
-    def _store_scene_internal(self, scene_info: SceneInfo) -> None:
+    def _store_scene_internal(self, scene_info: SceneInfo, exclusive: bool = False) -> None:
         """Internal method to store a scene without creation checks.
 
         Args:
             scene_info: SceneInfo object to store
+            exclusive: Fail with FileExistsError instead of overwriting an existing scene
         """
-        # Convert to dict for storage
+        # to_dict() builds a fresh dict, so the storage metadata is attached in place
         scene_data = scene_info.to_dict()
-
-        # Add metadata
         scene_data["_metadata"] = {
             "version": "1.0",
             "stored_at": datetime.now().isoformat(),
             "campaign_id": self.campaign_id
         }
 
-        # Store to file
-        filepath = os.path.join(self.scenes_dir, f"{scene_info.scene_id}.json")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(scene_data, f, indent=2, ensure_ascii=False)
+        ring_valid = self._recent_ring_valid()
+
+        if self._log_store is not None:
+            self._log_store.put(scene_info.scene_id, scene_data, exclusive=exclusive)
+            self._cache_put(scene_info.scene_id, scene_info)
+        else:
+            # Store to file
+            filepath = self._scene_path(scene_info.scene_id)
+            signature = _write_scene_file(filepath, scene_data, exclusive=exclusive)
+
+            # Update cache
+            self._cache_put(scene_info.scene_id, scene_info, signature)
 
-        # Update cache
-        self._scene_cache[scene_info.scene_id] = scene_info
+        self._note_recent_write(scene_info, ring_valid)
 
     def add_participant(
         self,
@@ -381,7 +611,7 @@ class EnhancedSceneManager:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"🎭 add_participant called: {character_id} -> scene {scene_id} (storage_mode={self._storage_mode})")
+        logger.info("🎭 add_participant called: %s -> scene %s (storage_mode=%s)", character_id, scene_id, self._storage_mode)
 
         # Use database method if configured
         if self._storage_mode == "database" and self._repository:
@@ -395,8 +625,8 @@ class EnhancedSceneManager:
                 )
                 if result:
                     # Invalidate cache so next get_scene fetches fresh data
-                    self._scene_cache.pop(scene_id, None)
-                    logger.info(f"✅ Added participant {character_id} to scene {scene_id} in database")
+                    self._cache_pop(scene_id)
+                    logger.info("✅ Added participant %s to scene %s in database", character_id, scene_id)
                     return True
                 # Scene not found in DB, try filesystem fallback
             except Exception as e:
@@ -414,7 +644,7 @@ class EnhancedSceneManager:
         """Add participant using filesystem storage (legacy method)."""
         scene = self.get_scene(scene_id)
         if not scene:
-            logger.warning(f"Cannot add participant - scene not found: {scene_id}")
+            logger.warning("Cannot add participant - scene not found: %s", scene_id)
             return False
 
         # Update npcs_added if not already present
@@ -434,7 +664,7 @@ class EnhancedSceneManager:
         scene.last_updated = datetime.now()
         self._store_scene_internal(scene)
 
-        logger.info(f"✅ Added participant {character_id} to scene {scene_id} in filesystem")
+        logger.info("✅ Added participant %s to scene %s in filesystem", character_id, scene_id)
         return True
 
     def get_scene(self, scene_id: str) -> Optional[SceneInfo]:
@@ -447,19 +677,20 @@ class EnhancedSceneManager:
             SceneInfo object or None if not found
         """
         # Check cache first
-        if scene_id in self._scene_cache:
-            return self._scene_cache[scene_id]
+        cached_scene = self._cache_get(scene_id)
+        if cached_scene is not None:
+            return cached_scene
 
         # Try database first if configured (using sync methods to avoid event loop issues)
         if self._storage_mode == "database" and self._repository:
             try:
                 scene_info = self._repository.get_scene_sync(scene_id)
                 if scene_info:
-                    self._scene_cache[scene_id] = scene_info
+                    self._cache_put(scene_id, scene_info)
                     return scene_info
                 # Not found in DB, try filesystem as fallback
             except Exception as e:
-                logger.debug(f"Database get failed, trying filesystem: {e}")
+                logger.debug("Database get failed, trying filesystem: %s", e)
 
         # Filesystem fallback
         return self._get_scene_filesystem(scene_id)
@@ -473,27 +704,20 @@ class EnhancedSceneManager:
         Returns:
             SceneInfo object or None if not found
         """
-        filepath = os.path.join(self.scenes_dir, f"{scene_id}.json")
-
-        if not os.path.exists(filepath):
-            logger.warning(f"Scene not found: {scene_id}")
-            return None
+        if self._log_store is not None:
+            return self._get_scene_log(scene_id)
 
         try:
-            with open(filepath, 'r') as f:
-                scene_data = json.load(f)
-
-            # Remove metadata before creating SceneInfo
-            scene_data.pop("_metadata", None)
-
-            # Create SceneInfo object
-            scene_info = SceneInfo.from_dict(scene_data)
+            scene_info, signature = _load_scene_file(self._scene_path(scene_id))
 
             # Update cache
-            self._scene_cache[scene_id] = scene_info
+            self._cache_put(scene_id, scene_info, signature)
 
             return scene_info
 
+        except FileNotFoundError:
+            logger.warning("Scene not found: %s", scene_id)
+            return None
         except Exception as e:
             logger.error(f"Error loading scene {scene_id}: {e}")
             return None
@@ -501,24 +725,45 @@ class EnhancedSceneManager:
     def get_recent_scenes(self, limit: int = 5) -> List[SceneInfo]:
         """Get the most recent scenes.
 
+        Answers from this manager's ring of newest scene IDs when it is still
+        valid. With database storage the ring cannot be revalidated cheaply, so
+        it is trusted for SCENE_RECENT_TTL seconds (default 5): scenes written
+        through another manager instance may be missing from the result until
+        then.
+
         Args:
             limit: Maximum number of scenes to return
 
         Returns:
             List of SceneInfo objects, most recent first
         """
+        if 0 < limit <= self._recent_ring_depth and self._recent_ring_valid():
+            scenes = [
+                self.get_scene(scene_id)
+                for _, scene_id in itertools.islice(self._recent_ring, limit)
+            ]
+            if all(scenes):
+                return scenes
+
+        stamp = self._recent_ring_current_stamp()
+
         # Try database first if configured (using sync methods to avoid event loop issues)
         if self._storage_mode == "database" and self._repository and self._campaign_uuid:
             try:
                 scenes = self._repository.get_recent_scenes_sync(self._campaign_uuid, limit)
                 if scenes:
+                    for scene_info in reversed(scenes):
+                        self._cache_put(scene_info.scene_id, scene_info)
+                    self._seed_recent_ring(scenes, limit, stamp)
                     return scenes
                 # Empty result, try filesystem as fallback
             except Exception as e:
-                logger.debug(f"Database get_recent_scenes failed, trying filesystem: {e}")
+                logger.debug("Database get_recent_scenes failed, trying filesystem: %s", e)
 
         # Filesystem fallback
-        return self._get_recent_scenes_filesystem(limit)
+        scenes = self._get_recent_scenes_filesystem(limit)
+        self._seed_recent_ring(scenes, limit, stamp)
+        return scenes
 
     def _get_recent_scenes_filesystem(self, limit: int = 5) -> List[SceneInfo]:
         """Get recent scenes from filesystem storage.
@@ -529,31 +774,58 @@ class EnhancedSceneManager:
         Returns:
             List of SceneInfo objects, most recent first
         """
+        if limit <= 0:
+            return []
+
+        if self._log_store is not None:
+            try:
+                return [_scene_from_record(record) for record in self._log_store.recent(limit)]
+            except Exception as e:
+                logger.error(f"Error retrieving recent scenes from scene log: {e}")
+                return []
+
         scenes = []
 
         try:
             if not os.path.exists(self.scenes_dir):
                 return []
 
-            # Load all scenes
-            for filename in os.listdir(self.scenes_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.scenes_dir, filename)
-
-                    try:
-                        with open(filepath, 'r') as f:
-                            scene_data = json.load(f)
-
-                        # Remove metadata
-                        scene_data.pop("_metadata", None)
-
-                        # Create SceneInfo object
-                        scene_info = SceneInfo.from_dict(scene_data)
-                        scenes.append(scene_info)
+            # Stat entries in one directory pass and order them newest-modified first
+            with os.scandir(self.scenes_dir) as entries:
+                candidates = [
+                    (-entry.stat().st_mtime, entry.name, entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.json')
+                ]
+            heapq.heapify(candidates)
+
+            # Min-heap of the `limit` newest scene timestamps seen so far
+            newest: List[float] = []
+
+            while candidates:
+                # A file is never last modified before its scene's timestamp, so once the
+                # remaining files are older than the limit-th newest scene we can stop.
+                batch = []
+                while candidates and len(batch) < limit:
+                    if len(newest) >= limit and -candidates[0][0] + _MTIME_SLACK_SECONDS < newest[0]:
+                        candidates = []
+                        break
+                    batch.append(heapq.heappop(candidates)[2])
+                if not batch:
+                    break
+
+                if len(batch) <= _LOADER_INLINE_MAX:
+                    loaded = [_try_load_scene_file(filepath) for filepath in batch]
+                else:
+                    loaded = list(_LOADER_POOL.map(_try_load_scene_file, batch))
 
-                    except Exception as e:
-                        logger.warning(f"Error loading scene from {filepath}: {e}")
+                for scene_info in loaded:
+                    if scene_info is None:
                         continue
+                    scenes.append(scene_info)
+                    heapq.heappush(newest, scene_info.timestamp.timestamp())
+                    if len(newest) > limit:
+                        heapq.heappop(newest)
 
             # Sort by timestamp (most recent first) - use scene_id as tiebreaker
             scenes.sort(key=lambda x: (x.timestamp, x.scene_id), reverse=True)
@@ -579,34 +851,12 @@ class EnhancedSceneManager:
         if not recent_scenes:
             return "No previous scenes available."
 
-        context_parts = ["**Recent Scene Context:**\n"]
-
-        for i, scene in enumerate(recent_scenes, 1):
-            context_parts.append(f"\n--- Scene {i} ({scene.scene_type}) ---")
-            context_parts.append(f"Title: {scene.title}")
-            location_text = None
-            if getattr(scene, "metadata", None):
-                loc_meta = scene.metadata.get("location")
-                if isinstance(loc_meta, dict):
-                    location_text = loc_meta.get("description") or loc_meta.get("id")
-                elif isinstance(loc_meta, str):
-                    location_text = loc_meta
-            if location_text:
-                context_parts.append(f"Location: {location_text}")
-
-            if scene.description:
-                context_parts.append(f"Description: {scene.description}")
-
-            if scene.objectives:
-                context_parts.append(f"Objectives: {', '.join(scene.objectives)}")
-
-            if scene.npcs_involved:
-                context_parts.append(f"NPCs: {', '.join(scene.npcs_involved)}")
-
-            if scene.outcomes:
-                context_parts.append(f"Outcomes: {', '.join(scene.outcomes)}")
-
-        return "\n".join(context_parts)
+        chunks = ["**Recent Scene Context:**\n"]
+        chunks.extend(
+            "\n".join(_scene_context_lines(i, scene))
+            for i, scene in enumerate(recent_scenes, 1)
+        )
+        return "\n".join(chunks)
 
     def get_scene_summary(self, scene_id: str) -> Dict[str, Any]:
         """Get a summary of a scene for structured data.
@@ -622,17 +872,23 @@ class EnhancedSceneManager:
         if not scene:
             return {"error": f"Scene {scene_id} not found"}
 
+        # Reuse the summary while the scene object is unchanged
+        cached = self._summary_cache.get(scene_id)
+        if cached and cached[0] is scene and cached[1] == scene.last_updated:
+            return dict(cached[2])
+
         # Compute dynamic NPC presence if not explicitly set
         npcs_present = []
         try:
             if hasattr(scene, 'npcs_present') and scene.npcs_present:
                 npcs_present = list(dict.fromkeys(scene.npcs_present))
             else:
-                base = list(getattr(scene, 'npcs_involved', []) or [])
-                added = list(getattr(scene, 'npcs_added', []) or [])
-                removed = set(getattr(scene, 'npcs_removed', []) or [])
-                merged = [n for n in base + added if n and n not in removed]
-                npcs_present = list(dict.fromkeys(merged))
+                base = getattr(scene, 'npcs_involved', None) or ()
+                added = getattr(scene, 'npcs_added', None) or ()
+                removed = frozenset(getattr(scene, 'npcs_removed', None) or ())
+                npcs_present = list(dict.fromkeys(
+                    n for n in itertools.chain(base, added) if n and n not in removed
+                ))
         except Exception:
             # Fallback to involved if any error occurs
             npcs_present = list(getattr(scene, 'npcs_involved', []) or [])
@@ -668,27 +924,20 @@ class EnhancedSceneManager:
             elif isinstance(loc_meta, str):
                 location_value = loc_meta
 
-        def friendly_name(identifier: str) -> str:
-            if not identifier:
-                return "Unknown NPC"
-            value = identifier
-            lowered = value.lower()
-            if lowered.startswith(("npc:", "npc_profile:", "pc:")):
-                value = value.split(":", 1)[1]
-            cleaned = value.replace("_", " ").strip()
-            return cleaned.title() if cleaned else "Unknown NPC"
+        # Participant names take precedence over metadata names
+        name_map = metadata_display | participant_display_by_id
 
         npc_display_map: Dict[str, str] = {}
         npcs_display = []
         for npc_id in npcs_present:
-            display = participant_display_by_id.get(npc_id) or metadata_display.get(npc_id)
+            display = name_map.get(npc_id)
             if not display and isinstance(npc_id, str):
-                display = friendly_name(npc_id)
+                display = _friendly_npc_name(npc_id)
             if display:
                 npc_display_map[npc_id] = display
                 npcs_display.append(display)
 
-        return {
+        summary = {
             "scene_id": scene.scene_id,
             "title": scene.title,
             "scene_type": scene.scene_type,
@@ -704,6 +953,8 @@ class EnhancedSceneManager:
             "combat_data": getattr(scene, 'combat_data', None),
             "timestamp": scene.timestamp.isoformat()
         }
+        self._summary_cache[scene_id] = (scene, scene.last_updated, summary)
+        return dict(summary)
 
     def update_scene_outcomes(self, scene_id: str, outcomes: List[str]) -> bool:
         """Update the outcomes of an existing scene.
@@ -717,6 +968,173 @@ class EnhancedSceneManager:
         """
         return self.update_scene(scene_id, {'outcomes': outcomes})
 
+    def _cache_get(self, scene_id: str) -> Optional[SceneInfo]:
+        """Return a cached scene, refreshing its LRU position.
+
+        Scenes cached from a scene file are only returned while the file is
+        unchanged on disk, which costs a single stat call.
+
+        Args:
+            scene_id: Scene identifier
+
+        Returns:
+            Cached SceneInfo, or None on a miss, expired or stale entry
+        """
+        entry = self._scene_cache.get(scene_id)
+        if entry is None:
+            return None
+
+        cached_at, signature, scene_info = entry
+        if _SCENE_CACHE_TTL > 0 and time.monotonic() - cached_at > _SCENE_CACHE_TTL:
+            self._cache_pop(scene_id)
+            return None
+
+        if signature is not None:
+            try:
+                current = _file_signature(os.stat(self._scene_path(scene_id)))
+            except OSError:
+                current = None
+            if current != signature:
+                self._cache_pop(scene_id)
+                return None
+
+        self._scene_cache.move_to_end(scene_id)
+        return scene_info
+
+    def _cache_put(
+        self,
+        scene_id: str,
+        scene_info: SceneInfo,
+        signature: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Cache a scene, evicting the least recently used entries past the size cap.
+
+        Args:
+            scene_id: Scene identifier
+            scene_info: SceneInfo to cache
+            signature: Signature of the scene file this entry matches, if file-backed
+        """
+        self._scene_cache[scene_id] = (time.monotonic(), signature, scene_info)
+        self._scene_cache.move_to_end(scene_id)
+        while len(self._scene_cache) > _SCENE_CACHE_MAX:
+            evicted_id, _ = self._scene_cache.popitem(last=False)
+            self._summary_cache.pop(evicted_id, None)
+
+    def _cache_pop(self, scene_id: str) -> None:
+        """Drop a scene and its summary from the cache.
+
+        Args:
+            scene_id: Scene identifier
+        """
+        self._scene_cache.pop(scene_id, None)
+        self._summary_cache.pop(scene_id, None)
+
+    def _scene_path(self, scene_id: str) -> str:
+        """Return the filesystem path of a scene file."""
+        return os.path.join(self.scenes_dir, f"{scene_id}.json")
+
+    def _recent_ring_current_stamp(self) -> Any:
+        """Return the validator the recent-scene ring is checked against.
+
+        Returns:
+            A monotonic timestamp for database storage, otherwise the current
+            version of the scenes directory or scene log (None if unavailable)
+        """
+        if self._storage_mode == "database":
+            return time.monotonic()
+        try:
+            if self._log_store is not None:
+                st = os.stat(self._log_store.log_path)
+                return (st.st_ino, st.st_size)
+            return os.stat(self.scenes_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _recent_ring_valid(self) -> bool:
+        """Check whether the recent-scene ring still reflects storage."""
+        if not self._recent_ring_depth or self._recent_ring_stamp is None:
+            return False
+        if self._storage_mode == "database":
+            return time.monotonic() - self._recent_ring_stamp <= _RECENT_RING_DB_TTL
+        return self._recent_ring_current_stamp() == self._recent_ring_stamp
+
+    def _seed_recent_ring(self, scenes: List[SceneInfo], limit: int, stamp: Any) -> None:
+        """Remember the result of a recent-scenes query.
+
+        Args:
+            scenes: Scenes returned, most recent first
+            limit: Limit the query ran with
+            stamp: Storage validator taken before the query ran
+        """
+        self._recent_ring.clear()
+        self._recent_ring.extend((scene.timestamp.timestamp(), scene.scene_id) for scene in scenes)
+        # A short result means every stored scene is known
+        self._recent_ring_depth = _RECENT_RING_SIZE if len(scenes) < limit else len(self._recent_ring)
+        self._recent_ring_stamp = stamp
+
+    def _note_recent_write(self, scene_info: SceneInfo, ring_valid: bool) -> None:
+        """Keep the recent-scene ring in step with a scene this manager stored.
+
+        Args:
+            scene_info: Scene that was created or rewritten
+            ring_valid: Whether the ring was valid before the write
+        """
+        if not ring_valid:
+            self._recent_ring_depth = 0
+            return
+
+        known = any(scene_id == scene_info.scene_id for _, scene_id in self._recent_ring)
+        if not known:
+            # Naive timestamps are taken as local time, as datetime.now() produces them
+            epoch = scene_info.timestamp.timestamp()
+            if self._recent_ring and epoch < self._recent_ring[0][0]:
+                # Older than the newest known scene; its position is unknown
+                self._recent_ring_depth = 0
+                return
+            self._recent_ring.appendleft((epoch, scene_info.scene_id))
+            self._recent_ring_depth = min(self._recent_ring_depth + 1, _RECENT_RING_SIZE)
+
+        if self._storage_mode != "database":
+            # Our own write changed the validator; the database TTL keeps running
+            self._recent_ring_stamp = self._recent_ring_current_stamp()
+
+    def _get_scene_log(self, scene_id: str) -> Optional[SceneInfo]:
+        """Retrieve scene from the append-only scene log.
+
+        Args:
+            scene_id: Scene identifier
+
+        Returns:
+            SceneInfo object or None if not found
+        """
+        try:
+            record = self._log_store.get(scene_id)
+            if record is None:
+                logger.warning("Scene not found: %s", scene_id)
+                return None
+
+            scene_info = _scene_from_record(record)
+            self._cache_put(scene_id, scene_info)
+            return scene_info
+
+        except Exception as e:
+            logger.error(f"Error loading scene {scene_id} from scene log: {e}")
+            return None
+
+    def _count_scene_files(self) -> int:
+        """Count scene files on disk.
+
+        Returns:
+            Number of stored scene files, or 0 if the directory is unavailable
+        """
+        if self._log_store is not None:
+            return len(self._log_store)
+        try:
+            with os.scandir(self.scenes_dir) as entries:
+                return sum(1 for entry in entries if entry.name.endswith('.json'))
+        except OSError:
+            return 0
+
     def _generate_scene_id(self) -> str:
         """Generate a unique scene ID.
 
@@ -724,16 +1142,10 @@ class EnhancedSceneManager:
             Unique scene identifier
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        scene_number = self._scene_count + 1
 
-        # Count existing scenes for numbering
-        try:
-            existing_count = len([f for f in os.listdir(self.scenes_dir) if f.endswith('.json')])
-        except:
-            existing_count = 0
-
-        scene_number = existing_count + 1
-
-        return f"scene_{scene_number:03d}_{timestamp}"
+        # Random suffix keeps IDs unique across concurrent creates in the same second
+        return f"scene_{scene_number:03d}_{timestamp}_{uuid.uuid4().hex[:8]}"
 
     @property
     def storage_mode(self) -> str:
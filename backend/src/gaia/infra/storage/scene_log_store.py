@@ -0,0 +1,329 @@
+"""Append-only, log-structured scene storage.
+
+Scenes are stored as one JSON document per line in ``scenes.ndjson``. Every
+create or update appends a new record; an in-memory index maps each scene ID
+to the offset and length of its latest record, so a read is a single
+``pread`` and a write is a single sequential append.
+
+The index is persisted to ``scenes.idx`` together with the log position it
+covers. On open, only the part of the log written after that position is
+scanned, and other processes' appends are picked up the same way before
+each read. Superseded records are dropped by compaction once they take up
+more space than the live ones. Compaction is not coordinated across
+processes, so a campaign's log should have a single writing process.
+"""
+
+import heapq
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+LOG_FILENAME = "scenes.ndjson"
+INDEX_FILENAME = "scenes.idx"
+
+# Compact once superseded records exceed live data and this many bytes
+_COMPACT_MIN_DEAD_BYTES = 1024 * 1024
+
+# Persist the index once this many log bytes are not yet covered by it
+_INDEX_SAVE_MIN_BYTES = 64 * 1024
+
+# Index entry: (offset, length, scene timestamp as epoch seconds)
+IndexEntry = Tuple[int, int, float]
+
+
+def _scene_epoch(scene_data: Dict[str, Any]) -> float:
+    """Return a scene record's timestamp as epoch seconds (0.0 if missing)."""
+    value = scene_data.get("timestamp")
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class SceneLogStore:
+    """Scene records in a single append-only log file with an offset index."""
+
+    def __init__(self, scenes_dir: str, fsync: bool = False):
+        """Open (or create) the scene log in a directory.
+
+        Args:
+            scenes_dir: Directory holding the log and index files
+            fsync: fsync the log after every append
+        """
+        self.scenes_dir = scenes_dir
+        self.log_path = os.path.join(scenes_dir, LOG_FILENAME)
+        self.index_path = os.path.join(scenes_dir, INDEX_FILENAME)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+
+        self._index: Dict[str, IndexEntry] = {}
+        # (inode, bytes indexed) of the log file the index describes
+        self._log_inode: Optional[int] = None
+        self._log_size = 0
+        self._live_bytes = 0
+        # Log position covered by the persisted index
+        self._saved_log_size = 0
+
+        os.makedirs(scenes_dir, exist_ok=True)
+        with self._lock:
+            self._load_index()
+            self._refresh()
+
+    def __contains__(self, scene_id: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return scene_id in self._index
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._index)
+
+    def get(self, scene_id: str) -> Optional[Dict[str, Any]]:
+        """Read the latest record for a scene.
+
+        Args:
+            scene_id: Scene identifier
+
+        Returns:
+            The stored scene dictionary, or None if the scene is unknown
+        """
+        with self._lock:
+            self._refresh()
+            entry = self._index.get(scene_id)
+            if entry is None:
+                return None
+            fd = self._open_for_read()
+        return self._read_records(fd, [entry])[0]
+
+    def put(self, scene_id: str, scene_data: Dict[str, Any], exclusive: bool = False) -> None:
+        """Append a scene record.
+
+        Args:
+            scene_id: Scene identifier
+            scene_data: Serializable scene dictionary (must contain ``scene_id``)
+            exclusive: Refuse to write a scene that already exists
+
+        Raises:
+            FileExistsError: If exclusive is set and the scene already exists
+            OSError: If the appended record could not be indexed
+        """
+        record = orjson.dumps(scene_data, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+
+        with self._lock:
+            self._refresh()
+            if exclusive and scene_id in self._index:
+                raise FileExistsError(f"Scene {scene_id} already exists")
+
+            fd = os.open(self.log_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                size = os.fstat(fd).st_size
+                if size > self._log_size and os.pread(fd, 1, size - 1) != b"\n":
+                    # Terminate a torn record left by a crashed append so ours starts on its own line
+                    os.write(fd, b"\n")
+                os.write(fd, record)
+                # O_APPEND leaves the offset at the end of our own record
+                record_offset = os.lseek(fd, 0, os.SEEK_CUR) - len(record)
+                if self._fsync:
+                    os.fsync(fd)
+                end = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+
+            # Index our record plus anything other writers appended before it
+            self._scan(self._log_size, end)
+            entry = self._index.get(scene_id)
+            if entry is None or entry[0] < record_offset:
+                raise OSError(f"Appended record for scene {scene_id} was not indexed in {self.log_path}")
+            if self._log_size - self._saved_log_size >= _INDEX_SAVE_MIN_BYTES:
+                self._save_index()
+
+            if self._dead_bytes() > max(self._live_bytes, _COMPACT_MIN_DEAD_BYTES):
+                self._compact()
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """Read the scenes with the newest timestamps.
+
+        Args:
+            limit: Maximum number of scenes to return
+
+        Returns:
+            Scene dictionaries, most recent first
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            self._refresh()
+            newest = heapq.nlargest(
+                limit,
+                self._index.items(),
+                key=lambda item: (item[1][2], item[0]),
+            )
+            if not newest:
+                return []
+            fd = self._open_for_read()
+        return self._read_records(fd, [entry for _, entry in newest])
+
+    def compact(self) -> None:
+        """Rewrite the log with only the latest record of each scene."""
+        with self._lock:
+            self._refresh()
+            self._compact()
+
+    def _open_for_read(self) -> int:
+        """Open the log for reading (caller holds the lock).
+
+        The descriptor pins the inode the current index offsets refer to, so a
+        compaction that replaces the log after the lock is released cannot
+        shift the records under a pending read.
+        """
+        return os.open(self.log_path, os.O_RDONLY)
+
+    def _read_records(self, fd: int, entries: List[IndexEntry]) -> List[Dict[str, Any]]:
+        """pread the given records from an open log descriptor, then close it."""
+        try:
+            return [orjson.loads(os.pread(fd, length, offset)) for offset, length, _ in entries]
+        finally:
+            os.close(fd)
+
+    def _dead_bytes(self) -> int:
+        return self._log_size - self._live_bytes
+
+    def _refresh(self) -> None:
+        """Bring the index up to date with the log on disk (caller holds the lock)."""
+        try:
+            st = os.stat(self.log_path)
+        except FileNotFoundError:
+            self._reset()
+            return
+
+        if st.st_ino != self._log_inode or st.st_size < self._log_size:
+            # Log was compacted or replaced by another process
+            self._reset()
+            self._log_inode = st.st_ino
+        if st.st_size > self._log_size:
+            self._scan(self._log_size, st.st_size)
+            if self._log_size - self._saved_log_size >= _INDEX_SAVE_MIN_BYTES:
+                self._save_index()
+
+    def _reset(self) -> None:
+        self._index = {}
+        self._log_inode = None
+        self._log_size = 0
+        self._live_bytes = 0
+        self._saved_log_size = 0
+
+    def _scan(self, start: int, end: int) -> None:
+        """Index complete records in the log between two offsets."""
+        if end <= start:
+            return
+        with open(self.log_path, "rb") as f:
+            self._log_inode = os.fstat(f.fileno()).st_ino
+            f.seek(start)
+            offset = start
+            while offset < end:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    # Partial trailing record from an in-flight append
+                    break
+                length = len(line)
+                try:
+                    scene_data = orjson.loads(line)
+                    scene_id = scene_data["scene_id"]
+                except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning("Skipping unreadable scene log record at %s:%d: %s", self.log_path, offset, e)
+                else:
+                    previous = self._index.get(scene_id)
+                    if previous is not None:
+                        self._live_bytes -= previous[1]
+                    self._index[scene_id] = (offset, length, _scene_epoch(scene_data))
+                    self._live_bytes += length
+                offset += length
+        self._log_size = offset
+
+    def _load_index(self) -> None:
+        """Load the persisted index if it still describes the current log."""
+        try:
+            with open(self.index_path, "rb") as f:
+                saved = orjson.loads(f.read())
+            st = os.stat(self.log_path)
+        except (OSError, orjson.JSONDecodeError):
+            return
+
+        if saved.get("inode") != st.st_ino or saved.get("log_size", 0) > st.st_size:
+            return
+
+        self._index = {scene_id: tuple(entry) for scene_id, entry in saved.get("scenes", {}).items()}
+        self._log_inode = st.st_ino
+        self._log_size = saved["log_size"]
+        self._live_bytes = sum(length for _, length, _ in self._index.values())
+        self._saved_log_size = self._log_size
+
+    def _save_index(self) -> None:
+        """Persist the index next to the log (best effort)."""
+        payload = orjson.dumps({
+            "inode": self._log_inode,
+            "log_size": self._log_size,
+            "scenes": self._index,
+        })
+        tmp_path = None
+        try:
+            # Unique temp name: readers in other processes may save the index too
+            fd, tmp_path = tempfile.mkstemp(dir=self.scenes_dir, prefix=f"{INDEX_FILENAME}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.index_path)
+            self._saved_log_size = self._log_size
+        except OSError as e:
+            logger.warning("Could not persist scene log index %s: %s", self.index_path, e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _compact(self) -> None:
+        """Rewrite live records into a fresh log (caller holds the lock)."""
+        if not self._index:
+            return
+
+        live = sorted(self._index.items(), key=lambda item: item[1][0])
+        tmp_path = f"{self.log_path}.compact"
+        new_index: Dict[str, IndexEntry] = {}
+
+        src = os.open(self.log_path, os.O_RDONLY)
+        try:
+            with open(tmp_path, "wb") as out:
+                offset = 0
+                for scene_id, (old_offset, length, epoch) in live:
+                    out.write(os.pread(src, length, old_offset))
+                    new_index[scene_id] = (offset, length, epoch)
+                    offset += length
+                out.flush()
+                os.fsync(out.fileno())
+                inode = os.fstat(out.fileno()).st_ino
+            os.replace(tmp_path, self.log_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            os.close(src)
+
+        logger.info("Compacted scene log %s: %d -> %d bytes", self.log_path, self._log_size, offset)
+        self._index = new_index
+        self._log_inode = inode
+        self._log_size = offset
+        self._live_bytes = offset
+        self._save_index()
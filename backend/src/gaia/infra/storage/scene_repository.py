@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import logging
 import uuid
-from typing import List, Optional
-from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Sequence, Tuple
 
-from sqlalchemy import select, and_
+import orjson
+
+from sqlalchemy import Boolean, String, select, and_, any_, bindparam, insert, update, func, literal, true
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from db.src.connection import db_manager
 from gaia.models.scene_info import SceneInfo
@@ -22,6 +25,337 @@ from gaia.models.scene_entity_db import SceneEntity
 
 logger = logging.getLogger(__name__)
 
+# Seconds a scene stays in the optional Redis read-through cache
+_SCENE_CACHE_TTL = 300
+
+# session.info key holding scene IDs written inside batch(), evicted after commit
+_BATCH_WRITES = "scene_repository_batch_writes"
+
+# Rows fetched per round-trip when streaming scene entities
+_ENTITY_BATCH_SIZE = 100
+
+# How get_recent_scenes loads scene entities: a second IN query or a JOIN
+EagerStrategy = Literal["select", "join"]
+
+# Scene columns that may be changed after creation
+_MUTABLE_FIELDS: frozenset[str] = frozenset({
+    "outcomes",
+    "npcs_added",
+    "npcs_removed",
+    "duration_turns",
+    "turn_order",
+    "current_turn_index",
+    "in_combat",
+    "combat_data",
+    "scene_metadata",
+    "last_updated",
+})
+
+# Mutable fields stored as scenes columns (npcs_added/npcs_removed live in scene_entities)
+_SCENE_UPDATABLE_COLS: frozenset[str] = frozenset(Scene.__table__.columns.keys()) & _MUTABLE_FIELDS
+
+
+def _participant_upsert_stmt(
+    scene_update, participants: Sequence[Tuple[str, str, str, bool]]
+):
+    """Build a statement that updates a scene and upserts character participants.
+
+    The scene UPDATE runs in a CTE and the participant upsert selects from it,
+    so nothing is written when the scene is missing or deleted, and the whole
+    change is one round-trip. Existing rows are marked present again with role
+    and display name refreshed, keeping the rest of their metadata (including
+    is_original). The statement returns a row per upserted participant.
+
+    Args:
+        scene_update: UPDATE of the scene returning its scene_id (see _scene_update_stmt)
+        participants: (character_id, display_name, role, is_original) tuples
+    """
+    # Last entry wins when the same character is listed twice
+    rows = {row[0]: row for row in participants}
+    character_ids, names, roles, originals = zip(*rows.values())
+    upd = scene_update.cte("upd")
+    incoming = func.unnest(
+        literal(list(character_ids), ARRAY(String)),
+        literal(list(names), ARRAY(String)),
+        literal(list(roles), ARRAY(String)),
+        literal(list(originals), ARRAY(Boolean)),
+    ).table_valued("character_id", "display_name", "role", "is_original").render_derived(name="incoming")
+
+    insert_stmt = pg_insert(SceneEntity).from_select(
+        ["scene_id", "entity_id", "entity_type", "is_present", "role", "entity_metadata"],
+        select(
+            upd.c.scene_id,
+            incoming.c.character_id,
+            literal("character"),
+            true(),
+            incoming.c.role,
+            func.jsonb_build_object(
+                "is_original", incoming.c.is_original,
+                "display_name", incoming.c.display_name,
+            ),
+        ).select_from(upd.join(incoming, true())),
+        # scene_entity_id and joined_at fall back to their server defaults
+        include_defaults=False,
+    )
+    return insert_stmt.on_conflict_do_update(
+        constraint="uq_scene_entity",
+        set_={
+            "is_present": True,
+            "left_at": None,
+            "role": insert_stmt.excluded.role,
+            "entity_metadata": SceneEntity.entity_metadata.op("||")(
+                insert_stmt.excluded.entity_metadata.op("-")("is_original")
+            ),
+        },
+    ).returning(SceneEntity.scene_id)
+
+
+def _raise_immutable_fields(updates: Dict[str, Any]) -> None:
+    """Reject an update that touches fields outside _MUTABLE_FIELDS."""
+    raise ValueError(
+        f"Cannot update immutable fields: {updates.keys() - _MUTABLE_FIELDS}. "
+        f"Only these fields can be updated: {set(_MUTABLE_FIELDS)}"
+    )
+
+
+def _scene_update_stmt(scene_id: str, updates: Dict[str, Any]):
+    """Build an UPDATE of a live scene's columns that returns its ID.
+
+    Keys that are not mutable Scene columns (e.g. npcs_added, which lives in
+    scene_entities) are ignored; last_updated is always set to the database
+    clock (transaction start time).
+    """
+    values = {field: updates[field] for field in updates.keys() & _SCENE_UPDATABLE_COLS}
+    values["last_updated"] = func.now()
+    return (
+        update(Scene)
+        .where(and_(Scene.scene_id == scene_id, Scene.is_deleted == False))
+        .values(**values)
+        .returning(Scene.scene_id)
+    )
+
+
+def _scene_insert_stmt(scene_info: SceneInfo, campaign_id: uuid.UUID):
+    """Build an INSERT for a new scene that returns nothing if the ID is taken."""
+    return (
+        pg_insert(Scene)
+        .values(**Scene.scene_info_row(scene_info, campaign_id))
+        .on_conflict_do_nothing(index_elements=["scene_id"])
+        .returning(Scene.scene_id)
+    )
+
+
+def _live_scene_exists_stmt(scene_id: str):
+    """Build a SELECT returning the scene ID only if the scene is not deleted."""
+    return select(Scene.scene_id).where(
+        and_(Scene.scene_id == scene_id, Scene.is_deleted == False)
+    )
+
+
+def _scene_exists_error(scene_id: str, campaign_id: uuid.UUID, live: bool) -> ValueError:
+    """Describe a scene ID collision on create."""
+    if live:
+        return ValueError(f"Scene {scene_id} already exists for campaign {campaign_id}")
+    return ValueError(
+        f"Scene {scene_id} already exists (deleted) and its ID cannot be reused"
+    )
+
+
+def _recent_scenes_stmt(eager_strategy: EagerStrategy):
+    """Build the query for a campaign's most recent live scenes with entities.
+
+    Takes ``campaign_id`` and ``limit`` bind parameters.
+    """
+    if eager_strategy == "join":
+        loader = joinedload(Scene.entities)
+    else:
+        loader = selectinload(Scene.entities)
+    return (
+        select(Scene)
+        .where(
+            and_(
+                Scene.campaign_id == bindparam("campaign_id"),
+                Scene.is_deleted == False,
+            )
+        )
+        .order_by(Scene.scene_timestamp.desc())
+        .limit(bindparam("limit"))
+        .options(loader)
+    )
+
+
+# Read statements are built once and executed with bind parameters.
+# Keep the literal "is_deleted == False" filters: get_recent_scenes is served
+# in order, without a sort, by the partial index ix_scenes_live_by_campaign_ts
+# (campaign_id, scene_timestamp DESC) WHERE is_deleted = false (migration 20),
+# and get_scene by the scene_id primary key.
+_GET_SCENE_STMT = (
+    select(Scene)
+    .where(and_(Scene.scene_id == bindparam("scene_id"), Scene.is_deleted == False))
+    .options(selectinload(Scene.entities))
+)
+_GET_SCENES_STMT = (
+    select(Scene)
+    .where(
+        and_(
+            Scene.scene_id == any_(bindparam("scene_ids", type_=ARRAY(String))),
+            Scene.is_deleted == False,
+        )
+    )
+    .options(selectinload(Scene.entities))
+)
+_RECENT_SCENES_STMTS: Dict[str, Any] = {
+    "select": _recent_scenes_stmt("select"),
+    "join": _recent_scenes_stmt("join"),
+}
+
+
+# Columns returned by get_recent_scene_summaries unless the caller picks others
+_SCENE_SUMMARY_FIELDS = (Scene.scene_id, Scene.title, Scene.scene_type, Scene.scene_timestamp)
+
+
+def _recent_summaries_stmt(campaign_id: uuid.UUID, limit: int, fields: Optional[Sequence[Any]]):
+    """Build a SELECT of only the given Scene columns for a campaign's recent live scenes."""
+    return (
+        select(*(fields or _SCENE_SUMMARY_FIELDS))
+        .where(and_(Scene.campaign_id == campaign_id, Scene.is_deleted == False))
+        .order_by(Scene.scene_timestamp.desc())
+        .limit(limit)
+    )
+
+
+def _recent_scenes_params(
+    campaign_id: uuid.UUID, limit: int, eager_strategy: EagerStrategy
+) -> Tuple[Any, Dict[str, Any]]:
+    """Return the prebuilt recent-scenes statement and its parameters."""
+    try:
+        stmt = _RECENT_SCENES_STMTS[eager_strategy]
+    except KeyError:
+        raise ValueError(f"Unknown eager_strategy: {eager_strategy}") from None
+    return stmt, {"campaign_id": campaign_id, "limit": limit}
+
+
+def _entities_stmt(scene_id: str, entity_type: Optional[str], present_only: bool):
+    """Build the SELECT of a scene's entities with the optional filters."""
+    conditions = [SceneEntity.scene_id == scene_id]
+
+    if entity_type:
+        conditions.append(SceneEntity.entity_type == entity_type)
+
+    if present_only:
+        conditions.append(SceneEntity.is_present == True)
+
+    return select(SceneEntity).where(and_(*conditions))
+
+
+def _scene_cache_key(scene_id: str) -> str:
+    return f"scene:{scene_id}"
+
+
+def _load_cached_scene(raw: Any) -> Optional[SceneInfo]:
+    """Decode a cached scene, or None if the entry is unreadable."""
+    try:
+        return SceneInfo.from_dict(orjson.loads(raw))
+    except Exception as e:
+        logger.warning("Ignoring unreadable cached scene: %s", e)
+        return None
+
+
+def _merged_metadata_expr(
+    delta: Optional[Dict[str, Any]], display_names: Optional[Dict[str, str]] = None
+):
+    """Build a JSONB expression merging keys into the stored scene metadata.
+
+    Top-level keys are concatenated with ``||``; display names are merged into
+    the nested npc_display_names map rather than replacing it.
+    """
+    merged = Scene.scene_metadata.op("||")(literal(delta or {}, JSONB))
+    if display_names:
+        names = func.coalesce(
+            merged.op("->", return_type=JSONB)("npc_display_names"), literal({}, JSONB)
+        ).op("||")(literal(display_names, JSONB))
+        merged = merged.op("||")(func.jsonb_build_object("npc_display_names", names))
+    return merged
+
+
+# ========== Query bodies shared by the sync and async methods ==========
+# Each takes a sync Session; async methods run them with AsyncSession.run_sync.
+
+
+def _insert_scene(session: Session, scene_info: SceneInfo, campaign_id: uuid.UUID) -> int:
+    """Insert a scene and its participants, returning the number of entity rows.
+
+    Raises:
+        ValueError: If a scene with this ID already exists (live or deleted)
+    """
+    # Insert the scene; an existing row (live or deleted) makes this a no-op
+    created = session.execute(_scene_insert_stmt(scene_info, campaign_id)).scalar_one_or_none()
+    if created is None:
+        live = session.execute(_live_scene_exists_stmt(scene_info.scene_id)).scalar_one_or_none()
+        raise _scene_exists_error(scene_info.scene_id, campaign_id, live is not None)
+
+    # Create SceneEntity records for all participants in one multi-row INSERT
+    rows = [
+        SceneEntity.participant_row(scene_info.scene_id, participant)
+        for participant in scene_info.participants
+    ]
+    if rows:
+        session.execute(insert(SceneEntity), rows)
+    return len(rows)
+
+
+def _select_scene(session: Session, scene_id: str) -> Optional[SceneInfo]:
+    """Load a live scene with its entities as SceneInfo."""
+    scene = session.execute(_GET_SCENE_STMT, {"scene_id": scene_id}).scalar_one_or_none()
+    return scene.to_scene_info() if scene else None
+
+
+def _select_scenes(session: Session, scene_ids: Sequence[str]) -> Dict[str, SceneInfo]:
+    """Load several live scenes with their entities, keyed by scene_id."""
+    result = session.execute(_GET_SCENES_STMT, {"scene_ids": list(scene_ids)})
+    return {scene.scene_id: scene.to_scene_info() for scene in result.scalars().all()}
+
+
+def _update_scene_columns(session: Session, scene_id: str, updates: Dict[str, Any]) -> bool:
+    """Update a live scene's columns; False if it is missing or deleted."""
+    return session.execute(_scene_update_stmt(scene_id, updates)).scalar_one_or_none() is not None
+
+
+def _select_recent_scenes(
+    session: Session, campaign_id: uuid.UUID, limit: int, eager_strategy: EagerStrategy
+) -> List[SceneInfo]:
+    """Load a campaign's most recent live scenes as SceneInfo."""
+    stmt, params = _recent_scenes_params(campaign_id, limit, eager_strategy)
+    result = session.execute(stmt, params)
+    if eager_strategy == "join":
+        # Joined rows repeat each scene once per entity
+        result = result.unique()
+    return [scene.to_scene_info() for scene in result.scalars().all()]
+
+
+def _select_recent_summaries(
+    session: Session, campaign_id: uuid.UUID, limit: int, fields: Optional[Sequence[Any]]
+) -> List[Dict[str, Any]]:
+    """Load selected columns of a campaign's most recent live scenes."""
+    result = session.execute(_recent_summaries_stmt(campaign_id, limit, fields))
+    return [row._asdict() for row in result]
+
+
+def _upsert_participants(
+    session: Session, scene_id: str, participants: Sequence[Tuple[str, str, str, bool]]
+) -> bool:
+    """Touch a live scene and upsert participants; False if it is missing or deleted."""
+    stmt = _participant_upsert_stmt(_scene_update_stmt(scene_id, {}), participants)
+    return session.execute(stmt).first() is not None
+
+
+def _select_entities(
+    session: Session, scene_id: str, entity_type: Optional[str], present_only: bool
+) -> List[SceneEntity]:
+    """Load a scene's entities with the optional filters."""
+    # .all() already returns a new list
+    return session.execute(_entities_stmt(scene_id, entity_type, present_only)).scalars().all()
+
 
 class SceneRepository:
     """Repository for scene database operations.
@@ -30,18 +364,147 @@ class SceneRepository:
     manages transactions, and provides query methods.
     """
 
-    def __init__(self):
-        """Initialize repository with database manager."""
+    def __init__(
+        self,
+        cache: Optional[Any] = None,
+        sync_cache: Optional[Any] = None,
+        cache_ttl: int = _SCENE_CACHE_TTL,
+    ):
+        """Initialize repository with the shared database manager.
+
+        Repositories hold no connections of their own; all of them borrow from
+        the process-wide pools on ``db_manager``, so creating one per scene
+        manager is cheap.
+
+        Scenes can optionally be cached in Redis: get_scene reads through
+        ``cache`` and get_scene_sync through ``sync_cache``, and every write
+        evicts the scene from the client of its own flavour. If scenes are
+        written through both async and sync methods, pass both clients so
+        neither side serves a stale copy for up to ``cache_ttl`` seconds.
+
+        Args:
+            cache: Optional async Redis client (e.g. ``redis.asyncio.Redis``)
+            sync_cache: Optional synchronous Redis client (e.g. ``redis.Redis``)
+            cache_ttl: Seconds a cached scene is kept
+        """
         self.db_manager = db_manager
+        self._cache = cache
+        self._sync_cache = sync_cache
+        self._cache_ttl = cache_ttl
+
+    # ========== Redis read-through cache (errors never fail the caller) ==========
+
+    async def _cache_get(self, scene_id: str) -> Optional[SceneInfo]:
+        if self._cache is None:
+            return None
+        try:
+            raw = await self._cache.get(_scene_cache_key(scene_id))
+        except Exception as e:
+            logger.warning("Scene cache read failed for %s: %s", scene_id, e)
+            return None
+        return _load_cached_scene(raw) if raw is not None else None
+
+    async def _cache_set(self, scene_info: SceneInfo) -> None:
+        if self._cache is None:
+            return
+        try:
+            await self._cache.set(
+                _scene_cache_key(scene_info.scene_id),
+                orjson.dumps(scene_info.to_dict()),
+                ex=self._cache_ttl,
+            )
+        except Exception as e:
+            logger.warning("Scene cache write failed for %s: %s", scene_info.scene_id, e)
+
+    async def _cache_evict(self, scene_id: str) -> None:
+        if self._cache is None:
+            return
+        try:
+            await self._cache.delete(_scene_cache_key(scene_id))
+        except Exception as e:
+            logger.warning("Scene cache eviction failed for %s: %s", scene_id, e)
+
+    def _cache_get_sync(self, scene_id: str) -> Optional[SceneInfo]:
+        if self._sync_cache is None:
+            return None
+        try:
+            raw = self._sync_cache.get(_scene_cache_key(scene_id))
+        except Exception as e:
+            logger.warning("Scene cache read failed for %s: %s", scene_id, e)
+            return None
+        return _load_cached_scene(raw) if raw is not None else None
+
+    def _cache_set_sync(self, scene_info: SceneInfo) -> None:
+        if self._sync_cache is None:
+            return
+        try:
+            self._sync_cache.set(
+                _scene_cache_key(scene_info.scene_id),
+                orjson.dumps(scene_info.to_dict()),
+                ex=self._cache_ttl,
+            )
+        except Exception as e:
+            logger.warning("Scene cache write failed for %s: %s", scene_info.scene_id, e)
+
+    def _cache_evict_sync(self, scene_id: str) -> None:
+        if self._sync_cache is None:
+            return
+        try:
+            self._sync_cache.delete(_scene_cache_key(scene_id))
+        except Exception as e:
+            logger.warning("Scene cache eviction failed for %s: %s", scene_id, e)
+
+    # ========== Shared transactions ==========
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[AsyncSession]:
+        """Run several async writes in one transaction.
+
+        Pass the yielded session as ``session=`` to the write methods; they
+        then skip their own commit, and everything commits (or rolls back)
+        together when the block exits. Cached copies of the written scenes are
+        evicted after the commit.
+
+        Yields:
+            AsyncSession shared by the batched calls
+        """
+        written: set[str] = set()
+        async with self.db_manager.get_async_session() as session:
+            session.info[_BATCH_WRITES] = written
+            yield session
+        for scene_id in written:
+            await self._cache_evict(scene_id)
+
+    @asynccontextmanager
+    async def _session_scope(self, session: Optional[AsyncSession]) -> AsyncIterator[AsyncSession]:
+        """Yield the caller's batch session, or open (and close) a new one."""
+        if session is not None:
+            yield session
+            return
+        async with self.db_manager.get_async_session() as owned:
+            yield owned
+
+    async def _finish_write(self, session: AsyncSession, scene_id: str) -> None:
+        """Commit a write and evict the scene from the cache, or defer both to batch()."""
+        batch_writes = session.info.get(_BATCH_WRITES)
+        if batch_writes is not None:
+            batch_writes.add(scene_id)
+            return
+        await session.commit()
+        await self._cache_evict(scene_id)
 
     async def create_scene(
-        self, scene_info: SceneInfo, campaign_id: uuid.UUID
+        self,
+        scene_info: SceneInfo,
+        campaign_id: uuid.UUID,
+        session: Optional[AsyncSession] = None,
     ) -> str:
         """Create a new scene in the database.
 
         Args:
             scene_info: SceneInfo dataclass containing scene data
             campaign_id: UUID of the campaign this scene belongs to
+            session: Optional session from batch() to write in
 
         Returns:
             scene_id of the created scene
@@ -51,38 +514,20 @@ class SceneRepository:
             Exception: For database errors
         """
         try:
-            async with self.db_manager.get_async_session() as session:
-                # Check if scene already exists
-                existing = await session.get(Scene, scene_info.scene_id)
-                if existing and not existing.is_deleted:
-                    raise ValueError(
-                        f"Scene {scene_info.scene_id} already exists for campaign {campaign_id}"
-                    )
-
-                # Convert SceneInfo to Scene model
-                scene = Scene.from_scene_info(scene_info, campaign_id)
-
-                # Create SceneEntity records for all participants
-                for participant in scene_info.participants:
-                    entity = SceneEntity.from_scene_participant(
-                        scene_info.scene_id, participant
-                    )
-                    scene.entities.append(entity)
-
-                # Add and commit
-                session.add(scene)
-                await session.commit()
+            async with self._session_scope(session) as session:
+                entity_count = await session.run_sync(_insert_scene, scene_info, campaign_id)
+                await self._finish_write(session, scene_info.scene_id)
 
                 logger.info(
-                    f"Created scene {scene_info.scene_id} for campaign {campaign_id} "
-                    f"with {len(scene.entities)} entities"
+                    "Created scene %s for campaign %s with %d entities",
+                    scene_info.scene_id, campaign_id, entity_count,
                 )
                 return scene_info.scene_id
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Error creating scene {scene_info.scene_id}: {e}")
+            logger.error("Error creating scene %s: %s", scene_info.scene_id, e)
             raise
 
     async def get_scene(self, scene_id: str) -> Optional[SceneInfo]:
@@ -94,29 +539,51 @@ class SceneRepository:
         Returns:
             SceneInfo if found and not deleted, None otherwise
         """
+        cached = await self._cache_get(scene_id)
+        if cached is not None:
+            return cached
+
         try:
             async with self.db_manager.get_async_session() as session:
-                # Load scene with entities
-                stmt = (
-                    select(Scene)
-                    .where(and_(Scene.scene_id == scene_id, Scene.is_deleted == False))
-                    .options(selectinload(Scene.entities))
-                )
-                result = await session.execute(stmt)
-                scene = result.scalar_one_or_none()
-
-                if not scene:
+                scene_info = await session.run_sync(_select_scene, scene_id)
+                if scene_info is None:
                     return None
 
-                # Convert to SceneInfo
-                return scene.to_scene_info()
+        except Exception as e:
+            logger.error("Error retrieving scene %s: %s", scene_id, e)
+            raise
+
+        await self._cache_set(scene_info)
+        return scene_info
+
+    async def get_scenes_bulk(self, scene_ids: Sequence[str]) -> Dict[str, SceneInfo]:
+        """Get several scenes in one query.
+
+        Scene rows come from a single ``scene_id = ANY(:scene_ids)`` query and
+        their entities from one more; the cache is bypassed.
+
+        Args:
+            scene_ids: Scene identifiers to fetch
+
+        Returns:
+            SceneInfo by scene_id for every ID found and not deleted
+        """
+        if not scene_ids:
+            return {}
+
+        try:
+            async with self.db_manager.get_async_session() as session:
+                return await session.run_sync(_select_scenes, scene_ids)
 
         except Exception as e:
-            logger.error(f"Error retrieving scene {scene_id}: {e}")
+            logger.error("Error retrieving scenes %s: %s", list(scene_ids), e)
             raise
 
     async def update_scene(
-        self, scene_id: str, updates: dict
+        self,
+        scene_id: str,
+        updates: dict,
+        session: Optional[AsyncSession] = None,
     ) -> bool:
         """Update mutable fields of a scene.
 
@@ -126,6 +593,7 @@ class SceneRepository:
         Args:
             scene_id: Scene to update
             updates: Dictionary of fields to update
+            session: Optional session from batch() to write in
 
         Returns:
             True if updated successfully, False if scene not found
@@ -133,88 +601,80 @@ class SceneRepository:
         Raises:
             ValueError: If trying to update immutable fields
         """
-        # Define mutable fields (can be updated)
-        mutable_fields = {
-            "outcomes",
-            "npcs_added",
-            "npcs_removed",
-            "duration_turns",
-            "turn_order",
-            "current_turn_index",
-            "in_combat",
-            "combat_data",
-            "scene_metadata",
-            "last_updated",
-        }
-
         # Check for attempts to update immutable fields
-        immutable_attempts = set(updates.keys()) - mutable_fields
-        if immutable_attempts:
-            raise ValueError(
-                f"Cannot update immutable fields: {immutable_attempts}. "
-                f"Only these fields can be updated: {mutable_fields}"
-            )
+        if not updates.keys() <= _MUTABLE_FIELDS:
+            _raise_immutable_fields(updates)
 
         try:
-            async with self.db_manager.get_async_session() as session:
-                # Load scene
-                scene = await session.get(Scene, scene_id)
-                if not scene or scene.is_deleted:
-                    logger.warning(f"Scene {scene_id} not found or deleted")
+            async with self._session_scope(session) as session:
+                if not await session.run_sync(_update_scene_columns, scene_id, updates):
+                    logger.warning("Scene %s not found or deleted", scene_id)
                     return False
 
-                # Update fields
-                for field, value in updates.items():
-                    if hasattr(scene, field):
-                        setattr(scene, field, value)
-
-                # Update timestamp
-                scene.last_updated = datetime.now(timezone.utc)
-
-                await session.commit()
-                logger.info(f"Updated scene {scene_id} with fields: {list(updates.keys())}")
+                await self._finish_write(session, scene_id)
+                logger.info("Updated scene %s with fields: %s", scene_id, list(updates.keys()))
                 return True
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Error updating scene {scene_id}: {e}")
+            logger.error("Error updating scene %s: %s", scene_id, e)
             raise
 
     async def get_recent_scenes(
-        self, campaign_id: uuid.UUID, limit: int = 5
+        self,
+        campaign_id: uuid.UUID,
+        limit: int = 5,
+        eager_strategy: EagerStrategy = "select",
     ) -> List[SceneInfo]:
         """Get recent scenes for a campaign.
 
         Args:
             campaign_id: Campaign UUID
             limit: Maximum number of scenes to return
+            eager_strategy: "select" loads entities with a second IN query;
+                "join" loads them in the same query, which saves a round trip
+                for small limits but repeats scene columns for every entity
 
         Returns:
             List of SceneInfo, ordered by scene_timestamp descending
         """
         try:
             async with self.db_manager.get_async_session() as session:
-                stmt = (
-                    select(Scene)
-                    .where(
-                        and_(
-                            Scene.campaign_id == campaign_id,
-                            Scene.is_deleted == False,
-                        )
-                    )
-                    .order_by(Scene.scene_timestamp.desc())
-                    .limit(limit)
-                    .options(selectinload(Scene.entities))
+                return await session.run_sync(
+                    _select_recent_scenes, campaign_id, limit, eager_strategy
                 )
 
-                result = await session.execute(stmt)
-                scenes = result.scalars().all()
+        except Exception as e:
+            logger.error("Error getting recent scenes for campaign %s: %s", campaign_id, e)
+            raise
+
+    async def get_recent_scene_summaries(
+        self,
+        campaign_id: uuid.UUID,
+        limit: int = 5,
+        fields: Optional[Sequence[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get selected columns of a campaign's recent scenes.
+
+        For list views that only need a few columns: wide JSONB columns
+        (metadata, combat data, outcomes) and scene entities are not fetched.
+
+        Args:
+            campaign_id: Campaign UUID
+            limit: Maximum number of scenes to return
+            fields: Scene columns to return, e.g. ``(Scene.scene_id, Scene.title)``;
+                defaults to scene_id, title, scene_type and scene_timestamp
 
-                return [scene.to_scene_info() for scene in scenes]
+        Returns:
+            Dicts keyed by column name, ordered by scene_timestamp descending
+        """
+        try:
+            async with self.db_manager.get_async_session() as session:
+                return await session.run_sync(_select_recent_summaries, campaign_id, limit, fields)
 
         except Exception as e:
-            logger.error(f"Error getting recent scenes for campaign {campaign_id}: {e}")
+            logger.error("Error getting recent scene summaries for campaign %s: %s", campaign_id, e)
             raise
 
     async def add_entity_to_scene(
@@ -224,6 +684,7 @@ class SceneRepository:
         entity_type: str,
         role: Optional[str] = None,
         metadata: Optional[dict] = None,
+        session: Optional[AsyncSession] = None,
     ) -> bool:
         """Add an entity to a scene.
 
@@ -233,67 +694,68 @@ class SceneRepository:
             entity_type: Type of entity (character, item, quest, etc.)
             role: Optional role (for characters)
             metadata: Optional metadata dict
+            session: Optional session from batch() to write in
 
         Returns:
             True if added successfully, False if scene not found
         """
+        # Insert the association only if the scene is live; an existing association
+        # is restored (present again, rejoined now) and keeps its role and metadata
+        stmt = pg_insert(SceneEntity).from_select(
+            ["scene_id", "entity_id", "entity_type", "role", "is_present", "entity_metadata"],
+            select(
+                Scene.scene_id,
+                literal(entity_id, String),
+                literal(entity_type, String),
+                literal(role, String),
+                true(),
+                literal(metadata or {}, JSONB),
+            ).where(and_(Scene.scene_id == scene_id, Scene.is_deleted == False)),
+            # scene_entity_id and joined_at fall back to their server defaults
+            include_defaults=False,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_scene_entity",
+            set_={
+                "is_present": True,
+                "joined_at": func.now(),
+                "left_at": None,
+            },
+        ).returning(SceneEntity.entity_id)
+
         try:
-            async with self.db_manager.get_async_session() as session:
-                # Verify scene exists
-                scene = await session.get(Scene, scene_id)
-                if not scene or scene.is_deleted:
-                    logger.warning(f"Scene {scene_id} not found or deleted")
+            async with self._session_scope(session) as session:
+                added = (await session.execute(stmt)).scalar_one_or_none()
+                if added is None:
+                    logger.warning("Scene %s not found or deleted", scene_id)
                     return False
 
-                # Check if entity already exists
-                stmt = select(SceneEntity).where(
-                    and_(
-                        SceneEntity.scene_id == scene_id,
-                        SceneEntity.entity_id == entity_id,
-                        SceneEntity.entity_type == entity_type,
-                    )
-                )
-                result = await session.execute(stmt)
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    # Update existing entity to mark as present
-                    existing.restore()
-                    logger.info(f"Restored entity {entity_id} to scene {scene_id}")
-                else:
-                    # Create new entity association
-                    entity = SceneEntity(
-                        scene_id=scene_id,
-                        entity_id=entity_id,
-                        entity_type=entity_type,
-                        role=role,
-                        is_present=True,
-                        entity_metadata=metadata or {},
-                    )
-                    session.add(entity)
-                    logger.info(f"Added entity {entity_id} ({entity_type}) to scene {scene_id}")
-
-                await session.commit()
+                await self._finish_write(session, scene_id)
+                logger.info("Added entity %s (%s) to scene %s", entity_id, entity_type, scene_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Error adding entity {entity_id} to scene {scene_id}: {e}")
+            logger.error("Error adding entity %s to scene %s: %s", entity_id, scene_id, e)
             raise
 
     async def remove_entity_from_scene(
-        self, scene_id: str, entity_id: str
+        self,
+        scene_id: str,
+        entity_id: str,
+        session: Optional[AsyncSession] = None,
     ) -> bool:
         """Remove an entity from a scene (marks as not present).
 
         Args:
             scene_id: Scene to remove entity from
             entity_id: Entity identifier
+            session: Optional session from batch() to write in
 
         Returns:
             True if removed successfully, False if not found
         """
         try:
-            async with self.db_manager.get_async_session() as session:
+            async with self._session_scope(session) as session:
                 stmt = select(SceneEntity).where(
                     and_(
                         SceneEntity.scene_id == scene_id,
@@ -304,43 +766,86 @@ class SceneRepository:
                 entity = result.scalar_one_or_none()
 
                 if not entity:
-                    logger.warning(
-                        f"Entity {entity_id} not found in scene {scene_id}"
-                    )
+                    logger.warning("Entity %s not found in scene %s", entity_id, scene_id)
                     return False
 
                 entity.mark_departed()
-                await session.commit()
-                logger.info(f"Removed entity {entity_id} from scene {scene_id}")
+                await self._finish_write(session, scene_id)
+                logger.info("Removed entity %s from scene %s", entity_id, scene_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Error removing entity {entity_id} from scene {scene_id}: {e}")
+            logger.error("Error removing entity %s from scene %s: %s", entity_id, scene_id, e)
             raise
 
-    async def soft_delete_scene(self, scene_id: str) -> bool:
+    async def soft_delete_scene(
+        self,
+        scene_id: str,
+        session: Optional[AsyncSession] = None,
+    ) -> bool:
         """Soft delete a scene.
 
         Args:
             scene_id: Scene to delete
+            session: Optional session from batch() to write in
 
         Returns:
-            True if deleted successfully, False if not found
+            True if deleted successfully, False if not found or already deleted
         """
+        stmt = (
+            update(Scene)
+            .where(and_(Scene.scene_id == scene_id, Scene.is_deleted == False))
+            .values(is_deleted=True, deleted_at=func.now())
+            .returning(Scene.scene_id)
+        )
+
         try:
-            async with self.db_manager.get_async_session() as session:
-                scene = await session.get(Scene, scene_id)
-                if not scene:
-                    logger.warning(f"Scene {scene_id} not found")
+            async with self._session_scope(session) as session:
+                deleted = (await session.execute(stmt)).scalar_one_or_none()
+                if deleted is None:
+                    logger.warning("Scene %s not found or already deleted", scene_id)
                     return False
 
-                scene.soft_delete()
-                await session.commit()
-                logger.info(f"Soft deleted scene {scene_id}")
+                await self._finish_write(session, scene_id)
+                logger.info("Soft deleted scene %s", scene_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Error soft deleting scene {scene_id}: {e}")
+            logger.error("Error soft deleting scene %s: %s", scene_id, e)
+            raise
+
+    async def add_participants_bulk(
+        self,
+        scene_id: str,
+        participants: Sequence[Tuple[str, str, str, bool]],
+        session: Optional[AsyncSession] = None,
+    ) -> bool:
+        """Add several participants to a scene with a single multi-row upsert.
+
+        Args:
+            scene_id: Scene identifier
+            participants: (character_id, display_name, role, is_original) tuples
+            session: Optional session from batch() to write in
+
+        Returns:
+            True if successful, False if scene not found
+        """
+        if not participants:
+            return True
+
+        try:
+            async with self._session_scope(session) as session:
+                # Touch the scene and upsert in one statement
+                if not await session.run_sync(_upsert_participants, scene_id, participants):
+                    logger.warning("Scene %s not found or deleted", scene_id)
+                    return False
+
+                await self._finish_write(session, scene_id)
+                logger.info("Upserted %s participants in scene %s", len(participants), scene_id)
+                return True
+
+        except Exception as e:
+            logger.error("Error adding participants to scene %s: %s", scene_id, e)
             raise
 
     async def get_entities_in_scene(
@@ -361,20 +866,42 @@ class SceneRepository:
         """
         try:
             async with self.db_manager.get_async_session() as session:
-                conditions = [SceneEntity.scene_id == scene_id]
+                return await session.run_sync(_select_entities, scene_id, entity_type, present_only)
 
-                if entity_type:
-                    conditions.append(SceneEntity.entity_type == entity_type)
+        except Exception as e:
+            logger.error("Error getting entities for scene %s: %s", scene_id, e)
+            raise
 
-                if present_only:
-                    conditions.append(SceneEntity.is_present == True)
+    async def iter_entities_in_scene(
+        self,
+        scene_id: str,
+        entity_type: Optional[str] = None,
+        present_only: bool = True,
+    ) -> AsyncIterator[SceneEntity]:
+        """Stream entities in a scene instead of loading them all at once.
 
-                stmt = select(SceneEntity).where(and_(*conditions))
-                result = await session.execute(stmt)
-                return list(result.scalars().all())
+        Rows are fetched in batches with a server-side cursor, so callers that
+        filter or aggregate never hold the full list. The session stays open
+        until iteration finishes.
+
+        Args:
+            scene_id: Scene to query
+            entity_type: Optional filter by entity type
+            present_only: Only return currently present entities
+
+        Yields:
+            SceneEntity records
+        """
+        stmt = _entities_stmt(scene_id, entity_type, present_only).execution_options(
+            yield_per=_ENTITY_BATCH_SIZE
+        )
+        try:
+            async with self.db_manager.get_async_session() as session:
+                async for entity in await session.stream_scalars(stmt):
+                    yield entity
 
         except Exception as e:
-            logger.error(f"Error getting entities for scene {scene_id}: {e}")
+            logger.error("Error streaming entities for scene %s: %s", scene_id, e)
             raise
 
     # ========== Synchronous methods for use from sync contexts ==========
@@ -385,138 +912,204 @@ class SceneRepository:
         """Synchronous version of create_scene for use from sync contexts."""
         try:
             with self.db_manager.get_sync_session() as session:
-                # Check if scene already exists
-                existing = session.get(Scene, scene_info.scene_id)
-                if existing and not existing.is_deleted:
-                    raise ValueError(
-                        f"Scene {scene_info.scene_id} already exists for campaign {campaign_id}"
-                    )
-
-                # Convert SceneInfo to Scene model
-                scene = Scene.from_scene_info(scene_info, campaign_id)
-
-                # Create SceneEntity records for all participants
-                for participant in scene_info.participants:
-                    entity = SceneEntity.from_scene_participant(
-                        scene_info.scene_id, participant
-                    )
-                    scene.entities.append(entity)
-
-                # Add and commit
-                session.add(scene)
+                entity_count = _insert_scene(session, scene_info, campaign_id)
                 session.commit()
 
                 logger.info(
-                    f"Created scene {scene_info.scene_id} for campaign {campaign_id} "
-                    f"with {len(scene.entities)} entities (sync)"
+                    "Created scene %s for campaign %s with %d entities (sync)",
+                    scene_info.scene_id, campaign_id, entity_count,
                 )
                 return scene_info.scene_id
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Error creating scene {scene_info.scene_id} (sync): {e}")
+            logger.error("Error creating scene %s (sync): %s", scene_info.scene_id, e)
             raise
 
     def get_scene_sync(self, scene_id: str) -> Optional[SceneInfo]:
         """Synchronous version of get_scene for use from sync contexts."""
+        cached = self._cache_get_sync(scene_id)
+        if cached is not None:
+            return cached
+
         try:
             with self.db_manager.get_sync_session() as session:
-                # Load scene with entities
-                stmt = (
-                    select(Scene)
-                    .where(and_(Scene.scene_id == scene_id, Scene.is_deleted == False))
-                    .options(selectinload(Scene.entities))
-                )
-                result = session.execute(stmt)
-                scene = result.scalar_one_or_none()
-
-                if not scene:
+                scene_info = _select_scene(session, scene_id)
+                if scene_info is None:
                     return None
 
-                # Convert to SceneInfo
-                return scene.to_scene_info()
+        except Exception as e:
+            logger.error("Error retrieving scene %s (sync): %s", scene_id, e)
+            raise
+
+        self._cache_set_sync(scene_info)
+        return scene_info
+
+    def get_scenes_bulk_sync(self, scene_ids: Sequence[str]) -> Dict[str, SceneInfo]:
+        """Synchronous version of get_scenes_bulk."""
+        if not scene_ids:
+            return {}
+
+        try:
+            with self.db_manager.get_sync_session() as session:
+                return _select_scenes(session, scene_ids)
 
         except Exception as e:
-            logger.error(f"Error retrieving scene {scene_id} (sync): {e}")
+            logger.error("Error retrieving scenes %s (sync): %s", list(scene_ids), e)
             raise
 
     def update_scene_sync(self, scene_id: str, updates: dict) -> bool:
         """Synchronous version of update_scene for use from sync contexts."""
-        # Define mutable fields (can be updated)
-        mutable_fields = {
-            "outcomes",
-            "npcs_added",
-            "npcs_removed",
-            "duration_turns",
-            "turn_order",
-            "current_turn_index",
-            "in_combat",
-            "combat_data",
-            "scene_metadata",
-            "last_updated",
-        }
-
         # Check for attempts to update immutable fields
-        immutable_attempts = set(updates.keys()) - mutable_fields
-        if immutable_attempts:
-            raise ValueError(
-                f"Cannot update immutable fields: {immutable_attempts}. "
-                f"Only these fields can be updated: {mutable_fields}"
-            )
+        if not updates.keys() <= _MUTABLE_FIELDS:
+            _raise_immutable_fields(updates)
 
         try:
             with self.db_manager.get_sync_session() as session:
-                # Load scene
-                scene = session.get(Scene, scene_id)
-                if not scene or scene.is_deleted:
-                    logger.warning(f"Scene {scene_id} not found or deleted (sync)")
+                if not _update_scene_columns(session, scene_id, updates):
+                    logger.warning("Scene %s not found or deleted (sync)", scene_id)
                     return False
 
-                # Update fields
-                for field, value in updates.items():
-                    if hasattr(scene, field):
-                        setattr(scene, field, value)
+                session.commit()
+                self._cache_evict_sync(scene_id)
+                logger.info("Updated scene %s with fields: %s (sync)", scene_id, list(updates.keys()))
+                return True
 
-                # Update timestamp
-                scene.last_updated = datetime.now(timezone.utc)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Error updating scene %s (sync): %s", scene_id, e)
+            raise
+
+    def merge_scene_metadata_sync(
+        self,
+        scene_id: str,
+        delta: Dict[str, Any],
+        display_names: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Merge keys into a scene's metadata on the database side.
+
+        Uses JSONB concatenation so concurrent writers never drop each other's
+        keys and only the delta is sent over the wire.
+
+        Args:
+            scene_id: Scene to update
+            delta: Top-level metadata keys to merge
+            display_names: Entries to merge into the nested npc_display_names map
+
+        Returns:
+            True if updated successfully, False if scene not found
+        """
+        merged = _merged_metadata_expr(delta, display_names)
+
+        try:
+            with self.db_manager.get_sync_session() as session:
+                updated = session.execute(
+                    _scene_update_stmt(scene_id, {"scene_metadata": merged})
+                ).scalar_one_or_none()
+                if updated is None:
+                    logger.warning("Scene %s not found or deleted (sync)", scene_id)
+                    return False
 
                 session.commit()
-                logger.info(f"Updated scene {scene_id} with fields: {list(updates.keys())} (sync)")
+                self._cache_evict_sync(scene_id)
+                logger.info("Merged metadata keys %s into scene %s (sync)", list(delta or {}), scene_id)
                 return True
 
-        except ValueError:
+        except Exception as e:
+            logger.error("Error merging metadata for scene %s (sync): %s", scene_id, e)
             raise
+
+    def apply_scene_update_sync(
+        self,
+        scene_id: str,
+        updates: Dict[str, Any],
+        participants: Sequence[Tuple[str, str, str, bool]] = (),
+        metadata_delta: Optional[Dict[str, Any]] = None,
+        display_names: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Apply column updates, a metadata merge and participant upserts in one statement.
+
+        The scene UPDATE runs in a CTE and the participant upsert selects from
+        it, so the whole change is one round-trip and one transaction, and no
+        participants are written when the scene is missing or deleted.
+
+        Args:
+            scene_id: Scene to update
+            updates: Mutable column values to set
+            participants: (character_id, display_name, role, is_original) tuples to upsert
+            metadata_delta: Top-level metadata keys to merge
+            display_names: Entries to merge into the nested npc_display_names map
+
+        Returns:
+            True if updated successfully, False if scene not found
+
+        Raises:
+            ValueError: If updates include immutable fields
+        """
+        if not updates.keys() <= _MUTABLE_FIELDS:
+            _raise_immutable_fields(updates)
+
+        if metadata_delta or display_names:
+            updates = {
+                **updates,
+                "scene_metadata": _merged_metadata_expr(metadata_delta, display_names),
+            }
+        scene_update = _scene_update_stmt(scene_id, updates)
+
+        if participants:
+            stmt = _participant_upsert_stmt(scene_update, participants)
+        else:
+            stmt = scene_update
+
+        try:
+            with self.db_manager.get_sync_session() as session:
+                applied = session.execute(stmt).first()
+                if applied is None:
+                    logger.warning("Scene %s not found or deleted (sync)", scene_id)
+                    return False
+
+                session.commit()
+                self._cache_evict_sync(scene_id)
+                logger.info(
+                    "Applied update to scene %s: fields=%s, participants=%d (sync)",
+                    scene_id, list(updates.keys()), len(participants),
+                )
+                return True
+
         except Exception as e:
-            logger.error(f"Error updating scene {scene_id} (sync): {e}")
+            logger.error("Error applying update to scene %s (sync): %s", scene_id, e)
             raise
 
     def get_recent_scenes_sync(
-        self, campaign_id: uuid.UUID, limit: int = 5
+        self,
+        campaign_id: uuid.UUID,
+        limit: int = 5,
+        eager_strategy: EagerStrategy = "select",
     ) -> List[SceneInfo]:
         """Synchronous version of get_recent_scenes."""
         try:
             with self.db_manager.get_sync_session() as session:
-                stmt = (
-                    select(Scene)
-                    .where(
-                        and_(
-                            Scene.campaign_id == campaign_id,
-                            Scene.is_deleted == False,
-                        )
-                    )
-                    .order_by(Scene.scene_timestamp.desc())
-                    .limit(limit)
-                    .options(selectinload(Scene.entities))
-                )
+                return _select_recent_scenes(session, campaign_id, limit, eager_strategy)
 
-                result = session.execute(stmt)
-                scenes = result.scalars().all()
+        except Exception as e:
+            logger.error("Error getting recent scenes for campaign %s (sync): %s", campaign_id, e)
+            raise
 
-                return [scene.to_scene_info() for scene in scenes]
+    def get_recent_scene_summaries_sync(
+        self,
+        campaign_id: uuid.UUID,
+        limit: int = 5,
+        fields: Optional[Sequence[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of get_recent_scene_summaries."""
+        try:
+            with self.db_manager.get_sync_session() as session:
+                return _select_recent_summaries(session, campaign_id, limit, fields)
 
         except Exception as e:
-            logger.error(f"Error getting recent scenes for campaign {campaign_id} (sync): {e}")
+            logger.error("Error getting recent scene summaries for campaign %s (sync): %s", campaign_id, e)
             raise
 
     def add_participant_sync(
@@ -542,57 +1135,44 @@ class SceneRepository:
         Returns:
             True if successful, False if scene not found
         """
+        return self.add_participants_bulk_sync(
+            scene_id, [(character_id, display_name, role, is_original)]
+        )
+
+    def add_participants_bulk_sync(
+        self,
+        scene_id: str,
+        participants: Sequence[Tuple[str, str, str, bool]],
+    ) -> bool:
+        """Add several participants to a scene with a single multi-row upsert.
+
+        Existing participants are marked present again with their role and
+        display name refreshed; new ones are inserted as SceneEntity records.
+
+        Args:
+            scene_id: Scene identifier
+            participants: (character_id, display_name, role, is_original) tuples
+
+        Returns:
+            True if successful, False if scene not found
+        """
+        if not participants:
+            return True
+
         try:
             with self.db_manager.get_sync_session() as session:
-                # Load scene
-                scene = session.get(Scene, scene_id)
-                if not scene or scene.is_deleted:
-                    logger.warning(f"Scene {scene_id} not found or deleted (sync)")
+                # Touch the scene and upsert in one statement
+                if not _upsert_participants(session, scene_id, participants):
+                    logger.warning("Scene %s not found or deleted (sync)", scene_id)
                     return False
 
-                # Check if entity already exists
-                existing = session.execute(
-                    select(SceneEntity).where(
-                        and_(
-                            SceneEntity.scene_id == scene_id,
-                            SceneEntity.entity_id == character_id,
-                            SceneEntity.entity_type == "character",
-                        )
-                    )
-                ).scalar_one_or_none()
-
-                if existing:
-                    # Update existing entity
-                    existing.is_present = True
-                    existing.left_at = None
-                    existing.role = role
-                    existing.entity_metadata = {
-                        **(existing.entity_metadata or {}),
-                        "display_name": display_name,
-                    }
-                    logger.info(f"Updated existing participant {character_id} in scene {scene_id}")
-                else:
-                    # Create new entity
-                    entity = SceneEntity(
-                        scene_id=scene_id,
-                        entity_id=character_id,
-                        entity_type="character",
-                        is_present=True,
-                        role=role,
-                        entity_metadata={
-                            "is_original": is_original,
-                            "display_name": display_name,
-                        },
-                    )
-                    session.add(entity)
-                    logger.info(f"Added participant {character_id} to scene {scene_id}")
-
-                scene.last_updated = datetime.now(timezone.utc)
                 session.commit()
+                self._cache_evict_sync(scene_id)
+                logger.info("Upserted %s participants in scene %s", len(participants), scene_id)
                 return True
 
         except Exception as e:
-            logger.error(f"Error adding participant {character_id} to scene {scene_id} (sync): {e}")
+            logger.error("Error adding participants to scene %s (sync): %s", scene_id, e)
             raise
 
     def get_entities_in_scene_sync(
@@ -613,18 +1193,27 @@ class SceneRepository:
         """
         try:
             with self.db_manager.get_sync_session() as session:
-                conditions = [SceneEntity.scene_id == scene_id]
-
-                if entity_type:
-                    conditions.append(SceneEntity.entity_type == entity_type)
+                return _select_entities(session, scene_id, entity_type, present_only)
 
-                if present_only:
-                    conditions.append(SceneEntity.is_present == True)
+        except Exception as e:
+            logger.error("Error getting entities for scene %s (sync): %s", scene_id, e)
+            raise
 
-                stmt = select(SceneEntity).where(and_(*conditions))
-                result = session.execute(stmt)
-                return list(result.scalars().all())
+    def iter_entities_in_scene_sync(
+        self,
+        scene_id: str,
+        entity_type: Optional[str] = None,
+        present_only: bool = True,
+    ) -> Iterator[SceneEntity]:
+        """Synchronous version of iter_entities_in_scene."""
+        stmt = _entities_stmt(scene_id, entity_type, present_only).execution_options(
+            yield_per=_ENTITY_BATCH_SIZE
+        )
+        try:
+            with self.db_manager.get_sync_session() as session:
+                for partition in session.execute(stmt).scalars().partitions():
+                    yield from partition
 
         except Exception as e:
-            logger.error(f"Error getting entities for scene {scene_id} (sync): {e}")
+            logger.error("Error streaming entities for scene %s (sync): %s", scene_id, e)
             raise
@@ -235,7 +235,7 @@ class CampaignSummarizer:
             Generated summary dict
         """
         # Load campaign history
-        history = self.campaign_manager.load_campaign_history(campaign_id)
+        history = self.campaign_manager.load_campaign_history(campaign_id, mutable=False)
         
         if not history:
             logger.warning(f"No history found for campaign {campaign_id}")
@@ -443,7 +443,7 @@ Remember to return your response in the structured JSON format specified in your
         turn_number = 0
         if campaign_data:
             # Try to get turn number from campaign data
-            turn_number = len(self.campaign_manager.load_campaign_history(campaign_id)) // 2  # Rough estimate
+            turn_number = len(self.campaign_manager.load_campaign_history(campaign_id, mutable=False)) // 2  # Rough estimate
         
         # Generate summary of entire campaign
         summary = await self.generate_summary(
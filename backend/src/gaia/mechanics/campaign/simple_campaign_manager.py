@@ -1,14 +1,24 @@
 """
 Simple Campaign Manager V2 - Uses new directory structure: campaigns/ID - Name/logs/ and /data/
 """
+import atexit
+import functools
+import hashlib
 import json
 import logging
 import uuid
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 from datetime import datetime, timezone
+import os
 import re
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 from gaia.utils.singleton import SingletonMeta
 from gaia_private.session.session_storage import SessionStorage
@@ -18,6 +28,88 @@ from gaia.models import CampaignData, GameStyle, GameTheme
 
 logger = logging.getLogger(__name__)
 
+# Backstop for writers outside this process (other workers, GCS); in-process
+# writes invalidate the list cache directly.
+_LIST_CACHE_TTL = 30.0
+
+_CAMPAIGN_PREFIX = "campaign_"
+_CAMPAIGN_ID_RE = re.compile(r"(campaign_\d+)")
+_CAMPAIGN_DIRNAME_RE = re.compile(r"(campaign_\d+)(?:\s*-\s*(.+))?")
+# Legacy directory names: drop punctuation, then collapse dash/space runs
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^\w\s-]")
+_NAME_SEPARATOR_RUN_RE = re.compile(r"[-\s]+")
+
+_UTC = timezone.utc
+
+# Chat history is stored as JSON Lines so saves can append; the JSON-array
+# file is still read (and migrated on first load) for older campaigns.
+_HISTORY_FILENAME = "chat_history.jsonl"
+_LEGACY_HISTORY_FILENAME = "chat_history.json"
+_HISTORY_LINE_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+def _history_line_digest(line: bytes) -> bytes:
+    """Fingerprint of one serialized history line, to detect edits to the last message."""
+    return hashlib.blake2b(line, digest_size=16).digest()
+
+
+# Local histories are revalidated by file (mtime, size) on every hit; the TTL
+# only bounds how long a history read from the object store is reused.
+_HISTORY_CACHE_SIZE = 32
+_HISTORY_CACHE_TTL = 30.0
+
+# fsync campaign files before the atomic rename or after an append (durability over throughput)
+_CAMPAIGN_FSYNC = os.getenv("CAMPAIGN_FSYNC", "false").lower() == "true"
+
+# Deleted campaign directories are renamed with this prefix, then removed in the background
+_TRASH_PREFIX = ".trash-"
+
+# Seconds a store mirror waits before uploading so that bursts of saves to the
+# same path collapse into one write (0 uploads immediately)
+_MIRROR_DELAY = float(os.getenv("CAMPAIGN_MIRROR_DELAY", "0.5"))
+
+# Pointer to the highest-numbered turn, kept next to the turn files. Turn files
+# never start with "_", so listings skip it.
+_CURRENT_TURN_FILENAME = "_current.json"
+
+# Turn files are compact JSON; GAIA_PRETTY_JSON=1 indents them for manual inspection
+_TURN_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+if os.getenv("GAIA_PRETTY_JSON", "false").lower() in ("1", "true"):
+    _TURN_JSON_OPTIONS |= orjson.OPT_INDENT_2
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a temp file and os.replace so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+            if _CAMPAIGN_FSYNC:
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(candidate: str) -> Optional[datetime]:
+    """Parse a stripped ISO-8601 string into an aware UTC datetime.
+
+    list_campaigns parses the same metadata timestamps on every call, so results
+    are memoized; datetimes are immutable and safe to share.
+    """
+    if candidate.endswith("Z"):
+        candidate = candidate[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(candidate)
+    except Exception:  # noqa: BLE001
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=_UTC)
+    return parsed.astimezone(_UTC)
+
 
 class SimpleCampaignManager(metaclass=SingletonMeta):
     """Simple campaign manager that stores campaigns in their own directories."""
@@ -40,24 +132,20 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             candidate = value.strip()
             if not candidate:
                 return None
-            if candidate.endswith("Z"):
-                candidate = candidate[:-1] + "+00:00"
-            try:
-                parsed = datetime.fromisoformat(candidate)
-            except Exception:  # noqa: BLE001
-                return None
-            if parsed.tzinfo is None:
-                return parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc)
+            return _parse_iso_timestamp(candidate)
         return None
 
     @classmethod
     def _max_timestamp(cls, *values: Optional[Any]) -> Optional[datetime]:
-        parsed = [cls._parse_timestamp(v) for v in values]
-        parsed = [p for p in parsed if p is not None]
-        if not parsed:
-            return None
-        return max(parsed)
+        parse = cls._parse_timestamp
+        best = None
+        for value in values:
+            if value is None:
+                continue
+            parsed = parse(value)
+            if parsed is not None and (best is None or parsed > best):
+                best = parsed
+        return best
 
     def __init__(self, base_path: Optional[str] = None):
         """Initialize the campaign manager.
@@ -75,15 +163,266 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         self.legacy_base_path = self.storage.legacy_base
         self._store = get_campaign_store(self.storage)
         
-        # Simple cache to avoid duplicate loads
-        self._history_cache = {}
-        self._cache_timestamp = {}
+        # LRU of loaded histories: campaign_id -> (path, file version, loaded_at, messages)
+        # Messages are held as tuples so callers cannot reorder or extend the cached copy.
+        self._history_cache: OrderedDict[
+            str, Tuple[Optional[Path], Optional[Tuple[int, int]], float, Tuple[Dict[str, Any], ...]]
+        ] = OrderedDict()
         self._character_managers: Dict[str, CharacterManager] = {}
         self._active_campaigns: Dict[str, CampaignData] = {}
+        # Unsorted campaign entries from the last list_campaigns scan
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        # The same entries keyed by campaign id, for get_campaign_info
+        self._list_cache_by_id: Dict[str, Dict[str, Any]] = {}
+        self._list_cache_key: Optional[tuple] = None
+        self._list_cache_at = 0.0
+        # Parsed metadata keyed by campaign_id, tagged with the local file's mtime_ns
+        self._metadata_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # GCS mirroring runs off the save path; the local write is already durable.
+        # Only the newest payload per store path is kept while a mirror is in flight.
+        self._mirror_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="campaign-mirror")
+        self._mirror_lock = threading.Lock()
+        self._pending_mirrors: Dict[Tuple[str, ...], Any] = {}
+        self._active_mirrors: set[Tuple[str, ...]] = set()
+        # (size, line count, last line digest) of each JSONL history last seen on disk
+        self._history_state: Dict[str, Tuple[int, int, Optional[bytes]]] = {}
+        # Highest saved turn_number per campaign (also persisted as metadata "max_turn")
+        self._max_turn: Dict[str, int] = {}
+        # Resolved session directories; an entry is dropped once its directory is gone
+        self._dir_cache: Dict[str, Path] = {}
+        atexit.register(self._mirror_pool.shutdown, wait=True)
+        self._sweep_trash()
+
+    def _sweep_trash(self) -> None:
+        """Remove deleted campaign directories whose background removal never ran."""
+        for root in (self.base_path, self.legacy_base_path):
+            if not root:
+                continue
+            try:
+                with os.scandir(root) as entries:
+                    trash = [entry.path for entry in entries if entry.name.startswith(_TRASH_PREFIX)]
+            except OSError:
+                continue
+            for path in trash:
+                self._mirror_pool.submit(shutil.rmtree, path, ignore_errors=True)
+
+    def _list_cache_token(self) -> tuple:
+        """Return directory mtimes that change when campaigns are added or removed."""
+        token = []
+        for path in (self.base_path, self.legacy_base_path):
+            try:
+                token.append(os.stat(path).st_mtime_ns if path else None)
+            except OSError:
+                token.append(None)
+        return tuple(token)
+
+    def _invalidate_list_cache(self) -> None:
+        self._list_cache = None
+        self._list_cache_key = None
+        self._list_cache_by_id = {}
+
+    def _cached_campaigns(self) -> List[Dict[str, Any]]:
+        """Return the unsorted campaign entries, rescanning when the cache is stale.
+
+        The returned list and its entries are shared with the cache and must not
+        be mutated.
+        """
+        cache_key = self._list_cache_token()
+        if (
+            self._list_cache is None
+            or cache_key != self._list_cache_key
+            or time.monotonic() - self._list_cache_at >= _LIST_CACHE_TTL
+        ):
+            campaigns = self._scan_campaigns()
+            self._list_cache = campaigns
+            self._list_cache_by_id = {campaign["id"]: campaign for campaign in campaigns}
+            self._list_cache_key = cache_key
+            self._list_cache_at = time.monotonic()
+        return self._list_cache
+
+    def _mirror_enabled(self) -> bool:
+        """Whether the store has a remote mirror (GCS) that _mirror_json would write to."""
+        return bool(self._store) and self._store.mirror_enabled
+
+    def _mirror_json(self, payload: Any, *relative_parts: str) -> None:
+        """Queue a store mirror write, replacing any queued payload for the same path.
+
+        Callers should check _mirror_enabled() before building the payload.
+        """
+        if not self._mirror_enabled():
+            return
+        key = tuple(relative_parts)
+        with self._mirror_lock:
+            self._pending_mirrors[key] = payload
+            if key in self._active_mirrors:
+                return
+            self._active_mirrors.add(key)
+        if _MIRROR_DELAY > 0:
+            # Non-daemon, so interpreter shutdown waits for the delayed upload
+            threading.Timer(_MIRROR_DELAY, self._submit_drain, args=(key,)).start()
+        else:
+            self._submit_drain(key)
+
+    def _submit_drain(self, key: Tuple[str, ...]) -> None:
+        try:
+            self._mirror_pool.submit(self._drain_mirror, key)
+        except RuntimeError:
+            # Executor already shut down (interpreter exit): upload on this thread
+            self._drain_mirror(key)
+
+    def _drain_mirror(self, key: Tuple[str, ...]) -> None:
+        # One drain per path at a time keeps mirror writes in save order.
+        while True:
+            with self._mirror_lock:
+                if key not in self._pending_mirrors:
+                    self._active_mirrors.discard(key)
+                    return
+                payload = self._pending_mirrors.pop(key)
+            try:
+                self._store.mirror_json(payload, *key)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Campaign store mirror failed for %s: %s", "/".join(key), exc)
+
+    @staticmethod
+    def _find_history_file(campaign_dir: Path) -> Optional[Tuple[Path, os.stat_result]]:
+        """Locate a campaign's chat history file, preferring the JSONL log."""
+        for path in (
+            campaign_dir / "logs" / _HISTORY_FILENAME,
+            campaign_dir / "logs" / _LEGACY_HISTORY_FILENAME,
+            campaign_dir / _LEGACY_HISTORY_FILENAME,
+        ):
+            try:
+                return path, os.stat(path)
+            except OSError:
+                continue
+        return None
+
+    @staticmethod
+    def _read_history_file(path: Path) -> List[Dict[str, Any]]:
+        raw = path.read_bytes()
+        if path.name != _HISTORY_FILENAME:
+            payload = orjson.loads(raw)
+            if isinstance(payload, dict):
+                # Some older histories may be wrapped
+                payload = payload.get("messages")
+            return payload if isinstance(payload, list) else []
+
+        messages = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                messages.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # Most likely a partial line from an interrupted append
+                logger.warning("Skipping unreadable chat history line in %s", path)
+        return messages
+
+    def _write_history(self, campaign_id: str, history_file: Path, messages: List[Dict[str, Any]]) -> None:
+        """Rewrite the JSONL history in full and drop any legacy JSON-array copies."""
+        _atomic_write_bytes(history_file, b"".join(orjson.dumps(m, option=_HISTORY_LINE_OPTS) for m in messages))
+        campaign_dir = history_file.parent.parent
+        for legacy in (history_file.parent / _LEGACY_HISTORY_FILENAME, campaign_dir / _LEGACY_HISTORY_FILENAME):
+            legacy.unlink(missing_ok=True)
+        self._record_history_state(campaign_id, history_file, messages)
+
+    def _record_history_state(self, campaign_id: str, history_file: Path, messages: List[Dict[str, Any]]) -> None:
+        last_digest = (
+            _history_line_digest(orjson.dumps(messages[-1], option=_HISTORY_LINE_OPTS)) if messages else None
+        )
+        self._history_state[campaign_id] = (os.stat(history_file).st_size, len(messages), last_digest)
+
+    def _persisted_history_state(self, campaign_id: str, history_file: Path) -> Optional[Tuple[int, Optional[bytes]]]:
+        """Return (line count, last line digest) of the JSONL history, or None if it cannot be appended to."""
+        try:
+            size = os.stat(history_file).st_size
+        except OSError:
+            return None
+        cached = self._history_state.get(campaign_id)
+        if cached and cached[0] == size:
+            return cached[1], cached[2]
+
+        raw = history_file.read_bytes()
+        if raw and not raw.endswith(b"\n"):
+            # Interrupted append; rewrite rather than extend a partial line
+            return None
+        count = raw.count(b"\n")
+        last_digest = None
+        if count:
+            last_line = raw[raw.rfind(b"\n", 0, len(raw) - 1) + 1:]
+            try:
+                orjson.loads(last_line)
+            except orjson.JSONDecodeError:
+                return None
+            last_digest = _history_line_digest(last_line)
+        self._history_state[campaign_id] = (size, count, last_digest)
+        return count, last_digest
+
+    @staticmethod
+    def _file_version(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _cache_history(
+        self, campaign_id: str, path: Optional[Path], messages: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], ...]:
+        version = self._file_version(path) if path is not None else None
+        frozen = tuple(messages)
+        self._history_cache[campaign_id] = (path, version, time.monotonic(), frozen)
+        self._history_cache.move_to_end(campaign_id)
+        while len(self._history_cache) > _HISTORY_CACHE_SIZE:
+            self._history_cache.popitem(last=False)
+        return frozen
+
+    def _read_store_metadata(self, campaign_id: str) -> Dict[str, Any]:
+        """Read store metadata, reusing the parsed copy while the local file is unchanged.
+
+        The returned dict may be shared with the cache and must not be mutated.
+        """
+        metadata_path = self.storage.metadata_path(campaign_id)
+        try:
+            mtime_ns = os.stat(metadata_path).st_mtime_ns if metadata_path else None
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            cached = self._metadata_cache.get(campaign_id)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+        else:
+            self._metadata_cache.pop(campaign_id, None)
 
-    def _update_metadata(self, campaign_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        md = self._store.read_json("metadata", f"{campaign_id}.json") if self._store else None
+        if not isinstance(md, dict):
+            md = {}
+        if mtime_ns is not None:
+            self._metadata_cache[campaign_id] = (mtime_ns, md)
+        return md
+
+    def _update_metadata(
+        self,
+        campaign_id: str,
+        updates: Dict[str, Any],
+        existing: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Apply metadata updates locally and to the campaign store.
+
+        Args:
+            campaign_id: Campaign identifier
+            updates: Fields to merge into the metadata
+            existing: Current store metadata if the caller already read it; it is
+                updated in place and the store re-read is skipped
+
+        Returns:
+            The merged store payload (empty when no store is configured)
+        """
         if not updates:
             return {}
+        self._invalidate_list_cache()
+        self._metadata_cache.pop(campaign_id, None)
         try:
             self.storage.save_metadata(campaign_id, updates)
         except FileNotFoundError:
@@ -94,30 +433,42 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
 
         store_payload: Dict[str, Any] = {}
         if self._store:
-            existing = self._store.read_json("metadata", f"{campaign_id}.json")
+            if existing is None:
+                existing = self._store.read_json("metadata", f"{campaign_id}.json")
             if not isinstance(existing, dict):
                 existing = {}
             existing.update(updates)
             existing["campaign_id"] = campaign_id
             self._store.write_json(existing, "metadata", f"{campaign_id}.json")
             store_payload = existing
+            metadata_path = self.storage.metadata_path(campaign_id)
+            try:
+                if metadata_path:
+                    self._metadata_cache[campaign_id] = (os.stat(metadata_path).st_mtime_ns, existing)
+            except OSError:
+                pass
         return store_payload
 
     def mark_campaign_loaded(self, campaign_id: str) -> None:
         # Normalize campaign ID to bare campaign_<number> format
-        match = re.match(r"(campaign_\d+)", campaign_id.strip() if campaign_id else "")
-        normalized_id = match.group(1) if match else campaign_id
+        cid = campaign_id.strip() if campaign_id else ""
+        if cid.startswith(_CAMPAIGN_PREFIX) and cid[len(_CAMPAIGN_PREFIX):].isdecimal():
+            normalized_id = cid
+        else:
+            match = _CAMPAIGN_ID_RE.match(cid)
+            normalized_id = match.group(1) if match else campaign_id
 
         now_iso = datetime.now(timezone.utc).isoformat()
-        existing_store = self._store.read_json("metadata", f"{normalized_id}.json") if self._store else {}
-        if not isinstance(existing_store, dict):
-            existing_store = {}
-        try:
-            local_md = self.storage.load_metadata(normalized_id)
-            if isinstance(local_md, dict):
-                existing_store.update(local_md)
-        except FileNotFoundError:
-            pass
+        # The store reads the same local metadata file first, so the separate
+        # local read is only needed when the store has nothing.
+        existing_store = dict(self._read_store_metadata(normalized_id))
+        if not existing_store:
+            try:
+                local_md = self.storage.load_metadata(normalized_id)
+                if isinstance(local_md, dict):
+                    existing_store.update(local_md)
+            except FileNotFoundError:
+                pass
 
         last_messaged = existing_store.get("last_messaged_at") or existing_store.get("last_played")
         last_played_dt = self._max_timestamp(last_messaged, now_iso)
@@ -127,7 +478,7 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         }
         if last_played_dt:
             updates["last_played"] = last_played_dt.isoformat()
-        self._update_metadata(normalized_id, updates)
+        self._update_metadata(normalized_id, updates, existing=existing_store)
     
     def _get_campaign_dir(
         self,
@@ -158,7 +509,7 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             Tuple of (campaign_id, campaign_name)
         """
         # Try to match pattern "campaign_X - Name"
-        match = re.match(r'(campaign_\d+)(?:\s*-\s*(.+))?', dirname)
+        match = _CAMPAIGN_DIRNAME_RE.match(dirname)
         if match:
             campaign_id = match.group(1)
             campaign_name = match.group(2)
@@ -184,7 +535,28 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         Returns:
             Path to campaign directory or None if not found
         """
-        return self.storage.resolve_session_dir(campaign_id)
+        cached = self._dir_cache.get(campaign_id)
+        if cached is not None:
+            if cached.is_dir():
+                return cached
+            del self._dir_cache[campaign_id]
+        path = self.storage.resolve_session_dir(campaign_id)
+        if path is not None:
+            self._dir_cache[campaign_id] = path
+        return path
+
+    def _ensure_campaign_subdir(self, campaign_id: str, subdir: str) -> Path:
+        """Return (creating if needed) a subdirectory of an existing campaign.
+
+        Raises:
+            FileNotFoundError: If the campaign directory does not exist
+        """
+        campaign_dir = self._find_campaign_dir(campaign_id)
+        if campaign_dir is None:
+            return self.storage.ensure_subdir(campaign_id, subdir)
+        path = campaign_dir / subdir
+        path.mkdir(parents=True, exist_ok=True)
+        return path
     
     def get_next_campaign_id(self) -> str:
         """Get the next sequential campaign ID.
@@ -197,10 +569,16 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         
         # Extract numbers from existing campaign IDs
         numbers = []
+        prefix_len = len(_CAMPAIGN_PREFIX)
         for campaign in existing:
-            match = re.match(r'campaign_(\d+)', campaign['id'])
+            campaign_id = campaign['id']
+            suffix = campaign_id[prefix_len:]
+            if campaign_id.startswith(_CAMPAIGN_PREFIX) and suffix.isdecimal():
+                numbers.append(int(suffix))
+                continue
+            match = _CAMPAIGN_ID_RE.match(campaign_id)
             if match:
-                numbers.append(int(match.group(1)))
+                numbers.append(int(match.group(1)[prefix_len:]))
         
         # Find the next number
         next_num = max(numbers) + 1 if numbers else 1
@@ -209,40 +587,48 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         logger.info(f"🆕 Generated next campaign ID: {campaign_id} for environment: {self.environment_name}")
         return campaign_id
     
-    def list_campaigns(self, sort_by: str = "last_played", ascending: bool = False, 
-                      limit: int = 100, offset: int = 0) -> Dict[str, Any]:
-        """List all campaigns with pagination and sorting.
-        
-        Args:
-            sort_by: Field to sort by ("last_played", "name", "message_count")
-            ascending: Sort in ascending order if True
-            limit: Maximum number of campaigns to return
-            offset: Number of campaigns to skip
-            
-        Returns:
-            Dict with campaigns list and total count
+    def _session_dirnames(self) -> Dict[str, str]:
+        """Map session IDs to directory names with one listing per storage root.
+
+        New-layout directories win over legacy ``campaign_X - Name`` ones.
         """
+        dirname_by_id: Dict[str, str] = {}
+        for root in (self.legacy_base_path, self.base_path):
+            if not root:
+                continue
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(_TRASH_PREFIX) or not entry.is_dir():
+                            continue
+                        match = _CAMPAIGN_DIRNAME_RE.match(entry.name)
+                        dirname_by_id[match.group(1) if match else entry.name] = entry.name
+            except OSError:
+                continue
+        return dirname_by_id
+
+    def _scan_campaigns(self) -> List[Dict[str, Any]]:
+        """Build the unsorted campaign entries from metadata and session directories."""
         campaigns: List[Dict[str, Any]] = []
         seen_ids: set[str] = set()
+        max_timestamp = self._max_timestamp
 
         metadata_entries = self._store.list_json_prefix("metadata") if self._store else []
+        dirname_by_id = self._session_dirnames() if metadata_entries else {}
         for entry in metadata_entries:
             session_id = Path(entry).stem
             if session_id in seen_ids:
                 continue
             try:
-                md = self._store.read_json("metadata", entry) if self._store else None
-                if not isinstance(md, dict):
-                    md = {}
+                md = self._read_store_metadata(session_id)
                 display_name = md.get("name") or md.get("title") or session_id
                 last_messaged = md.get("last_messaged_at") or md.get("last_played") or md.get("updated_at")
                 last_loaded = md.get("last_loaded_at")
-                last_played_dt = self._max_timestamp(last_messaged, last_loaded, md.get("last_played"))
+                last_played_dt = max_timestamp(last_messaged, last_loaded, md.get("last_played"))
                 if last_played_dt is None:
                     last_played_dt = datetime.now()
                 message_count = int(md.get("message_count", 0))
-                campaign_dir = self._find_campaign_dir(session_id)
-                directory_name = campaign_dir.name if campaign_dir else session_id
+                directory_name = dirname_by_id.get(session_id, session_id)
                 campaigns.append(
                     {
                         "id": session_id,
@@ -259,30 +645,38 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Error parsing campaign metadata for %s: %s", session_id, exc)
 
+        if metadata_entries and dirname_by_id.keys() <= seen_ids:
+            # Every session directory already has metadata; nothing left to discover
+            return campaigns
+
         for session_id, campaign_dir, is_legacy in self.storage.iter_session_dirs():
-            if session_id in seen_ids:
+            if session_id in seen_ids or campaign_dir.name.startswith(_TRASH_PREFIX):
                 continue
 
             try:
-                log_file = campaign_dir / "logs" / "chat_history.json"
-                if not log_file.exists():
-                    log_file = campaign_dir / "chat_history.json"
+                history = self._find_history_file(campaign_dir)
+                log_file, log_mtime = (history[0], history[1].st_mtime) if history else (None, None)
 
                 message_count = 0
                 last_modified = datetime.fromtimestamp(campaign_dir.stat().st_mtime, tz=timezone.utc)
 
-                last_message_ts = None
-                if log_file.exists():
-                    with open(log_file, "r", encoding="utf-8") as fh:
-                        messages = json.load(fh)
-                        if isinstance(messages, list):
-                            message_count = len(messages)
-                            if messages:
-                                last_message_ts = messages[-1].get("timestamp")
-                    last_modified = datetime.fromtimestamp(log_file.stat().st_mtime, tz=timezone.utc)
-
                 metadata = self.storage.load_metadata(session_id)
 
+                last_message_ts = None
+                needs_backfill = False
+                if log_mtime is not None:
+                    if isinstance(metadata, dict) and isinstance(metadata.get("message_count"), int):
+                        # Counts are persisted by save_campaign; no need to parse the history
+                        message_count = metadata["message_count"]
+                        last_message_ts = metadata.get("last_messaged_at")
+                    else:
+                        messages = self._read_history_file(log_file)
+                        message_count = len(messages)
+                        if messages:
+                            last_message_ts = messages[-1].get("timestamp")
+                        needs_backfill = True
+                    last_modified = datetime.fromtimestamp(log_mtime, tz=timezone.utc)
+
                 # Skip campaigns with corrupted metadata AND no chat history
                 # (likely partially deleted or corrupted campaigns)
                 if not metadata and not is_legacy and message_count == 0:
@@ -309,10 +703,24 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
                     last_loaded = None
                     legacy_last_played = None
 
-                last_played_dt = self._max_timestamp(last_message_ts, last_loaded, legacy_last_played, last_modified.isoformat())
+                last_played_dt = max_timestamp(last_message_ts, last_loaded, legacy_last_played, last_modified)
                 if last_played_dt is None:
                     last_played_dt = last_modified
 
+                if needs_backfill:
+                    # Persist what we just parsed so later listings take the metadata path
+                    backfill: Dict[str, Any] = {
+                        "message_count": message_count,
+                        "last_messaged_at": last_message_ts,
+                    }
+                    if not metadata:
+                        backfill["name"] = display_name
+                        backfill["last_played"] = last_played_dt.isoformat()
+                    try:
+                        self.storage.save_metadata(session_id, backfill)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.debug("Metadata backfill skipped for %s: %s", session_id, exc)
+
                 campaigns.append(
                     {
                         "id": session_id,
@@ -330,6 +738,23 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
                 logger.error("❌ Error reading campaign %s: %s", campaign_dir, exc)
                 continue
 
+        return campaigns
+
+    def list_campaigns(self, sort_by: str = "last_played", ascending: bool = False, 
+                      limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """List all campaigns with pagination and sorting.
+        
+        Args:
+            sort_by: Field to sort by ("last_played", "name", "message_count")
+            ascending: Sort in ascending order if True
+            limit: Maximum number of campaigns to return
+            offset: Number of campaigns to skip
+            
+        Returns:
+            Dict with campaigns list and total count
+        """
+        campaigns = list(self._cached_campaigns())
+
         # Sort campaigns
         if sort_by == "last_played":
             campaigns.sort(key=lambda x: (x.get("last_played_ts", 0), x["id"]), reverse=not ascending)
@@ -342,11 +767,11 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         
         # Apply pagination
         total_count = len(campaigns)
-        campaigns = campaigns[offset:offset + limit]
-        
-        # Remove helper fields before returning
-        for campaign in campaigns:
-            campaign.pop('last_played_ts', None)
+        # Copy page entries (the cache keeps the originals) without helper fields
+        campaigns = [
+            {k: v for k, v in campaign.items() if k != 'last_played_ts'}
+            for campaign in campaigns[offset:offset + limit]
+        ]
         
         logger.info(f"📋 Found {total_count} campaigns, returning {len(campaigns)} after pagination (offset: {offset}, limit: {limit})")
         return {
@@ -381,6 +806,7 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         campaign_data.custom_data["campaign_uuid"] = str(uuid.uuid4())
 
         self.storage.resolve_session_dir(session_id, create=True)
+        self._invalidate_list_cache()
 
         data_saved = self.save_campaign_data(session_id, campaign_data)
         if not data_saved:
@@ -405,7 +831,9 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             },
         )
 
-        self.get_character_manager(session_id)
+        # CharacterManager is built lazily by get_character_manager on first use;
+        # only lay out the characters directory it would have created.
+        self.get_campaign_characters_path(session_id)
 
         return {
             "campaign_id": session_id,
@@ -425,8 +853,6 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         Returns:
             CampaignData object or None if not found
         """
-        from gaia.models.campaign import CampaignData
-
         cached = self._active_campaigns.get(campaign_id)
         if cached:
             return cached
@@ -437,12 +863,11 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             metadata_file = campaign_dir / "data" / "campaign_data.json"
             if metadata_file.exists():
                 try:
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        campaign_data = CampaignData.from_dict(metadata)
-                        self._active_campaigns[campaign_id] = campaign_data
-                        logger.info(f"📖 Loaded campaign {campaign_id} metadata with current_scene_id: {campaign_data.current_scene_id}")
-                        return campaign_data
+                    metadata = orjson.loads(metadata_file.read_bytes())
+                    campaign_data = CampaignData.from_dict(metadata)
+                    self._active_campaigns[campaign_id] = campaign_data
+                    logger.info(f"📖 Loaded campaign {campaign_id} metadata with current_scene_id: {campaign_data.current_scene_id}")
+                    return campaign_data
                 except Exception as e:
                     logger.error(f"❌ Error loading campaign metadata: {e}")
         
@@ -491,14 +916,14 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             
             # Save campaign data to file
             metadata_file = data_dir / "campaign_data.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(campaign_data.to_dict(), f, indent=2, ensure_ascii=False, default=str)
-            # Mirror via unified store (local + GCS)
-            if self._store:
-                try:
-                    self._store.write_json(campaign_data.to_dict(), campaign_id, "data/campaign_data.json")
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("Campaign data store mirror failed for %s: %s", campaign_id, exc)
+            encoded = json.dumps(
+                campaign_data.to_dict(), indent=2, ensure_ascii=False, default=str
+            ).encode("utf-8")
+            _atomic_write_bytes(metadata_file, encoded)
+            # Mirror to GCS in the background from a decoded copy of what was written;
+            # to_dict() shares its containers with the live CampaignData
+            if self._mirror_enabled():
+                self._mirror_json(json.loads(encoded), campaign_id, "data/campaign_data.json")
             
             logger.info(f"💾 Saved campaign data for {campaign_id} with current_scene_id: {campaign_data.current_scene_id}")
             self._active_campaigns[campaign_id] = campaign_data
@@ -514,62 +939,76 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             self._character_managers[campaign_id] = CharacterManager(campaign_id)
         return self._character_managers[campaign_id]
     
-    def load_campaign_history(self, campaign_id: str) -> List[Dict[str, Any]]:
+    def load_campaign_history(self, campaign_id: str, mutable: bool = True) -> Sequence[Dict[str, Any]]:
         """Load campaign chat history from disk.
         
         Args:
             campaign_id: Campaign identifier
+            mutable: Return a fresh list the caller may reorder or extend. Pass
+                False for read-only access to get the shared cached tuple
+                without copying.
             
         Returns:
-            List of message dictionaries
+            List (or tuple, when mutable is False) of message dictionaries
         """
-        # Check cache first (with 1-second expiry to avoid stale data)
-        import time
-        current_time = time.time()
-        if campaign_id in self._history_cache:
-            cache_age = current_time - self._cache_timestamp.get(campaign_id, 0)
-            if cache_age < 1.0:  # 1 second cache
-                logger.debug(f"📦 Using cached history for {campaign_id} (age: {cache_age:.3f}s)")
-                return self._history_cache[campaign_id]
-        
+        cached = self._history_cache.get(campaign_id)
+        if cached:
+            path, version, loaded_at, messages = cached
+            if path is not None:
+                fresh = self._file_version(path) == version
+            else:
+                fresh = time.monotonic() - loaded_at < _HISTORY_CACHE_TTL
+            if fresh:
+                self._history_cache.move_to_end(campaign_id)
+                logger.debug("📦 Using cached history for %s", campaign_id)
+                return list(messages) if mutable else messages
+            del self._history_cache[campaign_id]
+
         # Local path attempt
         campaign_dir = self._find_campaign_dir(campaign_id)
         if campaign_dir:
-            log_file = campaign_dir / "logs" / "chat_history.json"
-            if not log_file.exists():
-                log_file = campaign_dir / "chat_history.json"
-            if log_file.exists():
+            history = self._find_history_file(campaign_dir)
+            if history:
+                log_file = history[0]
                 try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        messages = json.load(f)
-                        self._history_cache[campaign_id] = messages
-                        self._cache_timestamp[campaign_id] = current_time
-                        return messages
+                    messages = self._read_history_file(log_file)
                 except Exception as e:
                     logger.error(f"❌ Error loading campaign {campaign_id}: {e}")
                     return []
+                if log_file.name == _LEGACY_HISTORY_FILENAME:
+                    # Migrate to the append-only layout on first load
+                    try:
+                        logs_dir = campaign_dir / "logs"
+                        logs_dir.mkdir(parents=True, exist_ok=True)
+                        self._write_history(campaign_id, logs_dir / _HISTORY_FILENAME, messages)
+                        log_file = logs_dir / _HISTORY_FILENAME
+                        logger.info("Migrated chat history for %s to %s", campaign_id, _HISTORY_FILENAME)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning("Chat history migration failed for %s: %s", campaign_id, exc)
+                frozen = self._cache_history(campaign_id, log_file, messages)
+                return messages if mutable else frozen
 
         # Object store fallback (via unified store)
         if self._store:
             payload = self._store.read_json(campaign_id, "logs/chat_history.json")
-            if isinstance(payload, list):
-                self._history_cache[campaign_id] = payload
-                self._cache_timestamp[campaign_id] = current_time
-                return payload
-            elif isinstance(payload, dict):
+            if isinstance(payload, dict):
                 # Some older histories may be wrapped
-                messages = payload.get("messages") if isinstance(payload, dict) else None
-                if isinstance(messages, list):
-                    self._history_cache[campaign_id] = messages
-                    self._cache_timestamp[campaign_id] = current_time
-                    return messages
+                payload = payload.get("messages")
+            if isinstance(payload, list):
+                frozen = self._cache_history(campaign_id, None, payload)
+                return payload if mutable else frozen
 
         logger.info(f"🆕 Campaign {campaign_id} has no history yet")
-        return []
+        return [] if mutable else ()
     
     def save_campaign(self, campaign_id: str, messages: List[Dict[str, Any]], 
                      name: Optional[str] = None) -> bool:
         """Save campaign history to disk.
+
+        New messages are appended to the JSONL log. Messages already on disk
+        are not rewritten, except that an edit to the last persisted message
+        triggers a full rewrite. In-place edits to earlier messages are only
+        persisted when the history is rewritten in full for another reason.
         
         Args:
             campaign_id: Campaign identifier
@@ -611,29 +1050,48 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             self._update_metadata(campaign_id, metadata_updates)
             
             # Ensure required subdirectories exist
-            logs_dir = self.storage.ensure_subdir(campaign_id, "logs")
-            data_dir = self.storage.ensure_subdir(campaign_id, "data")
+            logs_dir = self._ensure_campaign_subdir(campaign_id, "logs")
+            self._ensure_campaign_subdir(campaign_id, "data")
             
+            # Messages already in the JSONL log can be skipped: they were stamped
+            # when first saved and are not rewritten. Fall back to a full rewrite
+            # when the persisted history is not a prefix of `messages` (shorter
+            # list, different or edited last message) or the file is still legacy JSON.
+            log_file = logs_dir / _HISTORY_FILENAME
+            persisted = self._persisted_history_state(campaign_id, log_file)
+            appending = persisted is not None and persisted[0] <= len(messages) and (
+                persisted[0] == 0
+                or _history_line_digest(
+                    orjson.dumps(messages[persisted[0] - 1], option=_HISTORY_LINE_OPTS)
+                ) == persisted[1]
+            )
+            start = persisted[0] if appending else 0
+
             # Add timestamps and message_ids if missing (preserve existing values)
-            import uuid as uuid_mod
-            for msg in messages:
+            for msg in messages[start:]:
                 if 'timestamp' not in msg:
-                    msg['timestamp'] = datetime.now().isoformat()
+                    msg['timestamp'] = now_iso
                 if 'message_id' not in msg:
-                    msg['message_id'] = f"msg_{uuid_mod.uuid4().hex[:12]}"
-            
-            # Save to logs directory
-            log_file = logs_dir / "chat_history.json"
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(messages, f, indent=2, ensure_ascii=False)
-            # Mirror via hybrid store (to GCS when enabled)
-            if self._store:
-                self._store.write_json(messages, campaign_id, "logs/chat_history.json")
-            
-            # Invalidate cache after save
-            if campaign_id in self._history_cache:
-                del self._history_cache[campaign_id]
-                del self._cache_timestamp[campaign_id]
+                    msg['message_id'] = f"msg_{uuid.uuid4().hex[:12]}"
+
+            if not appending:
+                self._write_history(campaign_id, log_file, messages)
+            elif start < len(messages):
+                with open(log_file, "ab") as fh:
+                    fh.write(b"".join(orjson.dumps(m, option=_HISTORY_LINE_OPTS) for m in messages[start:]))
+                    if _CAMPAIGN_FSYNC:
+                        fh.flush()
+                        os.fsync(fh.fileno())
+                self._record_history_state(campaign_id, log_file, messages)
+            # Mirror to GCS in the background. Callers keep appending to the list and
+            # updating (nested) message dicts, so hand the drain a decoded snapshot.
+            if self._mirror_enabled():
+                snapshot = orjson.loads(orjson.dumps(messages, option=orjson.OPT_NON_STR_KEYS))
+                self._mirror_json(snapshot, campaign_id, "logs/chat_history.json")
+            
+            # Invalidate caches after save
+            self._invalidate_list_cache()
+            self._history_cache.pop(campaign_id, None)
                 
             return True
             
@@ -653,8 +1111,21 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         try:
             campaign_dir = self._find_campaign_dir(campaign_id)
             if campaign_dir and campaign_dir.exists():
-                # Remove the entire directory
-                shutil.rmtree(campaign_dir)
+                # Move the directory out of the listings with one rename and
+                # remove its contents in the background
+                trash_dir = campaign_dir.with_name(f"{_TRASH_PREFIX}{campaign_id}-{time.time_ns()}")
+                try:
+                    campaign_dir.rename(trash_dir)
+                except OSError:
+                    shutil.rmtree(campaign_dir)
+                else:
+                    self._mirror_pool.submit(shutil.rmtree, trash_dir, ignore_errors=True)
+                self._invalidate_list_cache()
+                self._dir_cache.pop(campaign_id, None)
+                self._max_turn.pop(campaign_id, None)
+                self._metadata_cache.pop(campaign_id, None)
+                self._history_state.pop(campaign_id, None)
+                self._history_cache.pop(campaign_id, None)
                 logger.info(f"🗑️ Deleted campaign {campaign_id}")
                 return True
             
@@ -696,13 +1167,14 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
                 return True
 
             # Legacy layout keeps directory names with suffix.
-            safe_name = re.sub(r"[^\w\s-]", "", new_name)
-            safe_name = re.sub(r"[-\s]+", " ", safe_name).strip()
+            safe_name = _UNSAFE_NAME_CHARS_RE.sub("", new_name)
+            safe_name = _NAME_SEPARATOR_RUN_RE.sub(" ", safe_name).strip()
             new_dir = campaign_dir.parent / f"{campaign_id} - {safe_name}"
             if new_dir == campaign_dir:
                 return True
 
             campaign_dir.rename(new_dir)
+            self._dir_cache[campaign_id] = new_dir
             logger.info("🏷️ Renamed legacy campaign directory to: %s", new_dir.name)
             return True
             
@@ -719,12 +1191,13 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         Returns:
             Campaign info dict or None if not found
         """
-        campaigns_result = self.list_campaigns()
-        campaigns = campaigns_result["campaigns"]
-        for campaign in campaigns:
-            if campaign['id'] == campaign_id:
-                return campaign
-        return None
+        # Lookups (including misses) are answered from the list cache, which is
+        # rebuilt when a campaign directory is added or removed
+        self._cached_campaigns()
+        campaign = self._list_cache_by_id.get(campaign_id)
+        if campaign is None:
+            return None
+        return {k: v for k, v in campaign.items() if k != 'last_played_ts'}
     
     def get_campaign_data_path(self, campaign_id: str) -> Optional[Path]:
         """Get the data directory path for a campaign.
@@ -766,7 +1239,7 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             True if saved successfully
         """
         try:
-            turns_dir = self.storage.ensure_turns_dir(campaign_id)
+            turns_dir = self._ensure_campaign_subdir(campaign_id, "data/turns")
             
             # Get turn_id from data
             turn_id = turn_data.get("turn_id")
@@ -774,15 +1247,32 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
                 logger.error("❌ Turn data missing turn_id")
                 return False
             
+            # Highest turn saved so far; read before writing, or a cold-start scan
+            # would already count this turn and never persist the new max_turn
+            turn_number = turn_data.get("turn_number")
+            if isinstance(turn_number, int):
+                max_turn = self.get_next_turn_number(campaign_id) - 1
+
             # Save turn to individual file
             turn_file = turns_dir / f"{turn_id}.json"
-            with open(turn_file, 'w', encoding='utf-8') as f:
-                json.dump(turn_data, f, indent=2, ensure_ascii=False)
-            if self._store:
-                try:
-                    self._store.write_json(turn_data, campaign_id, f"data/turns/{turn_id}.json")
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("Turn store mirror failed for %s/%s: %s", campaign_id, turn_id, exc)
+            payload = orjson.dumps(turn_data, option=_TURN_JSON_OPTIONS)
+            _atomic_write_bytes(turn_file, payload)
+            if isinstance(turn_number, int):
+                if turn_number >= max_turn:
+                    _atomic_write_bytes(
+                        turns_dir / _CURRENT_TURN_FILENAME,
+                        orjson.dumps({"turn_id": turn_id, "turn_number": turn_number}),
+                    )
+                if turn_number > max_turn:
+                    self._max_turn[campaign_id] = turn_number
+                    try:
+                        self.storage.save_metadata(campaign_id, {"max_turn": turn_number})
+                    except Exception as exc:  # noqa: BLE001
+                        logger.debug("Could not persist max_turn for %s: %s", campaign_id, exc)
+            # Mirror in the background from a decoded copy of what was written, so
+            # later edits to turn_data by the caller do not leak into the upload
+            if self._mirror_enabled():
+                self._mirror_json(orjson.loads(payload), campaign_id, f"data/turns/{turn_id}.json")
             return True
             
         except Exception as e:
@@ -800,12 +1290,12 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             Turn data dictionary or None if not found
         """
         try:
-            campaign_dir = self.storage.resolve_session_dir(campaign_id)
+            campaign_dir = self._find_campaign_dir(campaign_id)
             if campaign_dir:
                 turn_file = campaign_dir / "data" / "turns" / f"{turn_id}.json"
                 if turn_file.exists():
-                    with open(turn_file, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    with open(turn_file, 'rb') as f:
+                        return orjson.loads(f.read())
             # Object store fallback via unified store
             payload = self._store.read_json(campaign_id, f"data/turns/{turn_id}.json")
             if isinstance(payload, dict):
@@ -827,17 +1317,21 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         """
         try:
             turns: List[Dict[str, Any]] = []
-            campaign_dir = self.storage.resolve_session_dir(campaign_id)
+            campaign_dir = self._find_campaign_dir(campaign_id)
             if campaign_dir:
-                turns_dir = campaign_dir / "data" / "turns"
-                if turns_dir.exists():
-                    for turn_file in turns_dir.glob("*.json"):
-                        try:
-                            with open(turn_file, 'r', encoding='utf-8') as f:
-                                turn_data = json.load(f)
-                                turns.append(turn_data)
-                        except Exception as e:
-                            logger.warning(f"⚠️ Error loading turn file {turn_file}: {e}")
+                try:
+                    entries = list(os.scandir(campaign_dir / "data" / "turns"))
+                except FileNotFoundError:
+                    entries = []
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith(".json") or name.startswith("_") or not entry.is_file():
+                        continue
+                    try:
+                        with open(entry.path, 'rb') as f:
+                            turns.append(orjson.loads(f.read()))
+                    except Exception as e:
+                        logger.warning(f"⚠️ Error loading turn file {entry.path}: {e}")
             elif True:
                 # Listing via unified store
                 files = self._store.list_json_prefix(campaign_id, "data/turns")
@@ -872,12 +1366,15 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
             Next turn number (1 if no turns exist)
         """
         try:
-            turns = self.load_campaign_turns(campaign_id)
-            if not turns:
-                return 1
-            
-            # Get the highest turn number and add 1
-            max_turn = max(turn.get("turn_number", 0) for turn in turns)
+            max_turn = self._max_turn.get(campaign_id)
+            if max_turn is None:
+                metadata = self.storage.load_metadata(campaign_id)
+                max_turn = metadata.get("max_turn") if isinstance(metadata, dict) else None
+                if not isinstance(max_turn, int):
+                    # Cold start: scan the turn files once
+                    turns = self.load_campaign_turns(campaign_id)
+                    max_turn = max((turn.get("turn_number", 0) for turn in turns), default=0)
+                self._max_turn[campaign_id] = max_turn
             return max_turn + 1
             
         except Exception as e:
@@ -893,5 +1390,17 @@ class SimpleCampaignManager(metaclass=SingletonMeta):
         Returns:
             Current turn data or None if no turns exist
         """
+        campaign_dir = self._find_campaign_dir(campaign_id)
+        if campaign_dir:
+            turns_dir = campaign_dir / "data" / "turns"
+            try:
+                pointer = orjson.loads((turns_dir / _CURRENT_TURN_FILENAME).read_bytes())
+                with open(turns_dir / f"{pointer['turn_id']}.json", 'rb') as f:
+                    turn = orjson.loads(f.read())
+                if turn.get("turn_number") == pointer.get("turn_number"):
+                    return turn
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        # No usable pointer (older campaign or object-store only): scan
         turns = self.load_campaign_turns(campaign_id, limit=1)
         return turns[0] if turns else None
@@ -1,9 +1,14 @@
 """Profile Manager - Orchestrates character profile operations with caching."""
 
-from typing import Dict, Any, Optional
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 import logging
+import os
 from pathlib import Path
 
+import orjson
+
 from gaia.models.character import CharacterProfile, CharacterInfo
 from gaia.models.character.enriched_character import EnrichedCharacter
 from gaia.models.character.enums import CharacterType
@@ -11,8 +16,23 @@ from gaia.mechanics.character.profile_storage import ProfileStorage
 from gaia.mechanics.character.profile_updater import ProfileUpdater
 from gaia.infra.image.image_metadata import get_metadata_manager
 
+if TYPE_CHECKING:
+    from gaia.mechanics.character.portrait_generator import CharacterPortraitGenerator
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of profiles kept in memory (least recently used are evicted)
+_PROFILE_CACHE_SIZE = int(os.getenv('GAIA_PROFILE_CACHE_SIZE', '256'))
+
+
+def _profile_id_of(character_info: CharacterInfo, fallback: str) -> str:
+    """Return the profile ID for a character.
+
+    CharacterInfo has no profile_id field until the migration adds one, so the
+    character ID is used as the profile ID in the meantime.
+    """
+    return getattr(character_info, 'profile_id', fallback)
+
 
 class ProfileManager:
     """Manages character profile operations with caching and orchestration.
@@ -26,7 +46,13 @@ class ProfileManager:
         """Initialize the profile manager."""
         self.storage = ProfileStorage()
         self.updater = ProfileUpdater()
-        self._cache: Dict[str, CharacterProfile] = {}
+        # LRU of profile_id -> (profile, local file mtime_ns when it was loaded or saved)
+        self._cache: OrderedDict[str, Tuple[CharacterProfile, Optional[int]]] = OrderedDict()
+        # Built on first portrait request and reused (it wraps the image generator agent)
+        self._portrait_gen: Optional["CharacterPortraitGenerator"] = None
+        # Digest of the last portrait metadata saved per (campaign, image), so
+        # retried generations do not rewrite identical sidecars
+        self._portrait_meta_digests: OrderedDict[Tuple[str, str], bytes] = OrderedDict()
 
     # ------------------------------------------------------------------
     # Cache Management
@@ -44,20 +70,39 @@ class ProfileManager:
         Raises:
             ValueError: If profile not found
         """
-        # Check cache first
-        if profile_id in self._cache:
-            return self._cache[profile_id]
+        # Check cache first; a changed local file means another writer updated it
+        mtime_ns = self.storage.profile_mtime(profile_id)
+        cached = self._cache.get(profile_id)
+        if cached and cached[1] == mtime_ns:
+            self._cache.move_to_end(profile_id)
+            return cached[0]
 
         # Load from storage
         profile = self.storage.load_profile(profile_id)
         if not profile:
             raise ValueError(f"Profile {profile_id} not found")
 
-        # Cache for future use
-        self._cache[profile_id] = profile
+        # Cache for future use, tagged with the mtime seen before the read
+        self._cache_profile(profile_id, profile, mtime_ns)
         logger.debug(f"Profile {profile_id} loaded from storage and cached")
         return profile
 
+    def _cache_profile(self, profile_id: str, profile: CharacterProfile, mtime_ns: Optional[int]) -> None:
+        """Insert a profile as most recently used, evicting the oldest beyond the cap."""
+        self._cache[profile_id] = (profile, mtime_ns)
+        self._cache.move_to_end(profile_id)
+        while len(self._cache) > _PROFILE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _save_profile(self, profile: CharacterProfile) -> None:
+        """Save a profile and keep the saved object cached.
+
+        The cache entry is tagged with the new file mtime, so the next get_profile
+        is served from memory while later external edits are still detected.
+        """
+        self.storage.save_profile(profile)
+        self._cache_profile(profile.character_id, profile, self.storage.profile_mtime(profile.character_id))
+
     def invalidate_cache(self, profile_id: str) -> None:
         """Remove a profile from the cache.
 
@@ -108,13 +153,12 @@ class ProfileManager:
             profile.character_type = character_type
 
         # Update profile with data from CharacterInfo (works for both new and existing profiles)
-        self.updater.sync_from_character_info(profile, character_info)
-
-        # Save profile
-        self.storage.save_profile(profile)
+        changed = self.updater.sync_from_character_info(profile, character_info)
 
-        # Cache the profile
-        self._cache[profile.character_id] = profile
+        # Save and cache the profile; an existing profile already matching the
+        # character is left alone (it is cached by get_profile)
+        if changed or not profile_exists:
+            self._save_profile(profile)
 
         return profile.character_id
 
@@ -136,13 +180,12 @@ class ProfileManager:
         profile = self.get_profile(profile_id)
 
         # Update visual fields using updater
-        self.updater.update_visual_fields(profile, visual_data)
+        if not self.updater.update_visual_fields(profile, visual_data):
+            logger.debug(f"Visual metadata unchanged for profile {profile_id}")
+            return
 
-        # Save profile
-        self.storage.save_profile(profile)
-
-        # Invalidate cache so next load gets fresh data
-        self.invalidate_cache(profile_id)
+        # Save profile; the cache keeps the updated object
+        self._save_profile(profile)
 
         logger.info(f"Updated visual metadata for profile {profile_id}")
 
@@ -191,6 +234,17 @@ class ProfileManager:
     # Portrait Generation
     # ------------------------------------------------------------------
 
+    def _get_portrait_generator(self) -> "CharacterPortraitGenerator":
+        """Return the shared portrait generator, creating it on first use.
+
+        The import stays lazy so loading this module does not pull in the image agents.
+        """
+        if self._portrait_gen is None:
+            from gaia.mechanics.character.portrait_generator import CharacterPortraitGenerator
+
+            self._portrait_gen = CharacterPortraitGenerator()
+        return self._portrait_gen
+
     async def generate_portrait(
         self,
         character_id: str,
@@ -211,8 +265,6 @@ class ProfileManager:
         Returns:
             Dictionary with success status and portrait information
         """
-        from gaia.mechanics.character.portrait_generator import CharacterPortraitGenerator
-
         # If character_info not provided, try to build from character_data
         if not character_info and character_data:
             try:
@@ -247,8 +299,7 @@ class ProfileManager:
         if not character_info:
             return {"success": False, "error": "Character not found and no character data provided"}
 
-        portrait_gen = CharacterPortraitGenerator()
-        result = await portrait_gen.generate_portrait(
+        result = await self._get_portrait_generator().generate_portrait(
             character_info=character_info,
             session_id=session_id or "default",
             custom_additions=custom_additions
@@ -257,8 +308,7 @@ class ProfileManager:
         if result.get("success"):
             # Save portrait to CharacterProfile
             try:
-                # Get profile_id (use character_id as profile_id until migration)
-                profile_id = getattr(character_info, 'profile_id', character_id)
+                profile_id = _profile_id_of(character_info, character_id)
 
                 # Ensure profile exists
                 try:
@@ -274,11 +324,8 @@ class ProfileManager:
                 profile.portrait_path = result.get("local_path")
                 profile.portrait_prompt = result.get("prompt")
 
-                # Save profile
-                self.storage.save_profile(profile)
-
-                # Invalidate cache
-                self.invalidate_cache(profile_id)
+                # Save profile; the cache keeps the updated object
+                self._save_profile(profile)
 
             except Exception as e:
                 logger.error(f"Failed to save portrait to profile: {e}")
@@ -313,11 +360,21 @@ class ProfileManager:
                         "model": result.get("model"),
                         "character_id": character_id,
                     }
-                    metadata_manager.save_metadata(
+                    digest_key = (campaign_ref, storage_filename)
+                    digest = hashlib.blake2b(
+                        orjson.dumps(metadata_payload, option=orjson.OPT_SORT_KEYS, default=str),
+                        digest_size=8,
+                    ).digest()
+                    if self._portrait_meta_digests.get(digest_key) == digest:
+                        logger.debug("Portrait metadata unchanged for %s, skipping save", storage_filename)
+                    elif metadata_manager.save_metadata(
                         storage_filename,
                         metadata_payload,
                         campaign_id=campaign_ref,
-                    )
+                    ):
+                        self._portrait_meta_digests[digest_key] = digest
+                        while len(self._portrait_meta_digests) > _PROFILE_CACHE_SIZE:
+                            self._portrait_meta_digests.popitem(last=False)
             except Exception as exc:
                 logger.warning("Failed to persist portrait metadata for %s: %s", character_id, exc)
 
@@ -373,8 +430,7 @@ class ProfileManager:
         Raises:
             ValueError: If profile not found
         """
-        # Get profile_id (for now, use character_id as profile_id until migration adds profile_id field)
-        profile_id = getattr(character_info, 'profile_id', character_info.character_id)
+        profile_id = _profile_id_of(character_info, character_info.character_id)
 
         # Load profile (with caching)
         profile = self.get_profile(profile_id)
@@ -398,8 +454,7 @@ class ProfileManager:
         try:
             profile = self.get_profile(character_id)
             self.updater.increment_interactions(profile)
-            self.storage.save_profile(profile)
-            self.invalidate_cache(character_id)
+            self._save_profile(profile)
             logger.debug(f"Updated interaction count for {character_id}")
             return True
         except ValueError:
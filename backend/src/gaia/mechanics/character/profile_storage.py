@@ -1,11 +1,12 @@
 """Character Profile Storage - Manages persistent storage of CharacterProfiles with voice and visual data."""
 
-import json
 import logging
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+import orjson
+
 from gaia.models.character import CharacterProfile, CharacterInfo
 from gaia.utils.singleton import SingletonMeta
 from gaia_private.session.session_storage import SessionStorage
@@ -13,6 +14,9 @@ from gaia.infra.storage.campaign_store import get_campaign_store
 
 logger = logging.getLogger(__name__)
 
+# Profiles stay indented: they are small and often edited by hand
+_PROFILE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
 
 class ProfileStorage(metaclass=SingletonMeta):
     """Manages CharacterProfile storage for voice and visual data with hybrid local+GCS storage."""
@@ -89,8 +93,8 @@ class ProfileStorage(metaclass=SingletonMeta):
 
             # Save to profiles directory (local)
             profile_file = self.profiles_path / f"{profile.character_id}.json"
-            with open(profile_file, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            with open(profile_file, 'wb') as f:
+                f.write(orjson.dumps(profile_data, option=_PROFILE_JSON_OPTIONS))
 
             # Mirror to GCS when enabled
             if self._store:
@@ -105,6 +109,20 @@ class ProfileStorage(metaclass=SingletonMeta):
             logger.error(f"❌ Error saving character profile: {e}")
             raise
     
+    def profile_mtime(self, character_id: str) -> Optional[int]:
+        """Return the local profile file's mtime in nanoseconds.
+
+        Args:
+            character_id: Character identifier
+
+        Returns:
+            st_mtime_ns of the local profile, or None if there is no local copy
+        """
+        try:
+            return (self.profiles_path / f"{character_id}.json").stat().st_mtime_ns
+        except OSError:
+            return None
+
     def load_profile(self, character_id: str) -> Optional[CharacterProfile]:
         """Load a CharacterProfile from storage.
 
@@ -119,8 +137,8 @@ class ProfileStorage(metaclass=SingletonMeta):
 
             # Try local file first
             if profile_file.exists():
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile_data = json.load(f)
+                with open(profile_file, 'rb') as f:
+                    profile_data = orjson.loads(f.read())
                     profile = CharacterProfile.from_dict(profile_data)
                     logger.debug(f"📖 Loaded character profile {character_id} ({profile.name})")
                     return profile
@@ -155,8 +173,8 @@ class ProfileStorage(metaclass=SingletonMeta):
         # List local profiles
         for profile_file in self.profiles_path.glob("*.json"):
             try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile_data = json.load(f)
+                with open(profile_file, 'rb') as f:
+                    profile_data = orjson.loads(f.read())
                     char_id = profile_data.get('character_id', profile_file.stem)
                     seen.add(char_id)
                     profiles.append({
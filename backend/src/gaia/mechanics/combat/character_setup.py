@@ -4,8 +4,9 @@ This module consolidates all character setup logic that was previously
 duplicated across combat_orchestrator.py and character_extraction.py.
 """
 
+import functools
 import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
 import logging
 import uuid
 
@@ -22,6 +23,197 @@ from gaia.mechanics.combat.npc_combatant_creator import NPCCombatantCreator
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by CharacterSetupManager._normalize_combatant_name
+# Numbering ("2. ") then bullet ("- ") prefixes, stripped in a single pass
+_PREFIX_RE = re.compile(r"^(?:[\s\-]*\d+[\.\-\)\]]\s*)?(?:[\s\-]*[\*\-•]\s*)?")
+_SEGMENT_SPLIT_RE = re.compile(r"[\n\r]+|\.\s*")
+_WS_RE = re.compile(r"\s+")
+
+# Phrases that start a description after a long combatant name ("... appears to be ...")
+_DESCRIPTIVE_TERMS = (
+    " appear",
+    " appears",
+    " appearing",
+    " seem",
+    " seems",
+    " seeming",
+    " are ",
+    " were ",
+    " is ",
+    " was ",
+    " have ",
+    " has ",
+    " carrying ",
+    " wielding ",
+    " holding ",
+    " wearing ",
+    " standing ",
+    " seated ",
+    " sitting ",
+    " crouched ",
+    " crouching ",
+    " looming ",
+    " hovering ",
+    " guarding ",
+    " charging ",
+    " lurching ",
+    " shambling ",
+    " approaching ",
+    " advancing ",
+)
+_DESCRIPTIVE_RE = re.compile("|".join(re.escape(term) for term in _DESCRIPTIVE_TERMS))
+
+# A "Name: ..." segment whose text after the colon mentions one of these is
+# status text, and only the name part is kept (substring match)
+_STATUS_KEYWORDS = (
+    "hp",
+    "ap",
+    "status",
+    "condition",
+    "conditions",
+    "unconscious",
+    "wounded",
+    "bloodied",
+    "healthy",
+    "injured",
+    "defeated",
+    "initiative",
+    "turn ended",
+)
+
+# Words that end a name when they appear after its first three words
+_STOP_WORDS = frozenset({
+    "appear",
+    "appears",
+    "appearing",
+    "seated",
+    "sitting",
+    "standing",
+    "looming",
+    "hovering",
+    "guarding",
+    "charging",
+    "lurching",
+    "shambling",
+    "approaching",
+    "advancing",
+    "holding",
+    "wielding",
+    "with",
+})
+
+
+def _name_slug(name: str) -> str:
+    """Return the lowercase, underscore-separated form used in generated IDs."""
+    return name.lower().replace(" ", "_")
+
+
+def _is_plain_name(name: str) -> bool:
+    """Return True if a stripped, non-empty name needs no normalization.
+
+    Such a name has no prefix to strip, no segments to split or filter, and
+    nothing to trim or collapse, so _normalize_combatant_name would return it
+    unchanged with no aliases.
+    """
+    if len(name) > 40 or name[0].isdigit() or name[0] in "-*•.;," or name[-1] in ".;,-":
+        return False
+    if "." in name or ":" in name or "_" in name:
+        return False
+    words = name.split()
+    # Single spaces only (no tabs, newlines or runs), and no stop word to cut at
+    return " ".join(words) == name and not any(
+        word.lower() in _STOP_WORDS for word in words[3:]
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _player_name_re(player_lookup: FrozenSet[str]) -> Optional[Pattern[str]]:
+    """Compile one alternation matching any lowercased player name (None if there are none)."""
+    if not player_lookup:
+        return None
+    return re.compile("|".join(re.escape(player) for player in sorted(player_lookup)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_name(canonical: str, player_lookup: FrozenSet[str]) -> Tuple[str, Tuple[str, ...]]:
+    """Cached core of CharacterSetupManager._normalize_combatant_name.
+
+    Args:
+        canonical: Stripped, non-empty combatant name
+        player_lookup: Lowercased player names
+
+    Returns:
+        The canonical name and its aliases (a tuple, since results are shared)
+    """
+    name = canonical
+    alias_candidates: List[str] = []
+
+    # Strip numbering/bullet prefixes like "2. " or "- "
+    name = _PREFIX_RE.sub("", name, count=1)
+
+    raw_segments = [
+        segment.strip()
+        for segment in _SEGMENT_SPLIT_RE.split(name)
+        if segment.strip()
+    ]
+
+    player_re = _player_name_re(player_lookup)
+    filtered_segments: List[str] = []
+    for segment in raw_segments:
+        # Drop segments that mention a player
+        if player_re is not None and player_re.search(segment.lower()):
+            continue
+        if ":" in segment:
+            left, _, right = segment.partition(":")
+            right_lower = right.lower()
+            if any(keyword in right_lower for keyword in _STATUS_KEYWORDS):
+                filtered_segments.append(left.strip())
+                continue
+        filtered_segments.append(segment)
+
+    if not filtered_segments:
+        filtered_segments = raw_segments or [name]
+
+    candidate_raw = filtered_segments[-1] if len(filtered_segments) > 1 else filtered_segments[0]
+    candidate = (
+        _WS_RE.sub(" ", candidate_raw)
+        .replace("_", " ")
+        .strip(" .;,-")
+    )
+
+    for alias in (candidate_raw.strip(), name):
+        if alias:
+            alias_candidates.append(alias)
+
+    if len(candidate) > 40:
+        # Cut at the earliest descriptive phrase after the first few characters
+        match = _DESCRIPTIVE_RE.search(candidate.lower(), 6)
+        if match:
+            alias_candidates.append(candidate)
+            candidate = candidate[:match.start()].strip(" .;,-")
+
+    words = candidate.split()
+    for idx, word in enumerate(words):
+        if idx >= 3 and word.lower() in _STOP_WORDS:
+            alias_candidates.append(candidate)
+            candidate = " ".join(words[:idx]).strip(" .;,-")
+            break
+
+    candidate = _WS_RE.sub(" ", candidate).strip(" .;,-")
+    if not candidate:
+        candidate = canonical
+
+    alias_unique: List[str] = []
+    for alias in alias_candidates:
+        normalized_alias = _WS_RE.sub(" ", alias.replace("_", " ")).strip(" .;,-")
+        if normalized_alias and normalized_alias not in alias_unique and normalized_alias != canonical:
+            alias_unique.append(normalized_alias)
+
+    if candidate and candidate != canonical and candidate not in alias_unique:
+        alias_unique.insert(0, candidate)
+
+    return canonical, tuple(alias_unique)
+
 
 class CharacterSetupManager:
     """Manages all character setup and extraction for combat."""
@@ -51,7 +243,8 @@ class CharacterSetupManager:
     def _normalize_combatant_name(
         self,
         raw_name: str,
-        player_names: Iterable[str]
+        player_names: Iterable[str],
+        player_lookup: Optional[FrozenSet[str]] = None,
     ) -> Tuple[str, List[str]]:
         """Return the original combatant name and generate alias options.
 
@@ -59,6 +252,9 @@ class CharacterSetupManager:
         so we can faithfully propagate whatever the model generated. We still
         derive alias strings to help downstream matching when the model
         occasionally embellishes with status text or descriptions.
+
+        Callers normalizing many names can pass ``player_lookup`` (the lowercased
+        non-empty ``player_names``) so it is not rebuilt for every name.
         """
         if not raw_name:
             return "", []
@@ -66,146 +262,13 @@ class CharacterSetupManager:
         canonical = str(raw_name).strip()
         if not canonical:
             return "", []
+        if _is_plain_name(canonical):
+            return canonical, []
 
-        name = canonical
-        alias_candidates: List[str] = []
-
-        # Strip numbering/bullet prefixes like "2. " or "- "
-        name = re.sub(r"^[\s\-]*\d+[\.\-\)\]]\s*", "", name)
-        name = re.sub(r"^[\s\-]*[\*\-•]\s*", "", name)
-
-        raw_segments = [
-            segment.strip()
-            for segment in re.split(r"[\n\r]+|\.\s*", name)
-            if segment.strip()
-        ]
-
-        player_lookup = {p.lower() for p in player_names if p}
-        status_keywords = (
-            "hp",
-            "ap",
-            "status",
-            "condition",
-            "conditions",
-            "unconscious",
-            "wounded",
-            "bloodied",
-            "healthy",
-            "injured",
-            "defeated",
-            "initiative",
-            "turn ended",
-        )
-
-        filtered_segments: List[str] = []
-        for segment in raw_segments:
-            lowered = segment.lower()
-            if any(player in lowered for player in player_lookup):
-                continue
-            if ":" in segment:
-                left, _, right = segment.partition(":")
-                if any(keyword in right.lower() for keyword in status_keywords):
-                    filtered_segments.append(left.strip())
-                    continue
-            filtered_segments.append(segment)
-
-        if not filtered_segments:
-            filtered_segments = raw_segments or [name]
-
-        candidate_raw = filtered_segments[-1] if len(filtered_segments) > 1 else filtered_segments[0]
-        candidate = (
-            re.sub(r"\s+", " ", candidate_raw)
-            .replace("_", " ")
-            .strip(" .;,-")
-        )
-
-        for alias in (candidate_raw.strip(), name):
-            if alias:
-                alias_candidates.append(alias)
-
-        descriptive_terms = (
-            " appear",
-            " appears",
-            " appearing",
-            " seem",
-            " seems",
-            " seeming",
-            " are ",
-            " were ",
-            " is ",
-            " was ",
-            " have ",
-            " has ",
-            " carrying ",
-            " wielding ",
-            " holding ",
-            " wearing ",
-            " standing ",
-            " seated ",
-            " sitting ",
-            " crouched ",
-            " crouching ",
-            " looming ",
-            " hovering ",
-            " guarding ",
-            " charging ",
-            " lurching ",
-            " shambling ",
-            " approaching ",
-            " advancing ",
-        )
-
-        lowered_candidate = candidate.lower()
-        if len(candidate) > 40:
-            for term in descriptive_terms:
-                idx = lowered_candidate.find(term)
-                if idx > 0 and idx >= 6:
-                    alias_candidates.append(candidate)
-                    candidate = candidate[:idx].strip(" .;,-")
-                    lowered_candidate = candidate.lower()
-                    break
-
-        stop_words = {
-            "appear",
-            "appears",
-            "appearing",
-            "seated",
-            "sitting",
-            "standing",
-            "looming",
-            "hovering",
-            "guarding",
-            "charging",
-            "lurching",
-            "shambling",
-            "approaching",
-            "advancing",
-            "holding",
-            "wielding",
-            "with",
-        }
-
-        words = candidate.split()
-        for idx, word in enumerate(words):
-            if idx >= 3 and word.lower() in stop_words:
-                alias_candidates.append(candidate)
-                candidate = " ".join(words[:idx]).strip(" .;,-")
-                break
-
-        candidate = re.sub(r"\s+", " ", candidate).strip(" .;,-")
-        if not candidate:
-            candidate = canonical
-
-        alias_unique: List[str] = []
-        for alias in alias_candidates:
-            normalized_alias = re.sub(r"\s+", " ", alias.replace("_", " ")).strip(" .;,-")
-            if normalized_alias and normalized_alias not in alias_unique and normalized_alias != canonical:
-                alias_unique.append(normalized_alias)
-
-        if candidate and candidate != canonical and candidate not in alias_unique:
-            alias_unique.insert(0, candidate)
-
-        return canonical, alias_unique
+        if player_lookup is None:
+            player_lookup = frozenset(p.lower() for p in player_names if p)
+        canonical, aliases = _normalize_name(canonical, player_lookup)
+        return canonical, list(aliases)
 
     def _ensure_prefixed_id(self, character_id: str, is_npc: bool) -> str:
         """Ensure character ID has the proper pc: or npc: prefix."""
@@ -257,6 +320,9 @@ class CharacterSetupManager:
                 if getattr(c, "name", None)
             )
 
+        # Every player in the initiative order is already in player_names
+        player_lookup = frozenset(p.lower() for p in player_names if p)
+
         roster_participants = []
         if self.roster_manager and getattr(combat_model, "scene_id", None):
             roster_participants = list(self.roster_manager.get_participants_for_scene(combat_model.scene_id))
@@ -275,7 +341,7 @@ class CharacterSetupManager:
             alias_names: List[str] = []
 
             if not is_player:
-                canonical_name, alias_names = self._normalize_combatant_name(raw_name, player_names)
+                canonical_name, alias_names = self._normalize_combatant_name(raw_name, player_names, player_lookup)
                 if canonical_name:
                     name = canonical_name
             else:
@@ -380,7 +446,7 @@ class CharacterSetupManager:
                 if char_id:
                     name_to_combatant_id[name] = str(char_id)
                 else:
-                    slug = name.lower().replace(' ', '_')
+                    slug = _name_slug(name)
                     name_to_combatant_id[name] = f"player_{slug}"
 
             # Create combatant state for player
@@ -412,7 +478,7 @@ class CharacterSetupManager:
 
             # Build ID mapping
             if name not in name_to_combatant_id:
-                slug = name.lower().replace(' ', '_')
+                slug = _name_slug(name)
                 short_uuid = uuid.uuid4().hex[:4]
                 name_to_combatant_id[name] = f"npc_{slug}_{short_uuid}"
 
@@ -434,6 +500,12 @@ class CharacterSetupManager:
 
         # Process initiative data if provided
         if initiative_data:
+            # Index players by name once; first entry wins, as with a linear scan
+            players_by_name: Dict[str, Dict[str, Any]] = {}
+            for player in players:
+                if isinstance(player, dict) and player.get('name'):
+                    players_by_name.setdefault(player['name'], player)
+
             for entry in initiative_data:
                 if not isinstance(entry, dict):
                     continue
@@ -449,13 +521,13 @@ class CharacterSetupManager:
                 if name not in name_to_combatant_id:
                     if is_player:
                         # Try to find player data
-                        player_entry = next((p for p in players if p.get('name') == name), None)
+                        player_entry = players_by_name.get(name)
                         if player_entry and player_entry.get('character_id'):
                             name_to_combatant_id[name] = str(player_entry['character_id'])
                         else:
-                            name_to_combatant_id[name] = f"player_{name.lower().replace(' ', '_')}"
+                            name_to_combatant_id[name] = f"player_{_name_slug(name)}"
                     else:
-                        slug = name.lower().replace(' ', '_')
+                        slug = _name_slug(name)
                         name_to_combatant_id[name] = f"npc_{slug}_{uuid.uuid4().hex[:4]}"
 
                 # Create combatant state with defaults
@@ -540,8 +612,14 @@ class CharacterSetupManager:
 
         for character_id, state in combatant_states.items():
             if state:
-                # Handle both object and dict forms
-                name = state.name if hasattr(state, 'name') else state.get('name')
+                # Handle both dict and object forms without a hasattr probe per state
+                if isinstance(state, dict):
+                    name = state.get('name')
+                else:
+                    try:
+                        name = state.name
+                    except AttributeError:
+                        name = state.get('name')
                 if name:
                     name_to_combatant_id[name] = character_id
 
@@ -572,8 +650,7 @@ class CharacterSetupManager:
             )
         else:
             # Create CharacterInfo manually if factory method doesn't exist
-            import uuid as uuid_module
-            char_id = f"npc_{name.lower().replace(' ', '_')}_{uuid_module.uuid4().hex[:4]}"
+            char_id = f"npc_{_name_slug(name)}_{uuid.uuid4().hex[:4]}"
 
             from gaia.models.character.character_info import CharacterInfo as CI
             npc_character = CI(
@@ -771,8 +848,8 @@ class CharacterSetupManager:
         # Add extracted characters if not already present
         for char in extracted:
             name = char.get("name")
-            if name and name.lower() not in merged:
-                merged[name.lower()] = char
+            if name:
+                merged.setdefault(name.lower(), char)
 
         return list(merged.values())
 
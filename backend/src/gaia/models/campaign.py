@@ -11,6 +11,9 @@ from gaia.models.scene_info import SceneInfo
 from gaia.models.narrative import NarrativeInfo
 from gaia.models.quest import QuestInfo
 
+# Valid values for custom_data["scene_storage_mode"]
+SCENE_STORAGE_MODES = ("database", "filesystem", "filesystem_log")
+
 
 @dataclass
 class CampaignData:
@@ -148,7 +151,7 @@ class CampaignData:
         """Get the scene storage mode for this campaign.
 
         Returns:
-            "database" or "filesystem"
+            "database", "filesystem" or "filesystem_log"
 
         Default behavior:
         - New campaigns without this setting: "database" (preferred)
@@ -160,7 +163,7 @@ class CampaignData:
 
         # Check if mode is explicitly set
         mode = self.custom_data.get("scene_storage_mode")
-        if mode in ("database", "filesystem"):
+        if mode in SCENE_STORAGE_MODES:
             return mode
 
         # Not set - determine based on whether campaign has existing scenes
@@ -175,13 +178,15 @@ class CampaignData:
         """Set the scene storage mode for this campaign.
 
         Args:
-            mode: "database" or "filesystem"
+            mode: "database", "filesystem" or "filesystem_log"
 
         Raises:
             ValueError: If mode is invalid
         """
-        if mode not in ("database", "filesystem"):
-            raise ValueError(f"Invalid scene_storage_mode: {mode}. Must be 'database' or 'filesystem'")
+        if mode not in SCENE_STORAGE_MODES:
+            raise ValueError(
+                f"Invalid scene_storage_mode: {mode}. Must be 'database', 'filesystem' or 'filesystem_log'"
+            )
 
         if not self.custom_data:
             self.custom_data = {}
@@ -158,6 +158,37 @@ class Scene(BaseModel):
             combat_data=self.combat_data,
         )
 
+    @staticmethod
+    def scene_info_row(scene_info: SceneInfo, campaign_id: uuid.UUID) -> dict:
+        """Build insert values for a SceneInfo dataclass.
+
+        Args:
+            scene_info: SceneInfo dataclass to convert
+            campaign_id: UUID of the campaign this scene belongs to
+
+        Returns:
+            Dictionary of Scene column values
+        """
+        return {
+            "scene_id": scene_info.scene_id,
+            "campaign_id": campaign_id,
+            "title": scene_info.title,
+            "description": scene_info.description,
+            "scene_type": scene_info.scene_type,
+            "objectives": scene_info.objectives or [],
+            "outcomes": scene_info.outcomes or [],
+            "duration_turns": scene_info.duration_turns,
+            "turn_order": scene_info.turn_order or [],
+            "current_turn_index": scene_info.current_turn_index,
+            "in_combat": scene_info.in_combat,
+            "combat_data": scene_info.combat_data,
+            "scene_metadata": scene_info.metadata or {},
+            "is_deleted": False,
+            "deleted_at": None,
+            "scene_timestamp": scene_info.timestamp,
+            "last_updated": scene_info.last_updated,
+        }
+
     @classmethod
     def from_scene_info(cls, scene_info: SceneInfo, campaign_id: uuid.UUID) -> "Scene":
         """Create Scene model from SceneInfo dataclass.
@@ -173,25 +204,7 @@ class Scene(BaseModel):
         Returns:
             Scene model instance (not yet persisted)
         """
-        return cls(
-            scene_id=scene_info.scene_id,
-            campaign_id=campaign_id,
-            title=scene_info.title,
-            description=scene_info.description,
-            scene_type=scene_info.scene_type,
-            objectives=scene_info.objectives or [],
-            outcomes=scene_info.outcomes or [],
-            duration_turns=scene_info.duration_turns,
-            turn_order=scene_info.turn_order or [],
-            current_turn_index=scene_info.current_turn_index,
-            in_combat=scene_info.in_combat,
-            combat_data=scene_info.combat_data,
-            scene_metadata=scene_info.metadata or {},
-            is_deleted=False,
-            deleted_at=None,
-            scene_timestamp=scene_info.timestamp,
-            last_updated=scene_info.last_updated,
-        )
+        return cls(**cls.scene_info_row(scene_info, campaign_id))
 
     def soft_delete(self) -> None:
         """Mark scene as deleted (soft delete)."""
@@ -71,21 +71,19 @@ class SceneEntity(BaseModel):
     # Relationships
     scene: Mapped["Scene"] = relationship("Scene", back_populates="entities")
 
-    @classmethod
-    def from_scene_participant(
-        cls, scene_id: str, participant: SceneParticipant
-    ) -> "SceneEntity":
-        """Create SceneEntity from SceneParticipant.
+    @staticmethod
+    def participant_row(scene_id: str, participant: SceneParticipant) -> dict:
+        """Build insert values for a SceneParticipant.
 
-        Converts a SceneParticipant (character-specific) to a generic
-        SceneEntity database record.
+        Converts a SceneParticipant (character-specific) to the column values
+        of a generic SceneEntity record, suitable for bulk inserts.
 
         Args:
             scene_id: Scene this entity belongs to
             participant: SceneParticipant to convert
 
         Returns:
-            SceneEntity model instance
+            Dictionary of SceneEntity column values
         """
         entity_id = participant.character_id or f"unnamed_{participant.display_name}"
 
@@ -97,16 +95,34 @@ class SceneEntity(BaseModel):
         if participant.source:
             entity_metadata["source"] = participant.source
 
-        return cls(
-            scene_id=scene_id,
-            entity_id=entity_id,
-            entity_type="character",
-            is_present=participant.is_present,
-            joined_at=participant.joined_at,
-            left_at=participant.left_at,
-            role=participant.role.value,
-            entity_metadata=entity_metadata,
-        )
+        return {
+            "scene_id": scene_id,
+            "entity_id": entity_id,
+            "entity_type": "character",
+            "is_present": participant.is_present,
+            "joined_at": participant.joined_at,
+            "left_at": participant.left_at,
+            "role": participant.role.value,
+            "entity_metadata": entity_metadata,
+        }
+
+    @classmethod
+    def from_scene_participant(
+        cls, scene_id: str, participant: SceneParticipant
+    ) -> "SceneEntity":
+        """Create SceneEntity from SceneParticipant.
+
+        Converts a SceneParticipant (character-specific) to a generic
+        SceneEntity database record.
+
+        Args:
+            scene_id: Scene this entity belongs to
+            participant: SceneParticipant to convert
+
+        Returns:
+            SceneEntity model instance
+        """
+        return cls(**cls.participant_row(scene_id, participant))
 
     def mark_departed(self, timestamp: Optional[datetime] = None) -> None:
         """Mark entity as no longer present in the scene."""
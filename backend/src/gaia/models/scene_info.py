@@ -8,7 +8,7 @@ from gaia.models.character.enums import CharacterRole
 from gaia.models.scene_participant import SceneParticipant
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneInfo:
     """Scene information for narrative structure.
     
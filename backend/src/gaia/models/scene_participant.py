@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 from gaia.models.character.enums import CharacterRole, CharacterCapability
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneParticipant:
     """Represents a character or entity participating in a scene."""
 
@@ -336,7 +336,8 @@ class PlayerOptionsService:
         try:
             # Fetch current scene if not provided
             if not scene_info:
-                scene_manager = EnhancedSceneManager(campaign_id)
+                # One-shot lookup of the newest scene, so skip the cache prewarm
+                scene_manager = EnhancedSceneManager(campaign_id, prewarm=False)
                 recent_scenes = scene_manager.get_recent_scenes(limit=1)
                 if recent_scenes:
                     scene_info = recent_scenes[0]
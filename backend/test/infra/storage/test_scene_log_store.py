@@ -0,0 +1,134 @@
+"""Unit tests for the append-only SceneLogStore."""
+
+import os
+
+import orjson
+import pytest
+
+from gaia.infra.storage import scene_log_store
+from gaia.infra.storage.scene_log_store import SceneLogStore
+
+
+def _scene(scene_id: str, title: str, timestamp: str) -> dict:
+    return {"scene_id": scene_id, "title": title, "timestamp": timestamp}
+
+
+class TestSceneLogStore:
+    """Test suite for SceneLogStore."""
+
+    def test_put_and_get_latest_record(self, tmp_path):
+        """Test that reads return the latest appended record for a scene."""
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "First", "2024-01-01T10:00:00"))
+        store.put("scene_b", _scene("scene_b", "Other", "2024-01-01T11:00:00"))
+        store.put("scene_a", _scene("scene_a", "Second", "2024-01-01T10:00:00"))
+
+        assert store.get("scene_a")["title"] == "Second"
+        assert store.get("scene_b")["title"] == "Other"
+        assert store.get("missing") is None
+        assert len(store) == 2
+
+    def test_exclusive_put_rejects_existing_scene(self, tmp_path):
+        """Test that exclusive writes refuse to replace a scene."""
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "First", "2024-01-01T10:00:00"), exclusive=True)
+
+        with pytest.raises(FileExistsError):
+            store.put("scene_a", _scene("scene_a", "Again", "2024-01-01T10:00:00"), exclusive=True)
+        assert store.get("scene_a")["title"] == "First"
+
+    def test_recent_orders_by_scene_timestamp(self, tmp_path):
+        """Test that recent() returns the newest scenes by timestamp, not write order."""
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_new", _scene("scene_new", "New", "2024-01-03T00:00:00"))
+        store.put("scene_old", _scene("scene_old", "Old", "2024-01-01T00:00:00"))
+        store.put("scene_mid", _scene("scene_mid", "Mid", "2024-01-02T00:00:00"))
+
+        assert [s["scene_id"] for s in store.recent(2)] == ["scene_new", "scene_mid"]
+        assert store.recent(0) == []
+
+    def test_reopen_uses_persisted_index_and_scans_new_records(self, tmp_path, monkeypatch):
+        """Test that a reopened store sees records appended after the index was saved."""
+        monkeypatch.setattr(scene_log_store, "_INDEX_SAVE_MIN_BYTES", 0)
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "A", "2024-01-01T00:00:00"))
+        # Another writer appending to the same log
+        other = SceneLogStore(str(tmp_path))
+        other.put("scene_b", _scene("scene_b", "B", "2024-01-02T00:00:00"))
+
+        assert store.get("scene_b")["title"] == "B"
+        reopened = SceneLogStore(str(tmp_path))
+        assert len(reopened) == 2
+        assert os.path.exists(os.path.join(str(tmp_path), scene_log_store.INDEX_FILENAME))
+
+    def test_partial_trailing_record_is_ignored(self, tmp_path):
+        """Test that an in-flight append does not corrupt the index."""
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "A", "2024-01-01T00:00:00"))
+        with open(store.log_path, "ab") as f:
+            f.write(b'{"scene_id": "scene_b", "tit')
+
+        reopened = SceneLogStore(str(tmp_path))
+        assert len(reopened) == 1
+        assert reopened.get("scene_a")["title"] == "A"
+
+    def test_put_after_partial_trailing_record_is_indexed(self, tmp_path):
+        """Test that an append after a torn record is not lost to it."""
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "A", "2024-01-01T00:00:00"))
+        with open(store.log_path, "ab") as f:
+            f.write(b'{"scene_id": "scene_b", "tit')
+
+        reopened = SceneLogStore(str(tmp_path))
+        reopened.put("scene_c", _scene("scene_c", "C", "2024-01-03T00:00:00"), exclusive=True)
+
+        assert reopened.get("scene_c")["title"] == "C"
+        assert len(reopened) == 2
+        assert [s["scene_id"] for s in reopened.recent(5)] == ["scene_c", "scene_a"]
+        with pytest.raises(FileExistsError):
+            reopened.put("scene_c", _scene("scene_c", "Again", "2024-01-03T00:00:00"), exclusive=True)
+        assert SceneLogStore(str(tmp_path)).get("scene_c")["title"] == "C"
+
+    def test_put_persists_index_position(self, tmp_path, monkeypatch):
+        """Test that a writer's own appends advance the saved index."""
+        monkeypatch.setattr(scene_log_store, "_INDEX_SAVE_MIN_BYTES", 0)
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "A", "2024-01-01T00:00:00"))
+        store.put("scene_b", _scene("scene_b", "B", "2024-01-02T00:00:00"))
+
+        with open(store.index_path, "rb") as f:
+            saved = orjson.loads(f.read())
+        assert saved["log_size"] == os.path.getsize(store.log_path)
+
+        reopened = SceneLogStore(str(tmp_path))
+        assert reopened._log_size == saved["log_size"]
+        assert reopened.get("scene_b")["title"] == "B"
+
+    def test_reads_do_not_rewrite_index_below_threshold(self, tmp_path):
+        """Test that picking up a few new records does not rewrite the persisted index."""
+        store = SceneLogStore(str(tmp_path))
+        store.put("scene_a", _scene("scene_a", "A", "2024-01-01T00:00:00"))
+        store.compact()  # persists the index
+
+        other = SceneLogStore(str(tmp_path))
+        other.put("scene_b", _scene("scene_b", "B", "2024-01-02T00:00:00"))
+        saved_mtime = os.stat(store.index_path).st_mtime_ns
+
+        assert store.get("scene_b")["title"] == "B"
+        assert len(SceneLogStore(str(tmp_path))) == 2
+        assert os.stat(store.index_path).st_mtime_ns == saved_mtime
+        assert [name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")] == []
+
+    def test_compaction_drops_superseded_records(self, tmp_path, monkeypatch):
+        """Test that compaction keeps only live records and reads still work."""
+        monkeypatch.setattr(scene_log_store, "_COMPACT_MIN_DEAD_BYTES", 0)
+        store = SceneLogStore(str(tmp_path))
+        for i in range(5):
+            store.put("scene_a", _scene("scene_a", f"Version {i}", "2024-01-01T00:00:00"))
+        store.put("scene_b", _scene("scene_b", "B", "2024-01-02T00:00:00"))
+
+        with open(store.log_path, "rb") as f:
+            lines = f.read().splitlines()
+        assert len(lines) <= 3
+        assert store.get("scene_a")["title"] == "Version 4"
+        assert SceneLogStore(str(tmp_path)).get("scene_b")["title"] == "B"
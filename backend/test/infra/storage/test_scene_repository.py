@@ -18,6 +18,35 @@ from gaia.models.character.enums import CharacterRole, CharacterCapability
 from gaia.models.scene_db import Scene
 
 
+class _DictCache:
+    """Minimal stand-in for a synchronous Redis client."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class _AsyncDictCache(_DictCache):
+    """Minimal stand-in for an async Redis client."""
+
+    async def get(self, key):
+        return super().get(key)
+
+    async def set(self, key, value, ex=None):
+        super().set(key, value, ex)
+
+    async def delete(self, key):
+        super().delete(key)
+
+
 class TestSceneRepositorySync:
     """Test suite for SceneRepository sync methods."""
 
@@ -107,6 +136,20 @@ class TestSceneRepositorySync:
         # Cleanup
         self._cleanup_scene(repository, sample_scene_info.scene_id)
 
+    async def test_create_scene_async_with_participants(self, repository, campaign_uuid, sample_scene_info):
+        """Test that the async create stores the scene and all participants."""
+        result_id = await repository.create_scene(sample_scene_info, campaign_uuid)
+        assert result_id == sample_scene_info.scene_id
+
+        retrieved = await repository.get_scene(sample_scene_info.scene_id)
+        assert retrieved is not None
+        by_id = {p.character_id: p for p in retrieved.participants}
+        assert set(by_id) == {"npc_bartender", "pc_hero"}
+        assert by_id["pc_hero"].display_name == "Thorin Ironforge"
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
     def test_create_scene_sync_duplicate_raises(self, repository, campaign_uuid, sample_scene_info):
         """Test that creating a duplicate scene raises ValueError."""
         # Create first scene
@@ -119,11 +162,42 @@ class TestSceneRepositorySync:
         # Cleanup
         self._cleanup_scene(repository, sample_scene_info.scene_id)
 
+    def test_create_scene_sync_deleted_id_raises(self, repository, campaign_uuid, sample_scene_info):
+        """Test that re-creating a soft-deleted scene ID raises ValueError."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+        with pytest.raises(ValueError, match="deleted"):
+            repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
     def test_get_scene_sync_not_found(self, repository):
         """Test that get_scene_sync returns None for non-existent scenes."""
         result = repository.get_scene_sync("nonexistent_scene_12345")
         assert result is None
 
+    async def test_get_scenes_bulk(self, repository, campaign_uuid, sample_scene_info):
+        """Test that bulk reads return found live scenes keyed by ID."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+        other = SceneInfo(
+            scene_id=f"test_bulk_{uuid.uuid4().hex[:8]}",
+            title="Deleted Scene",
+            description="Gone",
+            scene_type="exploration",
+        )
+        repository.create_scene_sync(other, campaign_uuid)
+        await repository.soft_delete_scene(other.scene_id)
+
+        ids = [sample_scene_info.scene_id, other.scene_id, "nonexistent_scene_12345"]
+        scenes = repository.get_scenes_bulk_sync(ids)
+        assert list(scenes) == [sample_scene_info.scene_id]
+        assert len(scenes[sample_scene_info.scene_id].participants) == 2
+
+        assert list(await repository.get_scenes_bulk(ids)) == [sample_scene_info.scene_id]
+        assert await repository.get_scenes_bulk([]) == {}
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
     def test_update_scene_sync_outcomes(self, repository, campaign_uuid, sample_scene_info):
         """Test updating scene outcomes."""
         # Create scene
@@ -196,6 +270,43 @@ class TestSceneRepositorySync:
         for scene_id in scene_ids:
             self._cleanup_scene(repository, scene_id)
 
+    def test_get_recent_scenes_sync_join_strategy(self, repository, campaign_uuid, sample_scene_info):
+        """Test that joined eager loading returns each scene once with its entities."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        selected = repository.get_recent_scenes_sync(campaign_uuid, limit=5)
+        joined = repository.get_recent_scenes_sync(campaign_uuid, limit=5, eager_strategy="join")
+
+        assert [s.scene_id for s in joined] == [s.scene_id for s in selected]
+        assert len(joined) == 1
+        assert {p.character_id for p in joined[0].participants} == {"npc_bartender", "pc_hero"}
+
+        with pytest.raises(ValueError, match="eager_strategy"):
+            repository.get_recent_scenes_sync(campaign_uuid, eager_strategy="subquery")
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    async def test_get_recent_scene_summaries(self, repository, campaign_uuid, sample_scene_info):
+        """Test that summaries return only the requested columns."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        summaries = repository.get_recent_scene_summaries_sync(campaign_uuid)
+        assert summaries == [{
+            "scene_id": sample_scene_info.scene_id,
+            "title": "Test Tavern Scene",
+            "scene_type": "social",
+            "scene_timestamp": summaries[0]["scene_timestamp"],
+        }]
+
+        picked = await repository.get_recent_scene_summaries(
+            campaign_uuid, fields=(Scene.scene_id, Scene.in_combat)
+        )
+        assert picked == [{"scene_id": sample_scene_info.scene_id, "in_combat": False}]
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
     def test_scene_with_empty_scene_id_flow(self, repository, campaign_uuid):
         """Test the flow where scene_id starts empty and gets assigned.
 
@@ -229,6 +340,255 @@ class TestSceneRepositorySync:
         # Cleanup
         self._cleanup_scene(repository, generated_id)
 
+    def test_add_participants_bulk_sync(self, repository, campaign_uuid, sample_scene_info):
+        """Test adding new participants and refreshing an existing one in one call."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        result = repository.add_participants_bulk_sync(
+            sample_scene_info.scene_id,
+            [
+                ("npc_guard", "Gate Guard", "dm_controlled_npc", False),
+                ("npc_thief", "Sly Thief", "dm_controlled_npc", False),
+                ("npc_bartender", "Marcus the Barkeep", "dm_controlled_npc", False),
+            ],
+        )
+        assert result is True
+
+        retrieved = repository.get_scene_sync(sample_scene_info.scene_id)
+        by_id = {p.character_id: p for p in retrieved.participants}
+        assert set(by_id) == {"npc_bartender", "pc_hero", "npc_guard", "npc_thief"}
+        assert by_id["npc_guard"].display_name == "Gate Guard"
+        assert by_id["npc_bartender"].display_name == "Marcus the Barkeep"
+        # Existing participant keeps its original-membership flag
+        assert "npc_bartender" not in retrieved.npcs_added
+        assert set(retrieved.npcs_added) == {"npc_guard", "npc_thief"}
+        assert retrieved.last_updated is not None
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    def test_add_participants_bulk_sync_not_found(self, repository):
+        """Test that adding participants to a missing scene returns False."""
+        result = repository.add_participants_bulk_sync(
+            "nonexistent_scene_12345",
+            [("npc_guard", "Gate Guard", "dm_controlled_npc", False)],
+        )
+        assert result is False
+
+    async def test_add_participants_bulk_async(self, repository, campaign_uuid, sample_scene_info):
+        """Test the async bulk participant upsert."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        result = await repository.add_participants_bulk(
+            sample_scene_info.scene_id,
+            [("npc_guard", "Gate Guard", "dm_controlled_npc", False)],
+        )
+        assert result is True
+
+        retrieved = repository.get_scene_sync(sample_scene_info.scene_id)
+        assert "npc_guard" in retrieved.npcs_added
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    async def test_add_entity_to_scene_inserts_and_restores(self, repository, campaign_uuid, sample_scene_info):
+        """Test adding a new entity and restoring one that left the scene."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        assert await repository.add_entity_to_scene(
+            sample_scene_info.scene_id, "sword_01", "item", metadata={"name": "Old Sword"}
+        ) is True
+        assert await repository.remove_entity_from_scene(sample_scene_info.scene_id, "sword_01") is True
+        assert await repository.add_entity_to_scene(
+            sample_scene_info.scene_id, "sword_01", "item", metadata={"name": "Ignored"}
+        ) is True
+
+        items = repository.get_entities_in_scene_sync(sample_scene_info.scene_id, entity_type="item")
+        assert len(items) == 1
+        assert items[0].is_present is True
+        assert items[0].left_at is None
+        assert items[0].entity_metadata == {"name": "Old Sword"}
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    async def test_add_entity_to_scene_not_found(self, repository):
+        """Test that adding an entity to a missing scene returns False."""
+        assert await repository.add_entity_to_scene("nonexistent_scene_12345", "sword_01", "item") is False
+
+    async def test_iter_entities_in_scene(self, repository, campaign_uuid, sample_scene_info):
+        """Test that streamed entities match the listed ones, sync and async."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+        await repository.remove_entity_from_scene(sample_scene_info.scene_id, "npc_bartender")
+
+        present = [e.entity_id async for e in repository.iter_entities_in_scene(sample_scene_info.scene_id)]
+        assert present == ["pc_hero"]
+
+        all_ids = {
+            e.entity_id
+            for e in repository.iter_entities_in_scene_sync(sample_scene_info.scene_id, present_only=False)
+        }
+        listed = repository.get_entities_in_scene_sync(sample_scene_info.scene_id, present_only=False)
+        assert all_ids == {e.entity_id for e in listed} == {"npc_bartender", "pc_hero"}
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    async def test_batch_commits_writes_together(self, repository, campaign_uuid, sample_scene_info):
+        """Test that batched writes share one transaction and roll back together."""
+        async with repository.batch() as session:
+            await repository.create_scene(sample_scene_info, campaign_uuid, session=session)
+            assert await repository.add_participants_bulk(
+                sample_scene_info.scene_id,
+                [("npc_guard", "Gate Guard", "npc_support", False)],
+                session=session,
+            ) is True
+            assert await repository.update_scene(
+                sample_scene_info.scene_id, {"outcomes": ["Bribed the guard"]}, session=session
+            ) is True
+            # Nothing is visible outside the batch until it commits
+            assert repository.get_scene_sync(sample_scene_info.scene_id) is None
+
+        scene = repository.get_scene_sync(sample_scene_info.scene_id)
+        assert scene.outcomes == ["Bribed the guard"]
+        assert "npc_guard" in {p.character_id for p in scene.participants}
+
+        with pytest.raises(RuntimeError):
+            async with repository.batch() as session:
+                await repository.update_scene(
+                    sample_scene_info.scene_id, {"outcomes": ["Rolled back"]}, session=session
+                )
+                raise RuntimeError("abort batch")
+        assert repository.get_scene_sync(sample_scene_info.scene_id).outcomes == ["Bribed the guard"]
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    async def test_soft_delete_scene(self, repository, campaign_uuid, sample_scene_info):
+        """Test that soft delete hides the scene and only succeeds once."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        assert await repository.soft_delete_scene(sample_scene_info.scene_id) is True
+        assert repository.get_scene_sync(sample_scene_info.scene_id) is None
+        assert await repository.soft_delete_scene(sample_scene_info.scene_id) is False
+        assert await repository.soft_delete_scene("nonexistent_scene_12345") is False
+
+    def test_merge_scene_metadata_sync(self, repository, campaign_uuid, sample_scene_info):
+        """Test that metadata deltas merge with existing keys on the database side."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        assert repository.merge_scene_metadata_sync(
+            sample_scene_info.scene_id,
+            {"weather": "stormy"},
+            {"npc_bartender": "Marcus"},
+        ) is True
+        assert repository.merge_scene_metadata_sync(
+            sample_scene_info.scene_id,
+            {},
+            {"npc_guard": "Gate Guard"},
+        ) is True
+
+        retrieved = repository.get_scene_sync(sample_scene_info.scene_id)
+        assert retrieved.metadata["location"]["id"] == "tavern_001"
+        assert retrieved.metadata["weather"] == "stormy"
+        assert retrieved.metadata["npc_display_names"] == {
+            "npc_bartender": "Marcus",
+            "npc_guard": "Gate Guard",
+        }
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    def test_merge_scene_metadata_sync_not_found(self, repository):
+        """Test that merging metadata into a missing scene returns False."""
+        assert repository.merge_scene_metadata_sync("nonexistent_scene_12345", {"a": 1}) is False
+
+    def test_apply_scene_update_sync(self, repository, campaign_uuid, sample_scene_info):
+        """Test that columns, metadata and participants are updated together."""
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+
+        result = repository.apply_scene_update_sync(
+            sample_scene_info.scene_id,
+            {"outcomes": ["Deal struck"], "duration_turns": 4},
+            participants=[
+                ("npc_guard", "Gate Guard", "dm_controlled_npc", False),
+                ("npc_bartender", "Marcus", "dm_controlled_npc", False),
+            ],
+            metadata_delta={"weather": "rainy"},
+            display_names={"npc_guard": "Gate Guard"},
+        )
+        assert result is True
+
+        retrieved = repository.get_scene_sync(sample_scene_info.scene_id)
+        assert retrieved.outcomes == ["Deal struck"]
+        assert retrieved.duration_turns == 4
+        assert retrieved.metadata["location"]["id"] == "tavern_001"
+        assert retrieved.metadata["weather"] == "rainy"
+        assert retrieved.metadata["npc_display_names"] == {"npc_guard": "Gate Guard"}
+        by_id = {p.character_id: p for p in retrieved.participants}
+        assert by_id["npc_guard"].display_name == "Gate Guard"
+        assert by_id["npc_bartender"].display_name == "Marcus"
+        assert set(retrieved.npcs_added) == {"npc_guard"}
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    def test_apply_scene_update_sync_not_found(self, repository):
+        """Test that a missing scene returns False and writes no participants."""
+        assert repository.apply_scene_update_sync(
+            "nonexistent_scene_12345",
+            {"outcomes": ["test"]},
+            participants=[("npc_guard", "Gate Guard", "dm_controlled_npc", False)],
+        ) is False
+        assert repository.get_entities_in_scene_sync("nonexistent_scene_12345") == []
+
+    def test_apply_scene_update_sync_immutable_field_raises(self, repository):
+        """Test that immutable fields are rejected before touching the database."""
+        with pytest.raises(ValueError, match="Cannot update immutable fields"):
+            repository.apply_scene_update_sync("any_scene", {"title": "New Title"})
+
+    def test_get_scene_sync_reads_through_cache(self, campaign_uuid, sample_scene_info):
+        """Test that cached scenes are served from the cache and evicted on update."""
+        cache = _DictCache()
+        repository = SceneRepository(sync_cache=cache)
+        repository.create_scene_sync(sample_scene_info, campaign_uuid)
+        key = f"scene:{sample_scene_info.scene_id}"
+
+        first = repository.get_scene_sync(sample_scene_info.scene_id)
+        assert key in cache.data
+
+        # Served from the cache while the database row is unchanged
+        second = repository.get_scene_sync(sample_scene_info.scene_id)
+        assert second.title == first.title
+        assert {p.character_id for p in second.participants} == {"npc_bartender", "pc_hero"}
+
+        repository.update_scene_sync(sample_scene_info.scene_id, {"outcomes": ["Found the map"]})
+        assert key not in cache.data
+        assert repository.get_scene_sync(sample_scene_info.scene_id).outcomes == ["Found the map"]
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
+    async def test_get_scene_async_reads_through_cache(self, campaign_uuid, sample_scene_info):
+        """Test that async reads populate the cache and async writes evict it."""
+        cache = _AsyncDictCache()
+        repository = SceneRepository(cache=cache)
+        await repository.create_scene(sample_scene_info, campaign_uuid)
+        key = f"scene:{sample_scene_info.scene_id}"
+
+        await repository.get_scene(sample_scene_info.scene_id)
+        assert key in cache.data
+
+        await repository.add_entity_to_scene(sample_scene_info.scene_id, "item_map", "item")
+        assert key not in cache.data
+
+        cache.data[key] = b"not json"
+        scene = await repository.get_scene(sample_scene_info.scene_id)
+        assert scene.scene_id == sample_scene_info.scene_id
+
+        # Cleanup
+        self._cleanup_scene(repository, sample_scene_info.scene_id)
+
     def _cleanup_scene(self, repository, scene_id: str):
         """Helper to cleanup test scenes using soft delete."""
         try:
@@ -10,6 +10,7 @@ import tempfile
 import shutil
 import uuid
 from pathlib import Path
+from unittest.mock import patch
 
 from gaia.mechanics.campaign.simple_campaign_manager import SimpleCampaignManager
 from gaia.utils.singleton import SingletonMeta
@@ -142,6 +143,81 @@ class TestCampaignPersistence:
         assert len(loaded_history) >= 2
         assert any(msg.get("content") == "Hello" for msg in loaded_history)
 
+    def test_save_campaign_persists_edit_to_last_message(self, campaign_manager, temp_dir):
+        """Test that re-saving with the last message edited rewrites it on disk."""
+        campaign_id = "test_history_edit"
+        campaign_manager.save_campaign_data(campaign_id, CampaignData(campaign_id=campaign_id, title="Edit Test"))
+
+        messages = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Welcome"}
+        ]
+        assert campaign_manager.save_campaign(campaign_id, messages) is True
+
+        messages[-1]["content"] = "Welcome to the adventure!"
+        assert campaign_manager.save_campaign(campaign_id, messages) is True
+
+        # A fresh manager reads the history back from disk
+        SingletonMeta.clear_instance(SimpleCampaignManager)
+        reloaded = SimpleCampaignManager(base_path=temp_dir)
+        history = reloaded.load_campaign_history(campaign_id)
+        assert [msg["content"] for msg in history] == ["Hello", "Welcome to the adventure!"]
+
+    def test_saves_skip_mirror_without_remote_store(self, campaign_manager):
+        """Test that no background mirror is queued when GCS mirroring is disabled."""
+        campaign_id = "test_local_only"
+        campaign_manager.save_campaign_data(campaign_id, CampaignData(campaign_id=campaign_id, title="Local"))
+
+        assert campaign_manager._store.mirror_enabled is False
+        with patch.object(campaign_manager, "_mirror_json") as mirror:
+            assert campaign_manager.save_campaign(campaign_id, [{"role": "user", "content": "Hi"}]) is True
+            assert campaign_manager.save_campaign_data(
+                campaign_id, CampaignData(campaign_id=campaign_id, title="Local")
+            ) is True
+            assert campaign_manager.save_turn(campaign_id, {"turn_id": "turn_001", "turn_number": 1}) is True
+        mirror.assert_not_called()
+        assert campaign_manager._pending_mirrors == {}
+
+    def test_mirror_payloads_are_snapshots(self, campaign_manager):
+        """Test that later edits by the caller do not leak into queued mirror uploads."""
+        campaign_id = "test_mirror_snapshot"
+        campaign_data = CampaignData(campaign_id=campaign_id, title="Mirror", custom_data={"stage": "start"})
+        messages = [{"role": "assistant", "content": "Hi", "structured_data": {"hp": 10}}]
+
+        with patch.object(campaign_manager, "_mirror_enabled", return_value=True), \
+                patch.object(campaign_manager, "_mirror_json") as mirror:
+            campaign_manager.save_campaign_data(campaign_id, campaign_data)
+            campaign_manager.save_campaign(campaign_id, messages)
+
+        campaign_data.custom_data["stage"] = "later"
+        messages[0]["structured_data"]["hp"] = 3
+
+        mirrored = {call.args[2]: call.args[0] for call in mirror.call_args_list}
+        assert mirrored["data/campaign_data.json"]["custom_data"]["stage"] == "start"
+        assert mirrored["logs/chat_history.json"][0]["structured_data"] == {"hp": 10}
+
+    def test_first_turn_after_restart_persists_max_turn(self, campaign_manager):
+        """Test that a cold-cache save_turn records max_turn in the metadata."""
+        campaign_id = "test_max_turn"
+        campaign_manager.save_campaign_data(campaign_id, CampaignData(campaign_id=campaign_id, title="Turns"))
+        assert "max_turn" not in campaign_manager.storage.load_metadata(campaign_id)
+
+        assert campaign_manager.save_turn(campaign_id, {"turn_id": "turn_001", "turn_number": 1}) is True
+
+        assert campaign_manager.storage.load_metadata(campaign_id)["max_turn"] == 1
+        assert campaign_manager.get_current_turn(campaign_id)["turn_id"] == "turn_001"
+
+    def test_manager_start_sweeps_leftover_trash(self, campaign_manager, temp_dir):
+        """Test that deleted campaign directories left behind by a crash are removed."""
+        leftover = campaign_manager.base_path / ".trash-campaign_9-1"
+        (leftover / "logs").mkdir(parents=True)
+
+        SingletonMeta.clear_instance(SimpleCampaignManager)
+        restarted = SimpleCampaignManager(base_path=temp_dir)
+        restarted._mirror_pool.shutdown(wait=True)
+
+        assert not leftover.exists()
+
     def test_campaign_directory_structure(self, campaign_manager, temp_dir):
         """Test that campaign creates proper directory structure."""
         campaign_id = "test_structure"
@@ -5,7 +5,7 @@ import tempfile
 import os
 import json
 from typing import Any, Dict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, MagicMock
 
 # Add backend/src to path
@@ -103,6 +103,88 @@ class TestEnhancedSceneManager(unittest.TestCase):
         self.assertEqual(recent[0].scene_id, "scene_002")
         self.assertEqual(recent[1].scene_id, "scene_001")
     
+    def test_get_recent_scenes_ignores_recently_touched_old_scene(self):
+        """Test that updating an old scene does not push newer scenes out of the result."""
+        now = datetime.now()
+        for i in range(5):
+            timestamp = now - timedelta(days=5 - i)
+            scene = SceneInfo(
+                scene_id=f"scene_{i:03d}",
+                title=f"Scene {i}",
+                description=f"Description {i}",
+                scene_type="exploration",
+                timestamp=timestamp
+            )
+            self.manager.create_scene(scene)
+            filepath = os.path.join(self.manager.scenes_dir, f"scene_{i:03d}.json")
+            os.utime(filepath, (timestamp.timestamp(), timestamp.timestamp()))
+
+        # Touch the oldest scene so it has the newest mtime
+        self.manager.update_scene_outcomes("scene_000", ["Revisited"])
+
+        recent = self.manager.get_recent_scenes(2)
+        self.assertEqual([s.scene_id for s in recent], ["scene_004", "scene_003"])
+
+    def test_get_recent_scenes_skips_unreadable_files(self):
+        """Test that batched recent-scene loading skips corrupt files."""
+        now = datetime.now()
+        for i in range(6):
+            self.manager.create_scene(SceneInfo(
+                scene_id=f"scene_{i:03d}",
+                title=f"Scene {i}",
+                description=f"Description {i}",
+                scene_type="exploration",
+                timestamp=now - timedelta(minutes=6 - i)
+            ))
+        with open(os.path.join(self.manager.scenes_dir, "broken.json"), 'w') as f:
+            f.write("{not json")
+
+        recent = self.manager.get_recent_scenes(4)
+        self.assertEqual(
+            [s.scene_id for s in recent],
+            ["scene_005", "scene_004", "scene_003", "scene_002"]
+        )
+
+    def test_recent_scenes_served_from_ring_until_storage_changes(self):
+        """Test that repeated recent-scene lookups skip the directory scan."""
+        now = datetime.now()
+        for i in range(3):
+            self.manager.create_scene(SceneInfo(
+                scene_id=f"scene_{i:03d}",
+                title=f"Scene {i}",
+                description=f"Description {i}",
+                scene_type="exploration",
+                timestamp=now - timedelta(minutes=3 - i)
+            ))
+        self.assertEqual(len(self.manager.get_recent_scenes(5)), 3)
+
+        with patch.object(self.manager, '_get_recent_scenes_filesystem', wraps=self.manager._get_recent_scenes_filesystem) as scan:
+            # Scenes created and updated through this manager keep the ring current
+            self.manager.create_scene(SceneInfo(
+                scene_id="scene_003",
+                title="Scene 3",
+                description="Description 3",
+                scene_type="exploration",
+                timestamp=now
+            ))
+            self.manager.update_scene_outcomes("scene_001", ["Updated"])
+            recent = self.manager.get_recent_scenes(2)
+            self.assertEqual([s.scene_id for s in recent], ["scene_003", "scene_002"])
+            scan.assert_not_called()
+
+            # A scene written by someone else invalidates the ring
+            other = EnhancedSceneManager(self.campaign_id)
+            other.create_scene(SceneInfo(
+                scene_id="scene_004",
+                title="Scene 4",
+                description="Description 4",
+                scene_type="exploration",
+                timestamp=now + timedelta(minutes=1)
+            ))
+            recent = self.manager.get_recent_scenes(2)
+            self.assertEqual([s.scene_id for s in recent], ["scene_004", "scene_003"])
+            scan.assert_called_once()
+
     def test_update_scene_outcomes(self):
         """Test updating scene outcomes."""
         # Create and store a scene
@@ -126,6 +208,323 @@ class TestEnhancedSceneManager(unittest.TestCase):
         self.assertEqual(len(updated.outcomes), 2)
         self.assertIn("Player defeated the goblin", updated.outcomes)
 
+    def test_scene_cache_is_bounded(self):
+        """Test that the scene cache evicts least recently used scenes past its cap."""
+        with patch('gaia.infra.storage.enhanced_scene_manager._SCENE_CACHE_MAX', 2):
+            for i in range(3):
+                self.manager.create_scene(SceneInfo(
+                    scene_id=f"cached_{i}",
+                    title=f"Scene {i}",
+                    description=f"Description {i}",
+                    scene_type="exploration",
+                    timestamp=datetime.now()
+                ))
+
+            self.assertEqual(list(self.manager._scene_cache), ["cached_1", "cached_2"])
+
+            # Evicted scenes are reloaded from storage
+            reloaded = self.manager.get_scene("cached_0")
+            self.assertIsNotNone(reloaded)
+            self.assertEqual(reloaded.title, "Scene 0")
+            self.assertEqual(list(self.manager._scene_cache), ["cached_2", "cached_0"])
+
+    def test_scene_context_for_agents(self):
+        """Test agent context formatting, including skipped empty fields."""
+        self.assertEqual(self.manager.get_scene_context_for_agents(), "No previous scenes available.")
+
+        self.manager.create_scene(SceneInfo(
+            scene_id="context_scene",
+            title="Old Mill",
+            description="A creaking mill",
+            scene_type="exploration",
+            objectives=["Find the miller", "Fix the wheel"],
+            metadata={"location": {"id": "mill_01"}},
+            timestamp=datetime.now()
+        ))
+
+        self.assertEqual(
+            self.manager.get_scene_context_for_agents(),
+            "**Recent Scene Context:**\n\n"
+            "\n--- Scene 1 (exploration) ---\n"
+            "Title: Old Mill\n"
+            "Location: mill_01\n"
+            "Description: A creaking mill\n"
+            "Objectives: Find the miller, Fix the wheel"
+        )
+
+    def test_cached_scene_reloaded_after_external_file_change(self):
+        """Test that a cached scene is reparsed when its file changes on disk."""
+        self.manager.create_scene(SceneInfo(
+            scene_id="edited_scene",
+            title="Original Title",
+            description="Before edit",
+            scene_type="exploration",
+            timestamp=datetime.now()
+        ))
+        self.assertEqual(self.manager.get_scene("edited_scene").title, "Original Title")
+
+        filepath = os.path.join(self.manager.scenes_dir, "edited_scene.json")
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        data["title"] = "Edited Title"
+        with open(filepath, 'w') as f:
+            json.dump(data, f)
+
+        self.assertEqual(self.manager.get_scene("edited_scene").title, "Edited Title")
+
+        os.remove(filepath)
+        self.assertIsNone(self.manager.get_scene("edited_scene"))
+
+    def test_generated_scene_ids_are_numbered_and_unique(self):
+        """Test that generated scene IDs follow the stored scene count without collisions."""
+        created_ids = []
+        for i in range(3):
+            created_ids.append(self.manager.create_scene(SceneInfo(
+                scene_id="",
+                title=f"Scene {i}",
+                description=f"Description {i}",
+                scene_type="exploration",
+                timestamp=datetime.now()
+            )))
+
+        self.assertEqual(len(set(created_ids)), 3)
+        self.assertEqual(
+            [scene_id.split("_")[1] for scene_id in created_ids],
+            ["001", "002", "003"]
+        )
+
+        # A new manager picks up the count from disk
+        reopened = EnhancedSceneManager(self.campaign_id)
+        self.assertTrue(reopened._generate_scene_id().startswith("scene_004_"))
+
+    def test_large_scene_file_loaded_via_mmap(self):
+        """Test that scene files above the mmap threshold load identically."""
+        self.manager.create_scene(SceneInfo(
+            scene_id="large_scene",
+            title="Large Scene",
+            description="x" * 2048,
+            scene_type="exploration",
+            timestamp=datetime.now()
+        ))
+
+        with patch('gaia.infra.storage.enhanced_scene_manager._SCENE_MMAP_THRESHOLD', 1024):
+            reopened = EnhancedSceneManager(self.campaign_id)
+            loaded = reopened.get_scene("large_scene")
+
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.description, "x" * 2048)
+
+    def test_scene_summary_reused_until_scene_changes(self):
+        """Test that scene summaries are cached and refreshed after an update."""
+        self.manager.create_scene(SceneInfo(
+            scene_id="summary_scene",
+            title="Summary Scene",
+            description="A quiet market",
+            scene_type="social",
+            npcs_involved=["npc:old_tom"],
+            timestamp=datetime.now()
+        ))
+
+        first = self.manager.get_scene_summary("summary_scene")
+        second = self.manager.get_scene_summary("summary_scene")
+        self.assertEqual(first, second)
+        self.assertIs(first["participants"], second["participants"])
+        self.assertEqual(first["npcs_present_display"], ["Old Tom"])
+
+        self.manager.update_scene_outcomes("summary_scene", ["Bought a map"])
+        refreshed = self.manager.get_scene_summary("summary_scene")
+        self.assertEqual(refreshed["outcomes"], ["Bought a map"])
+        self.assertIsNot(refreshed["participants"], first["participants"])
+
+    def test_scene_summary_merges_npc_presence(self):
+        """Test that presence merges involved and added NPCs minus removed ones, in order."""
+        self.manager.create_scene(SceneInfo(
+            scene_id="presence_scene",
+            title="Presence Scene",
+            description="A busy square",
+            scene_type="social",
+            npcs_involved=["npc:guard", "npc:merchant", ""],
+            npcs_added=["npc:thief", "npc:guard"],
+            npcs_removed=["npc:merchant"],
+            metadata={"npc_display_names": {"npc:guard": "Captain Vex"}},
+            timestamp=datetime.now()
+        ))
+
+        summary = self.manager.get_scene_summary("presence_scene")
+        self.assertEqual(summary["npcs_present"], ["npc:guard", "npc:thief"])
+        self.assertEqual(summary["npcs_present_display"], ["Captain Vex", "Thief"])
+
+    def test_database_manager_prewarms_recent_scenes(self):
+        """Test that a database-backed manager loads recent scenes into its cache."""
+        campaign_data = Mock()
+        campaign_data.custom_data = {"campaign_uuid": "7b7f3f0c-3f4c-4b8e-9d55-0d3c6c1a2b3c"}
+        campaign_data.get_scene_storage_mode.return_value = "database"
+        recent = [
+            SceneInfo(scene_id="db_scene_2", title="Newest", description="", scene_type="social"),
+            SceneInfo(scene_id="db_scene_1", title="Older", description="", scene_type="social"),
+        ]
+
+        with patch.object(SimpleCampaignManager, 'load_campaign', return_value=campaign_data), \
+                patch('gaia.infra.storage.enhanced_scene_manager.SceneRepository') as repo_cls:
+            repo_cls.return_value.get_recent_scenes_sync.return_value = recent
+            manager = EnhancedSceneManager(self.campaign_id)
+
+            self.assertEqual(list(manager._scene_cache), ["db_scene_1", "db_scene_2"])
+            self.assertIs(manager.get_scene("db_scene_2"), recent[0])
+            repo_cls.return_value.get_scene_sync.assert_not_called()
+
+            # Prewarm can be disabled per instance
+            repo_cls.return_value.get_recent_scenes_sync.reset_mock()
+            cold = EnhancedSceneManager(self.campaign_id, prewarm=False)
+            self.assertEqual(len(cold._scene_cache), 0)
+            repo_cls.return_value.get_recent_scenes_sync.assert_not_called()
+
+    def test_database_ring_survives_create_with_naive_timestamp(self):
+        """Test that a naive new scene is ordered against timezone-aware database scenes."""
+        campaign_data = Mock()
+        campaign_data.custom_data = {"campaign_uuid": "7b7f3f0c-3f4c-4b8e-9d55-0d3c6c1a2b3c"}
+        campaign_data.get_scene_storage_mode.return_value = "database"
+        earlier = datetime.now(timezone.utc) - timedelta(hours=1)
+        recent = [
+            SceneInfo(scene_id="db_scene_2", title="Newest", description="", scene_type="social",
+                      timestamp=earlier),
+            SceneInfo(scene_id="db_scene_1", title="Older", description="", scene_type="social",
+                      timestamp=earlier - timedelta(minutes=5)),
+        ]
+
+        with patch.object(SimpleCampaignManager, 'load_campaign', return_value=campaign_data), \
+                patch('gaia.infra.storage.enhanced_scene_manager.SceneRepository') as repo_cls:
+            repo_cls.return_value.get_recent_scenes_sync.return_value = recent
+            repo_cls.return_value.create_scene_sync.side_effect = lambda scene, _uuid: scene.scene_id
+            manager = EnhancedSceneManager(self.campaign_id)
+            repo_cls.return_value.get_recent_scenes_sync.reset_mock()
+
+            manager.create_scene(SceneInfo(
+                scene_id="db_scene_3",
+                title="Fresh",
+                description="",
+                scene_type="social",
+                timestamp=datetime.now()
+            ))
+            self.assertEqual(
+                [s.scene_id for s in manager.get_recent_scenes(2)],
+                ["db_scene_3", "db_scene_2"]
+            )
+            repo_cls.return_value.get_recent_scenes_sync.assert_not_called()
+
+    def test_log_storage_mode_round_trip(self):
+        """Test that filesystem_log campaigns store scenes in the append-only log."""
+        campaign_data = Mock()
+        campaign_data.custom_data = {}
+        campaign_data.get_scene_storage_mode.return_value = "filesystem_log"
+
+        with patch.object(SimpleCampaignManager, 'load_campaign', return_value=campaign_data):
+            manager = EnhancedSceneManager(self.campaign_id)
+            now = datetime.now()
+            for i in range(3):
+                manager.create_scene(SceneInfo(
+                    scene_id=f"log_scene_{i}",
+                    title=f"Log Scene {i}",
+                    description=f"Description {i}",
+                    scene_type="exploration",
+                    timestamp=now - timedelta(minutes=3 - i)
+                ))
+            manager.update_scene_outcomes("log_scene_0", ["Logged"])
+            with self.assertRaises(ValueError):
+                manager.create_scene(SceneInfo(
+                    scene_id="log_scene_1",
+                    title="Duplicate",
+                    description="",
+                    scene_type="exploration"
+                ))
+
+            reopened = EnhancedSceneManager(self.campaign_id)
+            self.assertEqual(reopened.get_scene("log_scene_0").outcomes, ["Logged"])
+            self.assertEqual(
+                [s.scene_id for s in reopened.get_recent_scenes(2)],
+                ["log_scene_2", "log_scene_1"]
+            )
+            self.assertTrue(reopened._generate_scene_id().startswith("scene_004_"))
+            self.assertNotIn("log_scene_0.json", os.listdir(manager.scenes_dir))
+
+    def test_scene_file_written_atomically(self):
+        """Test that scene files are complete JSON and no temp files are left behind."""
+        scene = SceneInfo(
+            scene_id="atomic_scene",
+            title="Atomic Scene",
+            description="Écrit de façon atomique",
+            scene_type="social",
+            timestamp=datetime.now()
+        )
+        self.manager.create_scene(scene)
+        self.manager.update_scene_outcomes("atomic_scene", ["The door opened"])
+
+        filepath = os.path.join(self.manager.scenes_dir, "atomic_scene.json")
+        with open(filepath, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        self.assertEqual(stored["description"], "Écrit de façon atomique")
+        self.assertEqual(stored["outcomes"], ["The door opened"])
+        self.assertEqual(stored["_metadata"]["campaign_id"], self.campaign_id)
+        self.assertEqual(
+            [name for name in os.listdir(self.manager.scenes_dir) if name.endswith('.tmp')],
+            []
+        )
+
+    def test_create_scene_without_hard_link_support(self):
+        """Test that exclusive creates work on filesystems that refuse os.link."""
+        scene = SceneInfo(
+            scene_id="nolink_scene",
+            title="No Links",
+            description="Stored on a mount without hard links",
+            scene_type="social",
+            timestamp=datetime.now()
+        )
+        with patch('gaia.infra.storage.enhanced_scene_manager.os.link',
+                   side_effect=PermissionError(1, "Operation not permitted")):
+            self.manager.create_scene(scene)
+            with self.assertRaises(ValueError):
+                self.manager.create_scene(SceneInfo(
+                    scene_id="nolink_scene",
+                    title="Duplicate",
+                    description="",
+                    scene_type="social"
+                ))
+
+        filepath = os.path.join(self.manager.scenes_dir, "nolink_scene.json")
+        with open(filepath, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["title"], "No Links")
+        self.assertEqual(
+            [name for name in os.listdir(self.manager.scenes_dir) if name.endswith('.tmp')],
+            []
+        )
+
+    def test_create_existing_scene_raises_without_overwriting(self):
+        """Test that creating an existing scene fails and keeps the stored scene."""
+        original = SceneInfo(
+            scene_id="dup_scene",
+            title="Original",
+            description="First write",
+            scene_type="social",
+            timestamp=datetime.now()
+        )
+        self.manager.create_scene(original)
+
+        duplicate = SceneInfo(
+            scene_id="dup_scene",
+            title="Duplicate",
+            description="Second write",
+            scene_type="social",
+            timestamp=datetime.now()
+        )
+        with self.assertRaises(ValueError):
+            self.manager.create_scene(duplicate)
+
+        self.assertEqual(self.manager.get_scene("dup_scene").title, "Original")
+        self.assertEqual(
+            sorted(os.listdir(self.manager.scenes_dir)),
+            ["dup_scene.json"]
+        )
+
 
 class TestSceneTransitionDetector(unittest.TestCase):
     """Test SceneTransitionDetector functionality."""
@@ -0,0 +1,24 @@
+-- Migration: Add partial index for live-scene reads
+-- Created: 2026-10-17
+-- Description: Serves "most recent live scenes for a campaign" from a single index
+--
+-- Background:
+-- Every scene read filters on is_deleted = false, and get_recent_scenes orders
+-- by scene_timestamp DESC with a LIMIT. idx_scenes_campaign_active only covers
+-- (campaign_id, is_deleted), so Postgres still has to sort the matching rows,
+-- and idx_scenes_campaign_timestamp also indexes soft-deleted scenes.
+--
+-- Performance impact:
+-- - Recent-scene queries walk the index in order and stop after LIMIT rows (no sort)
+-- - Soft-deleted scenes are left out, keeping the index small and cache-resident
+-- - Lookups by scene_id already use the primary key, and a partial copy of it would
+--   only add write overhead, so none is created
+--
+-- CONCURRENTLY avoids locking game.scenes against writes while the index builds.
+-- It cannot run inside a transaction block, so apply this file without psql -1.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scenes_live_by_campaign_ts
+    ON game.scenes (campaign_id, scene_timestamp DESC)
+    WHERE is_deleted = false;
+
+COMMENT ON INDEX game.ix_scenes_live_by_campaign_ts IS 'Recent live scenes per campaign (get_recent_scenes)';
@@ -47,6 +47,18 @@ def _load_secrets_from_file() -> dict:
     return _secrets_cache
 
 
+def _env_int(key: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back on bad values."""
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {key}={value!r}, using {default}")
+        return default
+
+
 def _get_secret(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get a secret from environment or decrypted secrets file."""
     value = os.getenv(key)
@@ -175,6 +187,10 @@ class DatabaseManager:
         else:
             sync_database_url = database_url
         
+        # Both engines live on the process-wide db_manager singleton, so every
+        # repository shares these pools. Sizes are tunable per deployment to keep
+        # (workers x pool_size + max_overflow) under Postgres max_connections.
+
         # Create synchronous engine (for migrations and admin tasks)
         sync_connect_args = {}
         if sync_database_url.startswith('postgresql+psycopg'):
@@ -185,10 +201,11 @@ class DatabaseManager:
             sync_database_url,
             echo=os.getenv('DATABASE_ECHO', 'false').lower() == 'true',
             pool_pre_ping=True,  # Verify connections before using
-            pool_size=5,
-            max_overflow=10,
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_size=_env_int('DB_SYNC_POOL_SIZE', 5),
+            max_overflow=_env_int('DB_SYNC_MAX_OVERFLOW', 10),
+            pool_recycle=_env_int('DB_POOL_RECYCLE', 3600),  # Recycle connections after 1 hour
             pool_timeout=30,  # Timeout waiting for connection
+            query_cache_size=_env_int('DB_QUERY_CACHE_SIZE', 1200),  # Compiled SQL LRU
             connect_args=sync_connect_args
         )
         
@@ -197,17 +214,21 @@ class DatabaseManager:
             async_database_url,
             echo=os.getenv('DATABASE_ECHO', 'false').lower() == 'true',
             pool_pre_ping=True,  # Verify connections before using
-            pool_size=20,
-            max_overflow=20,
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_size=_env_int('DB_POOL_SIZE', 20),
+            max_overflow=_env_int('DB_MAX_OVERFLOW', 20),
+            pool_recycle=_env_int('DB_POOL_RECYCLE', 3600),  # Recycle connections after 1 hour
             pool_timeout=30,  # Timeout waiting for connection
+            query_cache_size=_env_int('DB_QUERY_CACHE_SIZE', 1200),  # Compiled SQL LRU
             connect_args={
                 "server_settings": {
                     "jit": "off",  # Disable JIT for better latency
                     "search_path": "public,auth,game"  # Ensure correct schema search order
                 },
                 "command_timeout": 60,
-                "ssl": "prefer"  # Use SSL when available
+                "ssl": "prefer",  # Use SSL when available
+                # Server-side prepared statements reused per connection
+                "statement_cache_size": _env_int('DB_STATEMENT_CACHE_SIZE', 1024),
+                "prepared_statement_cache_size": _env_int('DB_PREPARED_STATEMENT_CACHE_SIZE', 500),
             } if async_database_url.startswith('postgresql+asyncpg') else {}
         )
         